@@ -5,20 +5,46 @@ This module provides the central service that routes analysis requests
 to appropriate analyzers and aggregates results.
 """
 
+import asyncio
+import copy
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
 from .models import AnalysisResult, DirectoryAnalysis, SearchResult
+from .analyzers.base import BaseAnalyzer
 from .analyzers.python_analyzer import PythonAnalyzer
 from .analyzers.generic_analyzer import GenericAnalyzer
-from .filesystem import FileSystemManager
-from .language_detector import LanguageDetector
+from .filesystem import is_racy_mtime, shared_fs_manager
+from .language_detector import shared_language_detector
 from .directory_analyzer import DirectoryAnalyzer
 from .search_engine import SearchEngine
 
 logger = logging.getLogger(__name__)
 
+# Per-process service used by process pool workers
+_worker_service: Optional['FileAnalyzerService'] = None
+
+
+def _init_worker():
+    """Create the analyzer service once per worker process."""
+    global _worker_service
+    _worker_service = FileAnalyzerService()
+    # The parent process owns the result cache
+    _worker_service.result_cache_size = 0
+
+
+def _analyze_file_in_worker(file_path: str, analysis_type: str) -> AnalysisResult:
+    """Analyze one file inside a worker process."""
+    return _worker_service.analyze_file(file_path, analysis_type)
+
 
 class FileAnalyzerService:
     """
@@ -30,20 +56,41 @@ class FileAnalyzerService:
     
     def __init__(self):
         """Initialize the analyzer service."""
-        self.fs_manager = FileSystemManager()
-        self.language_detector = LanguageDetector()
+        self.fs_manager = shared_fs_manager()
+        self.language_detector = shared_language_detector()
         self.python_analyzer = PythonAnalyzer()
         self.generic_analyzer = GenericAnalyzer()
         self.directory_analyzer = DirectoryAnalyzer()
         self.search_engine = SearchEngine()
+        
+        # Thread and process pools are created on first use, so worker
+        # processes and services that never go async do not start them
+        self.max_concurrent_analyses = 32
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        
+        # Process pools only pay off once their startup cost is amortized
+        self.process_pool_min_files = 64
+        self.process_chunk_size = 16
+        
+        # LRU cache of analysis results keyed on (path, mtime_ns, size, type)
+        self.result_cache_size = 4096
+        self._result_cache: "OrderedDict[Tuple[str, int, int, str], AnalysisResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
     
-    def analyze_file(self, file_path: str, analysis_type: str = 'full') -> AnalysisResult:
+    def analyze_file(self, file_path: str, analysis_type: str = 'full',
+                     force: bool = False) -> AnalysisResult:
         """
         Analyze a single file.
         
+        Results are cached until the file's modification time or size
+        changes.
+        
         Args:
             file_path: Path to the file to analyze
             analysis_type: Type of analysis ('basic', 'full', 'metrics')
+            force: Re-analyze even if a cached result is available
             
         Returns:
             Complete analysis result
@@ -51,15 +98,29 @@ class FileAnalyzerService:
         try:
             # Validate path
             path_obj = self.fs_manager.validate_path(file_path)
+            path_str = str(path_obj)
+            
+            stat_info = os.stat(path_str)
+            cache_key = (path_str, stat_info.st_mtime_ns, stat_info.st_size, analysis_type)
+            if not force:
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    return cached
             
             # Get appropriate analyzer
             analyzer = self.get_analyzer(path_obj)
             
             if analyzer:
-                return analyzer.analyze_file(file_path)
+                result = analyzer.analyze_file(path_str)
             else:
                 # Fallback to basic analysis
-                return self._basic_file_analysis(path_obj)
+                result = self._basic_file_analysis(path_obj)
+            
+            # Failed analyses may be transient, so only cache clean results
+            if not result.errors:
+                self._store_cached_result(cache_key, result)
+            
+            return result
                 
         except Exception as e:
             logger.error(f"Error analyzing file {file_path}: {e}")
@@ -75,6 +136,190 @@ class FileAnalyzerService:
                 errors=[str(e)]
             )
     
+    def clear_cache(self):
+        """Drop all cached analysis results."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        self.python_analyzer.clear_cache()
+        self.generic_analyzer.clear_cache()
+        self.language_detector.clear_cache()
+        self.fs_manager.clear_cache()
+        self.search_engine.clear_cache()
+    
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        """Return the shared thread pool, creating it on first use."""
+        with self._pool_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="file-analyzer"
+                )
+            return self._executor
+    
+    def _worker_pool(self) -> ProcessPoolExecutor:
+        """Return the shared process pool, creating it on first use."""
+        with self._pool_lock:
+            if self._process_pool is None:
+                # Spawned workers start clean instead of inheriting locks
+                # held by this process's threads at fork time
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+            return self._process_pool
+    
+    def shutdown(self):
+        """Shut down the thread and process pools, if they were started."""
+        with self._pool_lock:
+            executor, self._executor = self._executor, None
+            process_pool, self._process_pool = self._process_pool, None
+        
+        if executor is not None:
+            executor.shutdown()
+        if process_pool is not None:
+            process_pool.shutdown()
+    
+    def _get_cached_result(self, key: Tuple[str, int, int, str]) -> Optional[AnalysisResult]:
+        """Return a copy of a cached result, or None on a cache miss."""
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+        
+        # Hand out copies so callers cannot mutate the cached entry
+        return copy.deepcopy(result)
+    
+    def _store_cached_result(self, key: Tuple[str, int, int, str], result: AnalysisResult):
+        """Cache a result, evicting the least recently used entry if full."""
+        # The key's mtime cannot tell apart two writes within the racy window
+        if is_racy_mtime(key[1]):
+            return
+        
+        with self._result_cache_lock:
+            self._result_cache[key] = copy.deepcopy(result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+    
+    async def analyze_file_async(self, file_path: str, analysis_type: str = 'full') -> AnalysisResult:
+        """
+        Analyze a single file without blocking the event loop.
+        
+        Args:
+            file_path: Path to the file to analyze
+            analysis_type: Type of analysis ('basic', 'full', 'metrics')
+            
+        Returns:
+            Analysis result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._thread_pool(), self.analyze_file, file_path, analysis_type
+        )
+    
+    async def analyze_files_async(self, file_paths: List[str],
+                                  analysis_type: str = 'full') -> List[AnalysisResult]:
+        """
+        Analyze several files concurrently.
+        
+        Each file is analyzed on the shared thread pool so that file reads
+        overlap; at most max_concurrent_analyses files are in flight.
+        
+        Args:
+            file_paths: Paths to the files to analyze
+            analysis_type: Type of analysis ('basic', 'full', 'metrics')
+            
+        Returns:
+            Analysis results in the same order as file_paths
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrent_analyses)
+        
+        async def analyze(file_path: str) -> AnalysisResult:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    self._thread_pool(), self.analyze_file, file_path, analysis_type
+                )
+        
+        return list(await asyncio.gather(*(analyze(path) for path in file_paths)))
+    
+    def analyze_directory_files(self, directory_path: str, recursive: bool = True,
+                                filters: Optional[List[str]] = None,
+                                analysis_type: str = 'full',
+                                single_process: bool = False) -> List[AnalysisResult]:
+        """
+        Analyze every file in a directory.
+        
+        Args:
+            directory_path: Path to the directory
+            recursive: Whether to include subdirectories
+            filters: Optional file extension filters
+            analysis_type: Type of analysis ('basic', 'full', 'metrics')
+            single_process: Analyze on threads in this process only
+            
+        Returns:
+            Analysis results in traversal order
+        """
+        file_paths = self.directory_analyzer.list_files(directory_path, recursive, filters)
+        return self.analyze_files(file_paths, analysis_type, single_process)
+    
+    def analyze_files(self, file_paths: List[str], analysis_type: str = 'full',
+                      single_process: bool = False) -> List[AnalysisResult]:
+        """
+        Analyze a batch of files.
+        
+        AST parsing and metric extraction are CPU-bound and serialized by the
+        GIL, so large batches are spread across a process pool. Small batches,
+        or single_process=True, use the shared thread pool instead.
+        
+        Args:
+            file_paths: Paths of the files to analyze
+            analysis_type: Type of analysis ('basic', 'full', 'metrics')
+            single_process: Analyze on threads in this process only
+            
+        Returns:
+            Analysis results in the order of file_paths
+        """
+        # Plain strings pickle smaller than Path objects for the workers
+        file_paths = [str(path) for path in file_paths]
+        
+        if single_process or len(file_paths) < self.process_pool_min_files:
+            return list(self._thread_pool().map(
+                partial(self.analyze_file, analysis_type=analysis_type), file_paths
+            ))
+        
+        # Serve cache hits here and only ship the misses to the workers
+        results: List[Optional[AnalysisResult]] = [None] * len(file_paths)
+        pending: List[Tuple[int, Optional[Tuple[str, int, int, str]]]] = []
+        for index, file_path in enumerate(file_paths):
+            try:
+                path_str = str(self.fs_manager.validate_path(file_path))
+                stat_info = os.stat(path_str)
+                cache_key = (path_str, stat_info.st_mtime_ns, stat_info.st_size, analysis_type)
+            except Exception:
+                # Let the worker report the error in its result
+                cache_key = None
+            
+            cached = self._get_cached_result(cache_key) if cache_key else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, cache_key))
+        
+        worker_results = self._worker_pool().map(
+            partial(_analyze_file_in_worker, analysis_type=analysis_type),
+            [file_paths[index] for index, _ in pending],
+            chunksize=self.process_chunk_size
+        )
+        for (index, cache_key), result in zip(pending, worker_results):
+            if cache_key and not result.errors:
+                self._store_cached_result(cache_key, result)
+            results[index] = result
+        
+        return results
+    
     def get_analyzer(self, file_path: Path) -> Optional[Any]:
         """
         Get the appropriate analyzer for a file.
@@ -123,18 +368,22 @@ class FileAnalyzerService:
             if not file_type_info['is_binary']:
                 try:
                     encoding = self.fs_manager.detect_encoding(file_path)
-                    content = self.fs_manager.read_file_content(file_path, encoding)
-                    line_count = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+                    with self.fs_manager.map_file(file_path) as data:
+                        if self.fs_manager.has_ascii_newlines(encoding):
+                            # Count on the raw bytes; no decoding needed
+                            line_count = BaseAnalyzer.count_lines(data)
+                        else:
+                            content = self.fs_manager.decode_content(data, encoding)
+                            line_count = BaseAnalyzer.count_lines(content)
                 except Exception as e:
                     logger.warning(f"Could not read file content for {file_path}: {e}")
             
-            from datetime import datetime
             return AnalysisResult(
                 file_path=str(file_path),
                 file_size=file_info['size'],
                 line_count=line_count,
                 language=file_type_info['language'],
-                last_modified=datetime.fromtimestamp(file_info['modified']),
+                last_modified=file_info['modified'],
                 is_binary=file_type_info['is_binary'],
                 encoding=encoding,
                 metrics=None,
@@ -143,13 +392,12 @@ class FileAnalyzerService:
             
         except Exception as e:
             logger.error(f"Error in basic analysis of {file_path}: {e}")
-            from datetime import datetime
             return AnalysisResult(
                 file_path=str(file_path),
                 file_size=0,
                 line_count=0,
                 language='unknown',
-                last_modified=datetime.now(),
+                last_modified=time.time(),
                 is_binary=False,
                 encoding='utf-8',
                 metrics=None,
@@ -173,7 +421,6 @@ class FileAnalyzerService:
             return self.directory_analyzer.analyze_directory(directory_path, recursive, filters)
         except Exception as e:
             logger.error(f"Error in directory analysis service: {e}")
-            from datetime import datetime
             return DirectoryAnalysis(
                 directory_path=directory_path,
                 total_files=0,
@@ -185,6 +432,44 @@ class FileAnalyzerService:
                 errors=[str(e)]
             )
     
+    async def analyze_directory_async(self, directory_path: str, recursive: bool = True,
+                                      filters: Optional[List[str]] = None) -> DirectoryAnalysis:
+        """
+        Analyze a directory without blocking the event loop.
+        
+        Args:
+            directory_path: Path to the directory
+            recursive: Whether to analyze recursively
+            filters: Optional file extension filters
+            
+        Returns:
+            Directory analysis result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._thread_pool(), self.analyze_directory, directory_path, recursive, filters
+        )
+    
+    async def search_files_async(self, pattern: str, search_type: str = 'glob',
+                                 base_path: str = '.',
+                                 filters: Optional[List[str]] = None) -> SearchResult:
+        """
+        Search for files matching a pattern without blocking the event loop.
+        
+        Args:
+            pattern: Search pattern
+            search_type: Type of search ('glob', 'regex', 'content')
+            base_path: Base directory to search in
+            filters: Optional file extension filters
+            
+        Returns:
+            Search results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._thread_pool(), self.search_files, pattern, search_type, base_path, filters
+        )
+    
     def search_files(self, pattern: str, search_type: str = 'glob', 
                     base_path: str = '.', filters: Optional[List[str]] = None) -> SearchResult:
         """
@@ -5,19 +5,139 @@ This module provides the base analyzer class with common functionality
 shared across different language-specific analyzers.
 """
 
+import dataclasses
+import hashlib
+import math
+import mmap
 import os
-from datetime import datetime
+import re
+import stat
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 import logging
 
 from ..models import AnalysisResult, CodeMetrics, TodoItem
-from ..filesystem import FileSystemManager
-from ..language_detector import LanguageDetector
+from ..filesystem import shared_fs_manager
+from ..language_detector import shared_language_detector
 
 logger = logging.getLogger(__name__)
 
+# Line classifiers for count_line_types; [^\S\n] is whitespace within a line
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]*$', re.MULTILINE)
+_COMMENT_LINE_RE = re.compile(r'^[^\S\n]*(?:#|//|/\*|\*|--|%|;)', re.MULTILINE)
+
+# Raw content is line-counted in slices of this size, so a mapped file is
+# never copied whole
+_LINE_COUNT_CHUNK_SIZE = 1024 * 1024
+
+# Coefficients of the simplified maintainability index
+_MI_BASE = 171
+_MI_VOLUME_PER_LINE = 4.0
+_MI_VOLUME_WEIGHT = 5.2
+_MI_COMPLEXITY_WEIGHT = 0.23
+_MI_LINES_WEIGHT = 16.2
+_MI_COMMENT_WEIGHT = 50
+
+# Line prefixes treated as comments by is_comment_line
+_COMMENT_PREFIXES = ('#', '//', '/*', '*', '--', '%', ';')
+
+
+class LineLocator:
+    """
+    Maps character offsets in a buffer to 1-based line numbers and lines.
+    
+    Offsets are usually looked up in ascending order, so only the newlines
+    since the previous lookup are counted; the buffer is never split.
+    """
+    
+    __slots__ = ('content', '_line_number', '_counted_to')
+    
+    def __init__(self, content: str):
+        self.content = content
+        self._line_number = 1
+        self._counted_to = 0
+    
+    def line_number(self, offset: int) -> int:
+        """
+        Get the line number containing an offset.
+        
+        Args:
+            offset: Character offset into the content
+            
+        Returns:
+            1-based line number
+        """
+        if offset < self._counted_to:
+            self._line_number = 1
+            self._counted_to = 0
+        
+        self._line_number += self.content.count('\n', self._counted_to, offset)
+        self._counted_to = offset
+        return self._line_number
+    
+    def line(self, offset: int) -> str:
+        """
+        Get the full line containing an offset, without its newline.
+        
+        Args:
+            offset: Character offset into the content
+            
+        Returns:
+            Line text
+        """
+        line_start = self.content.rfind('\n', 0, offset) + 1
+        line_end = self.content.find('\n', offset)
+        return self.content[line_start:line_end if line_end != -1 else None]
+
+
+class FileMetadata(NamedTuple):
+    """
+    Basic file metadata taken from a single stat result.
+    
+    Type and permission fields are derived from the mode on access instead
+    of being computed for every file up front.
+    """
+    size: int
+    modified: float
+    created: float
+    mode: int
+    is_symlink: bool
+    exists: bool = True
+    
+    @classmethod
+    def from_stat(cls, stat_info: os.stat_result, is_symlink: bool) -> 'FileMetadata':
+        """Build metadata from a (symlink-following) stat result."""
+        return cls(
+            stat_info.st_size,
+            stat_info.st_mtime,
+            getattr(stat_info, 'st_birthtime', stat_info.st_ctime),
+            stat_info.st_mode,
+            is_symlink
+        )
+    
+    @property
+    def is_file(self) -> bool:
+        """Whether the path is a regular file."""
+        return stat.S_ISREG(self.mode)
+    
+    @property
+    def is_dir(self) -> bool:
+        """Whether the path is a directory."""
+        return stat.S_ISDIR(self.mode)
+    
+    @property
+    def permissions(self) -> str:
+        """Permission bits as three octal digits, e.g. '644'."""
+        return format(self.mode & 0o777, '03o')
+
+
+# Metadata reported when a file cannot be stat'ed
+_MISSING_METADATA = FileMetadata(0, 0, 0, 0, False, exists=False)
+
 
 class BaseAnalyzer(ABC):
     """
@@ -29,8 +149,14 @@ class BaseAnalyzer(ABC):
     
     def __init__(self):
         """Initialize the base analyzer."""
-        self.fs_manager = FileSystemManager()
-        self.language_detector = LanguageDetector()
+        self.fs_manager = shared_fs_manager()
+        self.language_detector = shared_language_detector()
+        
+        # Code metrics keyed by a digest of the analyzed content, so identical
+        # files (vendored copies, generated code) are only analyzed once
+        self.metrics_cache_size = 4096
+        self._metrics_cache: 'OrderedDict[bytes, CodeMetrics]' = OrderedDict()
+        self._metrics_lock = threading.Lock()
     
     def analyze_file(self, file_path: str) -> AnalysisResult:
         """
@@ -57,10 +183,10 @@ class BaseAnalyzer(ABC):
             # Initialize result with basic info
             result = AnalysisResult(
                 file_path=str(path_obj),
-                file_size=metadata['size'],
+                file_size=metadata.size,
                 line_count=0,
                 language=file_type_info['language'],
-                last_modified=datetime.fromtimestamp(metadata['modified']),
+                last_modified=metadata.modified,
                 is_binary=file_type_info['is_binary'],
                 encoding='',
                 metrics=None,
@@ -76,14 +202,23 @@ class BaseAnalyzer(ABC):
             result.encoding = encoding
             
             try:
-                content = self.fs_manager.read_file_content(path_obj, encoding)
-                
-                # Count lines
-                result.line_count = self.count_lines(content)
-                
-                # Perform language-specific analysis
-                if self.supports_language(file_type_info['language']):
-                    result.metrics = self.analyze_code(content, path_obj)
+                with self.fs_manager.map_file(path_obj) as data:
+                    if self.supports_language(file_type_info['language']):
+                        # Decode straight from the mapping to avoid a chunked copy
+                        content = self.fs_manager.decode_content(data, encoding)
+                        result.line_count = self.count_lines(content)
+                        
+                        # Perform language-specific analysis, keyed on the
+                        # mapped bytes so the text is not re-encoded to hash it
+                        result.metrics = self.get_code_metrics(
+                            content, path_obj, self.raw_content_digest(data, encoding)
+                        )
+                    elif self.fs_manager.has_ascii_newlines(encoding):
+                        # Only the line count is needed, so skip decoding
+                        result.line_count = self.count_lines(data)
+                    else:
+                        content = self.fs_manager.decode_content(data, encoding)
+                        result.line_count = self.count_lines(content)
                 
             except Exception as e:
                 errors.append(f"Error reading file content: {e}")
@@ -102,54 +237,115 @@ class BaseAnalyzer(ABC):
                 file_size=0,
                 line_count=0,
                 language='unknown',
-                last_modified=datetime.now(),
+                last_modified=time.time(),
                 is_binary=False,
                 encoding='utf-8',
                 metrics=None,
                 errors=errors
             )
     
-    def get_file_metadata(self, path: Path) -> Dict:
+    def get_file_metadata(self, path: Path) -> 'FileMetadata':
         """
         Extract basic file metadata.
         
+        Uses a single os.lstat call; a second stat is only needed when the
+        path is a symlink, to report the target's size and times.
+        
         Args:
             path: Path to the file
             
         Returns:
-            Dictionary with file metadata
+            File metadata
         """
         try:
-            stat_info = path.stat()
-            return {
-                'size': stat_info.st_size,
-                'modified': stat_info.st_mtime,
-                'created': getattr(stat_info, 'st_birthtime', stat_info.st_ctime),
-                'permissions': oct(stat_info.st_mode)[-3:],
-                'is_file': path.is_file(),
-                'is_dir': path.is_dir(),
-                'is_symlink': path.is_symlink(),
-                'exists': path.exists()
-            }
+            stat_info = os.stat(path, follow_symlinks=False)
+            is_symlink = stat.S_ISLNK(stat_info.st_mode)
+            if is_symlink:
+                stat_info = os.stat(path)
+            return FileMetadata.from_stat(stat_info, is_symlink)
         except (OSError, IOError) as e:
             logger.error(f"Error getting metadata for {path}: {e}")
-            return {
-                'size': 0,
-                'modified': 0,
-                'created': 0,
-                'permissions': '000',
-                'is_file': False,
-                'is_dir': False,
-                'is_symlink': False,
-                'exists': False
-            }
-    
-    def count_lines(self, content: str) -> int:
+            return _MISSING_METADATA
+    
+    def get_code_metrics(self, content: str, file_path: Path,
+                         digest: Optional[bytes] = None) -> Optional[CodeMetrics]:
         """
-        Count lines in file content.
+        Get code metrics for content, reusing the result for identical content.
+        
+        Cached TODO items are re-attributed to file_path on every hit.
         
         Args:
             content: File content
+            file_path: Path to the file
+            digest: Optional cache key from raw_content_digest for the bytes
+                content was decoded from; saves encoding content to hash it
+            
+        Returns:
+            Code metrics or None if analysis fails
+        """
+        if digest is None:
+            digest = hashlib.blake2b(
+                content.encode('utf-8', 'surrogatepass'), digest_size=16, person=b'text'
+            ).digest()
+        
+        with self._metrics_lock:
+            metrics = self._metrics_cache.get(digest)
+            if metrics is not None:
+                self._metrics_cache.move_to_end(digest)
+        
+        if metrics is None:
+            metrics = self.analyze_code(content, file_path)
+            if metrics is None:
+                return None
+            
+            with self._metrics_lock:
+                self._metrics_cache[digest] = metrics
+                while len(self._metrics_cache) > self.metrics_cache_size:
+                    self._metrics_cache.popitem(last=False)
+        
+        # Hand out a copy so callers cannot modify the cached entry; TODO
+        # items are rebuilt directly, which is much cheaper than replace()
+        path_str = str(file_path)
+        return dataclasses.replace(metrics, todos=[
+            TodoItem(todo.line_number, todo.comment_type, todo.text, path_str)
+            for todo in metrics.todos
+        ])
+    
+    @staticmethod
+    def raw_content_digest(data: Union[bytes, mmap.mmap], encoding: str) -> bytes:
+        """
+        Get the metrics cache key for undecoded file content.
+        
+        The buffer is hashed in place, so a memory-mapped file is never
+        copied. Keys are kept apart from those of decoded text.
+        
+        Args:
+            data: Raw file content
+            encoding: Encoding the content will be decoded with
+            
+        Returns:
+            Cache key for get_code_metrics
+        """
+        digest = hashlib.blake2b(digest_size=16, person=b'raw')
+        digest.update(encoding.encode('ascii', 'replace') + b'\0')
+        digest.update(data)
+        return digest.digest()
+    
+    def clear_cache(self):
+        """Drop all cached code metrics."""
+        with self._metrics_lock:
+            self._metrics_cache.clear()
+    
+    @staticmethod
+    def count_lines(content: Union[str, bytes, mmap.mmap]) -> int:
+        """
+        Count lines in file content.
+        
+        Raw bytes are counted without decoding; CR, LF and CRLF are all
+        treated as line endings, matching a text-mode read.
+        
+        Args:
+            content: Decoded file content, raw bytes or a mapped file
             
         Returns:
             Number of lines
@@ -157,9 +353,26 @@ class BaseAnalyzer(ABC):
         if not content:
             return 0
         
-        # Count newlines and add 1 if content doesn't end with newline
-        line_count = content.count('\n')
-        if content and not content.endswith('\n'):
+        if isinstance(content, str):
+            # Decoded content already has universal newlines
+            line_count = content.count('\n')
+            if not content.endswith('\n'):
+                line_count += 1
+            return line_count
+        
+        # Count newlines slice by slice; a CRLF split across two slices
+        # must still count once
+        line_count = 0
+        after_cr = False
+        for start in range(0, len(content), _LINE_COUNT_CHUNK_SIZE):
+            chunk = content[start:start + _LINE_COUNT_CHUNK_SIZE]
+            line_count += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+            if after_cr and chunk.startswith(b'\n'):
+                line_count -= 1
+            after_cr = chunk.endswith(b'\r')
+        
+        # Add 1 if content doesn't end with newline
+        if content[-1:] not in (b'\n', b'\r'):
             line_count += 1
         
         return line_count
@@ -177,17 +390,11 @@ class BaseAnalyzer(ABC):
         if not content:
             return 0, 0, 0
         
-        lines = content.split('\n')
-        total_lines = len(lines)
-        blank_lines = 0
-        comment_lines = 0
-        
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                blank_lines += 1
-            elif self.is_comment_line(stripped):
-                comment_lines += 1
+        # Each count is a single C-level scan over the whole buffer instead
+        # of a Python loop over split lines
+        total_lines = content.count('\n') + 1
+        blank_lines = len(_BLANK_LINE_RE.findall(content))
+        comment_lines = len(_COMMENT_LINE_RE.findall(content))
         
         return total_lines, blank_lines, comment_lines
     
@@ -201,9 +408,36 @@ class BaseAnalyzer(ABC):
         Returns:
             True if line appears to be a comment
         """
-        # Basic comment detection for common languages
-        comment_prefixes = ['#', '//', '/*', '*', '--', '%', ';']
-        return any(line.startswith(prefix) for prefix in comment_prefixes)
+        return line.startswith(_COMMENT_PREFIXES)
+    
+    def calculate_maintainability_index(self, lines: int, complexity: float, comment_lines: int) -> float:
+        """
+        Calculate maintainability index.
+        
+        Args:
+            lines: Total lines of code
+            complexity: Cyclomatic complexity
+            comment_lines: Number of comment lines
+            
+        Returns:
+            Maintainability index (0-100)
+        """
+        if lines <= 0:
+            return 100.0
+        
+        # Simplified maintainability index calculation
+        # Based on Halstead metrics approximation
+        volume = lines * _MI_VOLUME_PER_LINE  # Simplified volume calculation
+        comment_ratio = comment_lines / lines
+        
+        # MI = 171 - 5.2 * ln(V) - 0.23 * G - 16.2 * ln(LOC) + 50 * sin(sqrt(2.4 * C))
+        # Simplified version
+        mi = max(0, min(100,
+            _MI_BASE - _MI_VOLUME_WEIGHT * math.log(volume) - _MI_COMPLEXITY_WEIGHT * complexity
+            - _MI_LINES_WEIGHT * math.log(lines) + _MI_COMMENT_WEIGHT * comment_ratio
+        ))
+        
+        return round(mi, 2)
     
     @abstractmethod
     def supports_language(self, language: str) -> bool:
@@ -7,14 +7,189 @@ using regex-based parsing and heuristics.
 
 import re
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import logging
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, LineLocator
 from ..models import CodeMetrics, TodoItem
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import instead of on every call; all of
+# them match case-insensitively
+
+# Literals looked for in a lowercased line before running function patterns;
+# each gets one bit of the line's prefilter mask
+_PREFILTER_LITERALS = ('(', '{', '=', 'function', 'func', 'fn', 'def')
+_PREFILTER_BITS = tuple((1 << index, literal) for index, literal in enumerate(_PREFILTER_LITERALS))
+
+
+def _prefilter_masks(required: Tuple[Tuple[str, ...], ...]) -> Tuple[int, int]:
+    """Turn one or two groups of alternative literals into a pair of bit masks."""
+    masks = tuple(
+        sum(1 << _PREFILTER_LITERALS.index(literal) for literal in group) for group in required
+    )
+    return masks[0], masks[-1]
+
+
+# Function patterns for different languages. Each has the literals a line
+# needs for it to match: every group must have one of its literals present
+# in the lowercased line, which rules most patterns out without running them
+_FUNCTION_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), lang_type, _prefilter_masks(required))
+                           for pattern, lang_type, required in (
+    # JavaScript/TypeScript functions
+    (r'(?:function\s+(\w+)\s*\([^)]*\)|(\w+)\s*:\s*function\s*\([^)]*\)|(\w+)\s*=\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))', 'javascript',
+     (('function', '='),)),
+    # Java methods
+    (r'(?:public|private|protected|static|\s)*\s*\w+\s+(\w+)\s*\([^)]*\)\s*(?:throws\s+\w+(?:\s*,\s*\w+)*)?\s*\{', 'java',
+     (('(',), ('{',))),
+    # C/C++ functions
+    (r'(?:\w+\s+)*(\w+)\s*\([^)]*\)\s*\{', 'c',
+     (('(',), ('{',))),
+    # Go functions
+    (r'func\s+(?:\(\w+\s+\*?\w+\)\s+)?(\w+)\s*\([^)]*\)', 'go',
+     (('func',), ('(',))),
+    # Rust functions
+    (r'fn\s+(\w+)\s*\([^)]*\)', 'rust',
+     (('fn',), ('(',))),
+    # Ruby methods
+    (r'def\s+(\w+)(?:\([^)]*\))?', 'ruby',
+     (('def',),)),
+    # PHP functions
+    (r'function\s+(\w+)\s*\([^)]*\)', 'php',
+     (('function',), ('(',))),
+))
+
+# Class patterns for different languages
+_CLASS_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), lang_type) for pattern, lang_type in (
+    # JavaScript/TypeScript classes
+    (r'class\s+(\w+)(?:\s+extends\s+\w+)?', 'javascript'),
+    # Java classes
+    (r'(?:public|private|protected|\s)*class\s+(\w+)(?:\s+extends\s+\w+)?(?:\s+implements\s+[\w,\s]+)?', 'java'),
+    # C++ classes
+    (r'class\s+(\w+)(?:\s*:\s*(?:public|private|protected)\s+\w+)?', 'c++'),
+    # C# classes
+    (r'(?:public|private|protected|internal|\s)*class\s+(\w+)(?:\s*:\s*\w+)?', 'csharp'),
+    # Ruby classes
+    (r'class\s+(\w+)(?:\s*<\s*\w+)?', 'ruby'),
+    # PHP classes
+    (r'class\s+(\w+)(?:\s+extends\s+\w+)?', 'php'),
+))
+
+_IMPORT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'import\s+',  # JavaScript, Java, Python
+    r'#include\s*<',  # C/C++
+    r'use\s+',  # Rust
+    r'require\s*\(',  # JavaScript/Node.js
+    r'@import\s+',  # CSS
+))
+
+# TODO patterns for different comment styles; kind is the marker and body the text after it
+_TODO_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    # Single-line comments (// # --)
+    r'(?://|#|--)\s*(?P<kind>TODO|FIXME|HACK|BUG|NOTE|XXX):?\s*(?P<body>.*)',
+    # Multi-line comments (/* */)
+    r'/\*.*?(?P<kind>TODO|FIXME|HACK|BUG|NOTE|XXX):?\s*(?P<body>.*?)\*/',
+    # HTML comments
+    r'<!--.*?(?P<kind>TODO|FIXME|HACK|BUG|NOTE|XXX):?\s*(?P<body>.*?)-->',
+))
+
+# Canonical marker strings, so every TodoItem of a kind shares one string
+_TODO_KINDS = {kind: kind for kind in ('TODO', 'FIXME', 'HACK', 'BUG', 'NOTE', 'XXX')}
+
+# Literal text every pattern of a category needs somewhere on the line; the
+# lookahead reports each position, so overlapping triggers are not hidden
+_LINE_TRIGGER_RE = re.compile(
+    r'(?=(?P<function>\(|def|function)|(?P<class>class)|(?P<todo>TODO|FIXME|HACK|BUG|NOTE|XXX))',
+    re.IGNORECASE
+)
+
+# The same triggers as literal (category, pattern) pairs for Hyperscan
+_TRIGGER_LITERALS = (
+    ('function', rb'\('), ('function', rb'def'), ('function', rb'function'),
+    ('class', rb'class'),
+    ('todo', rb'TODO'), ('todo', rb'FIXME'), ('todo', rb'HACK'),
+    ('todo', rb'BUG'), ('todo', rb'NOTE'), ('todo', rb'XXX'),
+)
+
+
+def _compile_trigger_database():
+    """
+    Compile the trigger literals into a Hyperscan block-mode database.
+    
+    Returns:
+        Compiled database, or None if Hyperscan is unavailable or fails to
+        compile the patterns
+    """
+    if hyperscan is None:
+        return None
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern for _, pattern in _TRIGGER_LITERALS],
+            ids=list(range(len(_TRIGGER_LITERALS))),
+            elements=len(_TRIGGER_LITERALS),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(_TRIGGER_LITERALS),
+        )
+        return database
+    except Exception as e:
+        logger.warning("Could not compile Hyperscan trigger database: %s", e)
+        return None
+
+
+_TRIGGER_DATABASE = _compile_trigger_database()
+
+
+def _scan_triggers(content: str) -> Iterable[Tuple[int, str]]:
+    """
+    Find every trigger in content.
+    
+    Hyperscan matches all literals in one pass when it is installed; it works
+    on bytes with ASCII-only case folding, so it is used only for ASCII
+    content, where byte and character offsets agree. Everything else goes
+    through the fused regex.
+    
+    Args:
+        content: Source code content
+        
+    Returns:
+        (offset, category) pairs in ascending offset order
+    """
+    if _TRIGGER_DATABASE is None or not content.isascii():
+        return ((match.start(), match.lastgroup) for match in _LINE_TRIGGER_RE.finditer(content))
+    
+    triggers = []
+    
+    def on_match(pattern_id, start, end, flags, context):
+        # Block mode reports end offsets; the last matched character is on
+        # the same line as the whole literal
+        triggers.append((end - 1, _TRIGGER_LITERALS[pattern_id][0]))
+    
+    _TRIGGER_DATABASE.scan(content.encode('ascii'), match_event_handler=on_match)
+    triggers.sort()
+    return triggers
+
+
+# Keywords that increase complexity; a whole word matches at most one of
+# them, so a single alternation counts the same as one pattern per keyword
+_COMPLEXITY_KEYWORD_RE = re.compile(r'\b(?:if|elif|while|for|switch|case|catch)\b', re.IGNORECASE)
+
+# Other patterns that increase complexity, each with a literal it needs so
+# the regex pass is skipped when the literal is absent. 'else if' overlaps
+# the 'if' keyword and is counted on top of it
+_COMPLEXITY_PATTERNS = tuple((literal, re.compile(pattern, re.IGNORECASE)) for literal, pattern in (
+    ('', r'\belse\s+if\b'),
+    ('&&', r'\b&&\b'),
+    ('||', r'\b\|\|\b'),
+    ('?', r'\?.*:'),  # Ternary operator
+))
+
 
 class GenericAnalyzer(BaseAnalyzer):
     """
@@ -52,11 +227,14 @@ class GenericAnalyzer(BaseAnalyzer):
             # Count line types
             total_lines, blank_lines, comment_lines = self.count_line_types(content)
             
+            # One scan over the buffer finds the lines each extractor could match
+            candidates = self.find_candidate_lines(content)
+            
             # Extract code elements using regex
-            functions = self.extract_functions_regex(content)
-            classes = self.extract_classes_regex(content)
+            functions = self.extract_functions_regex(content, candidates['function'])
+            classes = self.extract_classes_regex(content, candidates['class'])
             imports = self.count_imports(content)
-            todos = self.find_todos(content, str(file_path))
+            todos = self.find_todos(content, str(file_path), candidates['todo'])
             
             # Calculate basic complexity
             complexity = self.calculate_basic_complexity(content)
@@ -79,43 +257,73 @@ class GenericAnalyzer(BaseAnalyzer):
             logger.error(f"Error analyzing code in {file_path}: {e}")
             return None
     
-    def extract_functions_regex(self, content: str) -> List[Dict[str, Any]]:
+    def find_candidate_lines(self, content: str) -> Dict[str, List[Tuple[int, str]]]:
+        """
+        Find the lines each line-based extractor could possibly match.
+        
+        A single scan for the literal triggers every pattern of a category
+        requires ('(', 'def' or 'function' for functions, 'class' for
+        classes, a marker word for TODOs) replaces running every pattern over
+        every line.
+        
+        Args:
+            content: Source code content
+            
+        Returns:
+            Dictionary mapping 'function', 'class' and 'todo' to lists of
+            (line_number, line) tuples in line order
+        """
+        candidates = {'function': [], 'class': [], 'todo': []}
+        locator = LineLocator(content)
+        
+        for position, category in _scan_triggers(content):
+            line_num = locator.line_number(position)
+            
+            lines = candidates[category]
+            if lines and lines[-1][0] == line_num:
+                continue
+            
+            lines.append((line_num, locator.line(position)))
+        
+        return candidates
+    
+    def extract_functions_regex(self, content: str,
+                                lines: Optional[Iterable[Tuple[int, str]]] = None) -> List[Dict[str, Any]]:
         """
         Extract function definitions using regex patterns.
         
         Args:
             content: Source code content
+            lines: Optional (line_number, line) pairs to scan; defaults to
+                the candidate lines found in content
             
         Returns:
             List of function information
         """
         functions = []
         
-        # Function patterns for different languages
-        patterns = [
-            # JavaScript/TypeScript functions
-            (r'(?:function\s+(\w+)\s*\([^)]*\)|(\w+)\s*:\s*function\s*\([^)]*\)|(\w+)\s*=\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))', 'javascript'),
-            # Java methods
-            (r'(?:public|private|protected|static|\s)*\s*\w+\s+(\w+)\s*\([^)]*\)\s*(?:throws\s+\w+(?:\s*,\s*\w+)*)?\s*\{', 'java'),
-            # C/C++ functions
-            (r'(?:\w+\s+)*(\w+)\s*\([^)]*\)\s*\{', 'c'),
-            # Go functions
-            (r'func\s+(?:\(\w+\s+\*?\w+\)\s+)?(\w+)\s*\([^)]*\)', 'go'),
-            # Rust functions
-            (r'fn\s+(\w+)\s*\([^)]*\)', 'rust'),
-            # Ruby methods
-            (r'def\s+(\w+)(?:\([^)]*\))?', 'ruby'),
-            # PHP functions
-            (r'function\s+(\w+)\s*\([^)]*\)', 'php'),
-        ]
-        
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            for pattern, lang_type in patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    # Get the first non-None group (function name)
-                    func_name = next((g for g in match.groups() if g), 'unknown')
+        if lines is None:
+            lines = self.find_candidate_lines(content)['function']
+        for line_num, line in lines:
+            # Unicode case folding can match letters the literals miss, so
+            # only ASCII lines are prefiltered
+            if line.isascii():
+                lowered = line.lower()
+                present = 0
+                for bit, literal in _PREFILTER_BITS:
+                    if literal in lowered:
+                        present |= bit
+            else:
+                present = -1
+            
+            for pattern, lang_type, (first_mask, second_mask) in _FUNCTION_PATTERNS:
+                if not (present & first_mask and present & second_mask):
+                    continue
+                
+                for match in pattern.finditer(line):
+                    # Alternatives capture the name in different groups, and
+                    # only the one that matched takes part
+                    func_name = match.group(match.lastindex) if match.lastindex else 'unknown'
                     if func_name and func_name != 'unknown':
                         functions.append({
                             'name': func_name,
@@ -125,38 +333,26 @@ class GenericAnalyzer(BaseAnalyzer):
         
         return functions
     
-    def extract_classes_regex(self, content: str) -> List[Dict[str, Any]]:
+    def extract_classes_regex(self, content: str,
+                              lines: Optional[Iterable[Tuple[int, str]]] = None) -> List[Dict[str, Any]]:
         """
         Extract class definitions using regex patterns.
         
         Args:
             content: Source code content
+            lines: Optional (line_number, line) pairs to scan; defaults to
+                the candidate lines found in content
             
         Returns:
             List of class information
         """
         classes = []
         
-        # Class patterns for different languages
-        patterns = [
-            # JavaScript/TypeScript classes
-            (r'class\s+(\w+)(?:\s+extends\s+\w+)?', 'javascript'),
-            # Java classes
-            (r'(?:public|private|protected|\s)*class\s+(\w+)(?:\s+extends\s+\w+)?(?:\s+implements\s+[\w,\s]+)?', 'java'),
-            # C++ classes
-            (r'class\s+(\w+)(?:\s*:\s*(?:public|private|protected)\s+\w+)?', 'c++'),
-            # C# classes
-            (r'(?:public|private|protected|internal|\s)*class\s+(\w+)(?:\s*:\s*\w+)?', 'csharp'),
-            # Ruby classes
-            (r'class\s+(\w+)(?:\s*<\s*\w+)?', 'ruby'),
-            # PHP classes
-            (r'class\s+(\w+)(?:\s+extends\s+\w+)?', 'php'),
-        ]
-        
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            for pattern, lang_type in patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
+        if lines is None:
+            lines = self.find_candidate_lines(content)['class']
+        for line_num, line in lines:
+            for pattern, lang_type in _CLASS_PATTERNS:
+                matches = pattern.finditer(line)
                 for match in matches:
                     class_name = match.group(1)
                     if class_name:
@@ -178,52 +374,41 @@ class GenericAnalyzer(BaseAnalyzer):
         Returns:
             Number of import statements
         """
-        import_patterns = [
-            r'import\s+',  # JavaScript, Java, Python
-            r'#include\s*<',  # C/C++
-            r'use\s+',  # Rust
-            r'require\s*\(',  # JavaScript/Node.js
-            r'@import\s+',  # CSS
-        ]
-        
         import_count = 0
-        for pattern in import_patterns:
-            import_count += len(re.findall(pattern, content, re.IGNORECASE))
+        for pattern in _IMPORT_PATTERNS:
+            import_count += len(pattern.findall(content))
         
         return import_count
     
-    def find_todos(self, content: str, file_path: str) -> List[TodoItem]:
+    def find_todos(self, content: str, file_path: str,
+                   lines: Optional[Iterable[Tuple[int, str]]] = None) -> List[TodoItem]:
         """
         Find TODO, FIXME, HACK comments in code.
         
         Args:
             content: Source code content
             file_path: Path to the file
+            lines: Optional (line_number, line) pairs to scan; defaults to
+                the candidate lines found in content
             
         Returns:
             List of TODO items
         """
         todos = []
-        lines = content.split('\n')
         
-        # Patterns for different comment styles
-        todo_patterns = [
-            # Single-line comments (// # --)
-            (r'(?://|#|--)\s*(?:TODO|FIXME|HACK|BUG|NOTE|XXX):?\s*(.*)', r'(?://|#|--)\s*(TODO|FIXME|HACK|BUG|NOTE|XXX)'),
-            # Multi-line comments (/* */)
-            (r'/\*.*?(?:TODO|FIXME|HACK|BUG|NOTE|XXX):?\s*(.*?)\*/', r'/\*.*?(TODO|FIXME|HACK|BUG|NOTE|XXX)'),
-            # HTML comments
-            (r'<!--.*?(?:TODO|FIXME|HACK|BUG|NOTE|XXX):?\s*(.*?)-->', r'<!--.*?(TODO|FIXME|HACK|BUG|NOTE|XXX)'),
-        ]
-        
-        for line_num, line in enumerate(lines, 1):
-            for text_pattern, type_pattern in todo_patterns:
-                text_match = re.search(text_pattern, line, re.IGNORECASE | re.DOTALL)
-                type_match = re.search(type_pattern, line, re.IGNORECASE)
+        if lines is None:
+            lines = self.find_candidate_lines(content)['todo']
+        for line_num, line in lines:
+            for pattern in _TODO_PATTERNS:
+                match = pattern.search(line)
                 
-                if text_match and type_match:
-                    comment_type = type_match.group(1).upper()
-                    todo_text = text_match.group(1).strip() if text_match.group(1) else line.strip()
+                if match:
+                    # IGNORECASE also matches Unicode case variants (e.g. the
+                    # Kelvin sign for K), which have no canonical entry
+                    kind = match.group('kind').upper()
+                    comment_type = _TODO_KINDS.get(kind, kind)
+                    body = match.group('body')
+                    todo_text = body.strip() if body else line.strip()
                     
                     todos.append(TodoItem(
                         line_number=line_num,
@@ -246,52 +431,10 @@ class GenericAnalyzer(BaseAnalyzer):
             Approximate complexity score
         """
         complexity = 1  # Base complexity
+        complexity += len(_COMPLEXITY_KEYWORD_RE.findall(content))
         
-        # Patterns that increase complexity
-        complexity_patterns = [
-            r'\bif\b',
-            r'\belse\s+if\b',
-            r'\belif\b',
-            r'\bwhile\b',
-            r'\bfor\b',
-            r'\bswitch\b',
-            r'\bcase\b',
-            r'\bcatch\b',
-            r'\b&&\b',
-            r'\b\|\|\b',
-            r'\?.*:',  # Ternary operator
-        ]
-        
-        for pattern in complexity_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            complexity += len(matches)
+        for literal, pattern in _COMPLEXITY_PATTERNS:
+            if literal in content:
+                complexity += len(pattern.findall(content))
         
         return float(complexity)
-    
-    def calculate_maintainability_index(self, lines: int, complexity: float, comment_lines: int) -> float:
-        """
-        Calculate maintainability index.
-        
-        Args:
-            lines: Total lines of code
-            complexity: Cyclomatic complexity
-            comment_lines: Number of comment lines
-            
-        Returns:
-            Maintainability index (0-100)
-        """
-        if lines == 0:
-            return 100.0
-        
-        # Simplified maintainability index calculation
-        import math
-        volume = lines * 4.0  # Simplified volume calculation
-        comment_ratio = comment_lines / lines if lines > 0 else 0
-        
-        # MI = 171 - 5.2 * ln(V) - 0.23 * G - 16.2 * ln(LOC) + 50 * sin(sqrt(2.4 * C))
-        # Simplified version
-        mi = max(0, min(100, 
-            171 - 5.2 * math.log(max(1, volume)) - 0.23 * complexity - 16.2 * math.log(max(1, lines)) + 50 * comment_ratio
-        ))
-        
-        return round(mi, 2)
\ No newline at end of file
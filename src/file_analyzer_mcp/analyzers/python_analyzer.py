@@ -7,15 +7,87 @@ using AST parsing and other Python-specific techniques.
 
 import ast
 import re
+import sys
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 import logging
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, LineLocator
 from ..models import CodeMetrics, TodoItem
 
 logger = logging.getLogger(__name__)
 
+# AST node types that each add one to cyclomatic complexity
+_DECISION_NODE_TYPES = frozenset({
+    ast.If, ast.While, ast.For, ast.AsyncFor,
+    ast.ExceptHandler,
+    ast.FunctionDef, ast.AsyncFunctionDef,
+})
+
+# Nodes whose list fields can hold statements; expressions never do
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler) + (
+    (ast.match_case,) if hasattr(ast, 'match_case') else ()
+)
+
+
+def _walk_statements(tree: ast.AST) -> Iterator[ast.stmt]:
+    """
+    Yield the statements of a tree in ast.walk order without visiting expressions.
+    
+    Classes, functions and imports are always statements, and expression
+    nodes make up most of a typical tree, so scans for them skip most nodes.
+    
+    Args:
+        tree: Python AST
+        
+    Yields:
+        Statement nodes, breadth-first
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        if isinstance(node, ast.stmt):
+            yield node
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                todo.extend(child for child in value if isinstance(child, _STATEMENT_CONTAINERS))
+
+
+# Standard library modules by top-level name; the interpreter's own list on
+# Python 3.10+, a list of common modules before that
+_STDLIB_MODULES = getattr(sys, 'stdlib_module_names', None) or frozenset({
+    'os', 'sys', 'json', 'datetime', 'time', 'math', 'random',
+    'collections', 'itertools', 'functools', 'operator', 'copy',
+    'pickle', 'sqlite3', 'urllib', 'http', 'email', 'html',
+    'xml', 'csv', 'configparser', 'logging', 'unittest', 'doctest',
+    'argparse', 'subprocess', 'threading', 'multiprocessing',
+    'asyncio', 'concurrent', 'queue', 'socket', 'ssl', 'hashlib',
+    'hmac', 'secrets', 'uuid', 'base64', 'binascii', 'struct',
+    'codecs', 'locale', 'gettext', 'calendar', 'zoneinfo',
+    'pathlib', 'glob', 'fnmatch', 'tempfile', 'shutil', 'stat',
+    'filecmp', 'tarfile', 'zipfile', 'gzip', 'bz2', 'lzma',
+    'zlib', 'io', 'stringio', 'textwrap', 'unicodedata',
+    'string', 're', 'difflib', 'readline', 'rlcompleter',
+    'typing', 'dataclasses', 'enum', 'abc', 'array', 'bisect', 'heapq',
+    'weakref', 'contextlib', 'inspect', 'types', 'traceback', 'warnings'
+})
+
+# TODO-style markers in priority order: a comment mentioning several is
+# reported as the first type listed here
+_TODO_TYPES = ('TODO', 'FIXME', 'HACK', 'BUG', 'NOTE', 'XXX')
+
+# Matches the first '#' of a line followed by one of the markers; one
+# lookahead per marker keeps the priority order, and the group of the
+# alternative that matched captures the text after the marker
+_TODO_RE = re.compile(
+    r'^[^#\n]*#(?:' + '|'.join(
+        r'(?=[^\n]*?' + marker + r':?[^\S\n]*([^\n]*))' for marker in _TODO_TYPES
+    ) + ')',
+    re.MULTILINE | re.IGNORECASE
+)
+
 
 class PythonAnalyzer(BaseAnalyzer):
     """
@@ -50,22 +122,19 @@ class PythonAnalyzer(BaseAnalyzer):
             # Count line types
             total_lines, blank_lines, comment_lines = self.count_line_types(content)
             
-            # Extract code elements
-            functions = self.extract_functions(tree)
-            classes = self.extract_classes(tree)
-            imports = self.extract_imports(tree)
+            # Count code elements and complexity in a single tree walk
+            function_count, class_count, import_count, complexity = self.collect_metrics(tree)
             todos = self.find_todos(content, str(file_path))
             
-            # Calculate complexity metrics
-            complexity = self.calculate_complexity(tree)
+            # Calculate maintainability
             maintainability = self.calculate_maintainability_index(
                 total_lines, complexity, comment_lines
             )
             
             return CodeMetrics(
-                function_count=len(functions),
-                class_count=len(classes),
-                import_count=len(imports),
+                function_count=function_count,
+                class_count=class_count,
+                import_count=import_count,
                 comment_lines=comment_lines,
                 blank_lines=blank_lines,
                 cyclomatic_complexity=complexity,
@@ -96,6 +165,41 @@ class PythonAnalyzer(BaseAnalyzer):
             logger.error(f"Error parsing Python AST: {e}")
             return None
     
+    def collect_metrics(self, tree: ast.AST) -> Tuple[int, int, int, float]:
+        """
+        Count functions, classes, imports and cyclomatic complexity in one pass.
+        
+        The counts match len() of the extract_* results and the value of
+        calculate_complexity, without walking the tree once per metric.
+        
+        Args:
+            tree: Python AST
+            
+        Returns:
+            Tuple of (function_count, class_count, import_count, complexity)
+        """
+        function_count = 0
+        class_count = 0
+        import_count = 0
+        complexity = 1  # Base complexity
+        
+        for node in ast.walk(tree):
+            node_type = type(node)
+            if node_type in _DECISION_NODE_TYPES:
+                complexity += 1
+                if node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+                    function_count += 1
+            elif node_type is ast.ClassDef:
+                class_count += 1
+            elif node_type is ast.Import or node_type is ast.ImportFrom:
+                import_count += len(node.names)
+            elif node_type is ast.BoolOp:
+                complexity += len(node.values) - 1
+            elif node_type is ast.comprehension:
+                complexity += 1 + len(node.ifs)
+        
+        return function_count, class_count, import_count, float(complexity)
+    
     def extract_functions(self, tree: ast.AST) -> List[Dict[str, Any]]:
         """
         Extract function definitions from AST.
@@ -107,22 +211,29 @@ class PythonAnalyzer(BaseAnalyzer):
             List of function information
         """
         functions = []
+        method_ids = set()
         
-        for node in ast.walk(tree):
+        # The walk is breadth-first, so a class is seen before its methods
+        for node in _walk_statements(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                func_info = {
-                    'name': node.name,
-                    'line_number': node.lineno,
-                    'is_async': isinstance(node, ast.AsyncFunctionDef),
-                    'args': [arg.arg for arg in node.args.args],
-                    'decorators': [self._get_decorator_name(dec) for dec in node.decorator_list],
-                    'docstring': ast.get_docstring(node),
-                    'is_method': self._is_method(node, tree)
-                }
-                functions.append(func_info)
+                functions.append(self._function_info(node, id(node) in method_ids))
+            elif isinstance(node, ast.ClassDef):
+                method_ids.update(id(child) for child in node.body)
         
         return functions
     
+    def _function_info(self, node: ast.AST, is_method: bool) -> Dict[str, Any]:
+        """Build the function information for a FunctionDef or AsyncFunctionDef node."""
+        return {
+            'name': node.name,
+            'line_number': node.lineno,
+            'is_async': isinstance(node, ast.AsyncFunctionDef),
+            'args': [arg.arg for arg in node.args.args],
+            'decorators': [self._get_decorator_name(dec) for dec in node.decorator_list],
+            'docstring': ast.get_docstring(node),
+            'is_method': is_method
+        }
+    
     def _get_decorator_name(self, decorator: ast.AST) -> str:
         """Get decorator name from AST node."""
         if isinstance(decorator, ast.Name):
@@ -143,15 +254,6 @@ class PythonAnalyzer(BaseAnalyzer):
         else:
             return str(node)
     
-    def _is_method(self, func_node: ast.FunctionDef, tree: ast.AST) -> bool:
-        """Check if function is a method (inside a class)."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for child in node.body:
-                    if child == func_node:
-                        return True
-        return False
-    
     def extract_classes(self, tree: ast.AST) -> List[Dict[str, Any]]:
         """
         Extract class definitions from AST.
@@ -162,44 +264,41 @@ class PythonAnalyzer(BaseAnalyzer):
         Returns:
             List of class information
         """
-        classes = []
+        return [self._class_info(node) for node in _walk_statements(tree) if isinstance(node, ast.ClassDef)]
+    
+    def _class_info(self, node: ast.ClassDef) -> Dict[str, Any]:
+        """Build the class information for a ClassDef node."""
+        # Extract base classes
+        bases = []
+        for base in node.bases:
+            if isinstance(base, ast.Name):
+                bases.append(base.id)
+            elif isinstance(base, ast.Attribute):
+                bases.append(self._get_attr_name(base))
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Extract base classes
-                bases = []
-                for base in node.bases:
-                    if isinstance(base, ast.Name):
-                        bases.append(base.id)
-                    elif isinstance(base, ast.Attribute):
-                        bases.append(self._get_attr_name(base))
-                
-                # Count methods in the class
-                methods = []
-                for child in node.body:
-                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        methods.append({
-                            'name': child.name,
-                            'line_number': child.lineno,
-                            'is_async': isinstance(child, ast.AsyncFunctionDef),
-                            'is_property': any(
-                                self._get_decorator_name(dec) == 'property' 
-                                for dec in child.decorator_list
-                            )
-                        })
-                
-                class_info = {
-                    'name': node.name,
-                    'line_number': node.lineno,
-                    'bases': bases,
-                    'methods': methods,
-                    'method_count': len(methods),
-                    'decorators': [self._get_decorator_name(dec) for dec in node.decorator_list],
-                    'docstring': ast.get_docstring(node)
-                }
-                classes.append(class_info)
+        # Count methods in the class
+        methods = []
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                methods.append({
+                    'name': child.name,
+                    'line_number': child.lineno,
+                    'is_async': isinstance(child, ast.AsyncFunctionDef),
+                    'is_property': any(
+                        self._get_decorator_name(dec) == 'property' 
+                        for dec in child.decorator_list
+                    )
+                })
         
-        return classes
+        return {
+            'name': node.name,
+            'line_number': node.lineno,
+            'bases': bases,
+            'methods': methods,
+            'method_count': len(methods),
+            'decorators': [self._get_decorator_name(dec) for dec in node.decorator_list],
+            'docstring': ast.get_docstring(node)
+        }
     
     def extract_imports(self, tree: ast.AST) -> List[Dict[str, Any]]:
         """
@@ -213,63 +312,42 @@ class PythonAnalyzer(BaseAnalyzer):
         """
         imports = []
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    import_info = {
-                        'type': 'import',
-                        'module': alias.name,
-                        'alias': alias.asname,
-                        'line_number': node.lineno,
-                        'is_standard_library': self._is_standard_library(alias.name),
-                        'is_relative': False
-                    }
-                    imports.append(import_info)
-            
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ''
-                level = node.level  # Number of dots for relative imports
-                
-                for alias in node.names:
-                    import_info = {
-                        'type': 'from_import',
-                        'module': module,
-                        'name': alias.name,
-                        'alias': alias.asname,
-                        'line_number': node.lineno,
-                        'is_standard_library': self._is_standard_library(module),
-                        'is_relative': level > 0,
-                        'relative_level': level
-                    }
-                    imports.append(import_info)
+        for node in _walk_statements(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports.extend(self._import_infos(node))
         
         return imports
     
-    def _is_standard_library(self, module_name: str) -> bool:
-        """Check if module is part of Python standard library."""
-        if not module_name:
-            return False
-        
-        # Get the top-level module name
-        top_level = module_name.split('.')[0]
+    def _import_infos(self, node: ast.AST) -> List[Dict[str, Any]]:
+        """Build the import information for each name of an Import or ImportFrom node."""
+        if isinstance(node, ast.Import):
+            return [{
+                'type': 'import',
+                'module': alias.name,
+                'alias': alias.asname,
+                'line_number': node.lineno,
+                'is_standard_library': self._is_standard_library(alias.name),
+                'is_relative': False
+            } for alias in node.names]
         
-        # Common standard library modules
-        stdlib_modules = {
-            'os', 'sys', 'json', 'datetime', 'time', 'math', 'random',
-            'collections', 'itertools', 'functools', 'operator', 'copy',
-            'pickle', 'sqlite3', 'urllib', 'http', 'email', 'html',
-            'xml', 'csv', 'configparser', 'logging', 'unittest', 'doctest',
-            'argparse', 'subprocess', 'threading', 'multiprocessing',
-            'asyncio', 'concurrent', 'queue', 'socket', 'ssl', 'hashlib',
-            'hmac', 'secrets', 'uuid', 'base64', 'binascii', 'struct',
-            'codecs', 'locale', 'gettext', 'calendar', 'zoneinfo',
-            'pathlib', 'glob', 'fnmatch', 'tempfile', 'shutil', 'stat',
-            'filecmp', 'tarfile', 'zipfile', 'gzip', 'bz2', 'lzma',
-            'zlib', 'io', 'stringio', 'textwrap', 'unicodedata',
-            'string', 're', 'difflib', 'readline', 'rlcompleter'
-        }
+        module = node.module or ''
+        level = node.level  # Number of dots for relative imports
         
-        return top_level in stdlib_modules
+        return [{
+            'type': 'from_import',
+            'module': module,
+            'name': alias.name,
+            'alias': alias.asname,
+            'line_number': node.lineno,
+            'is_standard_library': self._is_standard_library(module),
+            'is_relative': level > 0,
+            'relative_level': level
+        } for alias in node.names]
+    
+    def _is_standard_library(self, module_name: str) -> bool:
+        """Check if module is part of Python standard library."""
+        # partition avoids building a list just to read the top-level name
+        return bool(module_name) and module_name.partition('.')[0] in _STDLIB_MODULES
     
     def find_todos(self, content: str, file_path: str) -> List[TodoItem]:
         """
@@ -283,30 +361,23 @@ class PythonAnalyzer(BaseAnalyzer):
             List of TODO items
         """
         todos = []
-        lines = content.split('\n')
+        locator = LineLocator(content)
         
-        # Patterns to match TODO-style comments
-        todo_patterns = [
-            (r'#.*?TODO:?\s*(.*)', 'TODO'),
-            (r'#.*?FIXME:?\s*(.*)', 'FIXME'),
-            (r'#.*?HACK:?\s*(.*)', 'HACK'),
-            (r'#.*?BUG:?\s*(.*)', 'BUG'),
-            (r'#.*?NOTE:?\s*(.*)', 'NOTE'),
-            (r'#.*?XXX:?\s*(.*)', 'XXX'),
-        ]
-        
-        for line_num, line in enumerate(lines, 1):
-            for pattern, comment_type in todo_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    todo_text = match.group(1).strip() if match.group(1) else line.strip()
-                    todos.append(TodoItem(
-                        line_number=line_num,
-                        comment_type=comment_type,
-                        text=todo_text,
-                        file_path=file_path
-                    ))
-                    break  # Only match first pattern per line
+        # One scan over the whole buffer; each match is the first '#' of a line
+        for match in _TODO_RE.finditer(content):
+            line_start = match.start()
+            
+            comment_type = _TODO_TYPES[match.lastindex - 1]
+            todo_text = match.group(match.lastindex).strip()
+            if not todo_text:
+                todo_text = locator.line(line_start).strip()
+            
+            todos.append(TodoItem(
+                line_number=locator.line_number(line_start),
+                comment_type=comment_type,
+                text=todo_text,
+                file_path=file_path
+            ))
         
         return todos
     
@@ -320,52 +391,5 @@ class PythonAnalyzer(BaseAnalyzer):
         Returns:
             Cyclomatic complexity score
         """
-        complexity = 1  # Base complexity
-        
-        # Count decision points that increase complexity
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                # And/Or operations add complexity
-                complexity += len(node.values) - 1
-            elif isinstance(node, ast.comprehension):
-                # List/dict/set comprehensions
-                complexity += 1
-                # Add complexity for conditions in comprehensions
-                complexity += len(node.ifs)
-        
-        return float(complexity)
-    
-    def calculate_maintainability_index(self, lines: int, complexity: float, comment_lines: int) -> float:
-        """
-        Calculate maintainability index.
-        
-        Args:
-            lines: Total lines of code
-            complexity: Cyclomatic complexity
-            comment_lines: Number of comment lines
-            
-        Returns:
-            Maintainability index (0-100)
-        """
-        if lines == 0:
-            return 100.0
-        
-        # Simplified maintainability index calculation
-        # Based on Halstead metrics approximation
-        volume = lines * 4.0  # Simplified volume calculation
-        comment_ratio = comment_lines / lines if lines > 0 else 0
-        
-        # MI = 171 - 5.2 * ln(V) - 0.23 * G - 16.2 * ln(LOC) + 50 * sin(sqrt(2.4 * C))
-        # Simplified version
-        import math
-        mi = max(0, min(100, 
-            171 - 5.2 * math.log(volume) - 0.23 * complexity - 16.2 * math.log(lines) + 50 * comment_ratio
-        ))
-        
-        return round(mi, 2)
\ No newline at end of file
+        # The decision-point rules live in collect_metrics, so both agree
+        return self.collect_metrics(tree)[3]
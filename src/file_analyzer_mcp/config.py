@@ -5,16 +5,28 @@ This module provides configuration loading, validation, and default settings
 for the MCP server and its analysis components.
 """
 
+import copy
 import os
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import sys
 
+from .filesystem import is_racy_mtime
+
 logger = logging.getLogger(__name__)
 
+# Spellings of true accepted for boolean environment variables
+_TRUTHY_VALUES = frozenset({'1', 'true', 'True', 'TRUE', 'yes', 'Yes', 'YES', 'on', 'On', 'ON'})
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class AnalysisConfig:
@@ -66,11 +78,18 @@ class FileAnalyzerConfig:
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     server: ServerConfig = field(default_factory=ServerConfig)
     
+    # Logging settings applied by the last setup_logging call and the
+    # handlers it installed on the root logger
+    _logging_signature: ClassVar[Optional[tuple]] = None
+    _logging_handlers: ClassVar[Dict[str, 'logging.Handler']] = {}
+    
     @classmethod
     def load_from_file(cls, config_path: str) -> 'FileAnalyzerConfig':
         """
         Load configuration from a JSON file.
         
+        Uses orjson when it is installed and falls back to the standard library.
+        
         Args:
             config_path: Path to the configuration file
             
@@ -78,8 +97,12 @@ class FileAnalyzerConfig:
             Configuration instance
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # Read in one call; orjson parses the bytes without decoding them first
+            raw = Path(config_path).read_bytes()
+            if orjson is not None:
+                config_data = orjson.loads(raw)
+            else:
+                config_data = json.loads(raw)
             
             return cls.from_dict(config_data)
             
@@ -102,46 +125,45 @@ class FileAnalyzerConfig:
             Configuration instance
         """
         config = cls()
+        env = os.environ
         
         # Analysis settings
-        if os.getenv('FA_MAX_FILE_SIZE'):
-            try:
-                config.analysis.max_file_size = int(os.getenv('FA_MAX_FILE_SIZE'))
-            except ValueError:
-                logger.warning("Invalid FA_MAX_FILE_SIZE value")
-        
-        if os.getenv('FA_CHUNK_SIZE'):
-            try:
-                config.analysis.chunk_size = int(os.getenv('FA_CHUNK_SIZE'))
-            except ValueError:
-                logger.warning("Invalid FA_CHUNK_SIZE value")
-        
-        if os.getenv('FA_MAX_CONTEXT_LINES'):
-            try:
-                config.analysis.max_context_lines = int(os.getenv('FA_MAX_CONTEXT_LINES'))
-            except ValueError:
-                logger.warning("Invalid FA_MAX_CONTEXT_LINES value")
+        for name, attribute in (('FA_MAX_FILE_SIZE', 'max_file_size'),
+                                ('FA_CHUNK_SIZE', 'chunk_size'),
+                                ('FA_MAX_CONTEXT_LINES', 'max_context_lines')):
+            value = env.get(name)
+            if value:
+                try:
+                    setattr(config.analysis, attribute, int(value))
+                except ValueError:
+                    logger.warning(f"Invalid {name} value")
         
         # Security settings
-        if os.getenv('FA_ALLOW_ABSOLUTE_PATHS'):
-            config.security.allow_absolute_paths = os.getenv('FA_ALLOW_ABSOLUTE_PATHS').lower() == 'true'
+        value = env.get('FA_ALLOW_ABSOLUTE_PATHS')
+        if value:
+            config.security.allow_absolute_paths = value in _TRUTHY_VALUES
         
-        if os.getenv('FA_ALLOW_SYMLINKS'):
-            config.security.allow_symlinks = os.getenv('FA_ALLOW_SYMLINKS').lower() == 'true'
+        value = env.get('FA_ALLOW_SYMLINKS')
+        if value:
+            config.security.allow_symlinks = value in _TRUTHY_VALUES
         
-        if os.getenv('FA_RESTRICTED_PATHS'):
-            config.security.restricted_paths = os.getenv('FA_RESTRICTED_PATHS').split(',')
+        value = env.get('FA_RESTRICTED_PATHS')
+        if value:
+            config.security.restricted_paths = value.split(',')
         
         # Logging settings
-        if os.getenv('FA_LOG_LEVEL'):
-            config.logging.level = os.getenv('FA_LOG_LEVEL').upper()
+        value = env.get('FA_LOG_LEVEL')
+        if value:
+            config.logging.level = value.upper()
         
-        if os.getenv('FA_LOG_FILE'):
-            config.logging.file_path = os.getenv('FA_LOG_FILE')
+        value = env.get('FA_LOG_FILE')
+        if value:
+            config.logging.file_path = value
         
         # Server settings
-        if os.getenv('FA_DEBUG'):
-            config.server.debug = os.getenv('FA_DEBUG').lower() == 'true'
+        value = env.get('FA_DEBUG')
+        if value:
+            config.server.debug = value in _TRUTHY_VALUES
         
         return config
     
@@ -158,65 +180,11 @@ class FileAnalyzerConfig:
         """
         config = cls()
         
-        # Analysis configuration
-        if 'analysis' in data:
-            analysis_data = data['analysis']
-            if 'max_file_size' in analysis_data:
-                config.analysis.max_file_size = analysis_data['max_file_size']
-            if 'chunk_size' in analysis_data:
-                config.analysis.chunk_size = analysis_data['chunk_size']
-            if 'max_context_lines' in analysis_data:
-                config.analysis.max_context_lines = analysis_data['max_context_lines']
-            if 'max_matches_per_file' in analysis_data:
-                config.analysis.max_matches_per_file = analysis_data['max_matches_per_file']
-            if 'max_total_matches' in analysis_data:
-                config.analysis.max_total_matches = analysis_data['max_total_matches']
-            if 'enable_complexity_analysis' in analysis_data:
-                config.analysis.enable_complexity_analysis = analysis_data['enable_complexity_analysis']
-            if 'enable_todo_detection' in analysis_data:
-                config.analysis.enable_todo_detection = analysis_data['enable_todo_detection']
-            if 'enable_docstring_analysis' in analysis_data:
-                config.analysis.enable_docstring_analysis = analysis_data['enable_docstring_analysis']
-        
-        # Security configuration
-        if 'security' in data:
-            security_data = data['security']
-            if 'allow_absolute_paths' in security_data:
-                config.security.allow_absolute_paths = security_data['allow_absolute_paths']
-            if 'allow_symlinks' in security_data:
-                config.security.allow_symlinks = security_data['allow_symlinks']
-            if 'restricted_paths' in security_data:
-                config.security.restricted_paths = security_data['restricted_paths']
-            if 'max_directory_depth' in security_data:
-                config.security.max_directory_depth = security_data['max_directory_depth']
-        
-        # Logging configuration
-        if 'logging' in data:
-            logging_data = data['logging']
-            if 'level' in logging_data:
-                config.logging.level = logging_data['level']
-            if 'format' in logging_data:
-                config.logging.format = logging_data['format']
-            if 'file_path' in logging_data:
-                config.logging.file_path = logging_data['file_path']
-            if 'max_file_size' in logging_data:
-                config.logging.max_file_size = logging_data['max_file_size']
-            if 'backup_count' in logging_data:
-                config.logging.backup_count = logging_data['backup_count']
-        
-        # Server configuration
-        if 'server' in data:
-            server_data = data['server']
-            if 'name' in server_data:
-                config.server.name = server_data['name']
-            if 'version' in server_data:
-                config.server.version = server_data['version']
-            if 'description' in server_data:
-                config.server.description = server_data['description']
-            if 'protocol_version' in server_data:
-                config.server.protocol_version = server_data['protocol_version']
-            if 'debug' in server_data:
-                config.server.debug = server_data['debug']
+        for section, section_fields in _SECTION_FIELDS.items():
+            section_config = getattr(config, section)
+            for key, value in data.get(section, {}).items():
+                if key in section_fields:
+                    setattr(section_config, key, value)
         
         return config
     
@@ -269,43 +237,38 @@ class FileAnalyzerConfig:
         """
         errors = []
         
-        # Validate analysis settings
-        if self.analysis.max_file_size <= 0:
-            errors.append("max_file_size must be positive")
-        
-        if self.analysis.chunk_size <= 0:
-            errors.append("chunk_size must be positive")
-        
-        if self.analysis.max_context_lines < 0:
-            errors.append("max_context_lines must be non-negative")
-        
-        if self.analysis.max_matches_per_file <= 0:
-            errors.append("max_matches_per_file must be positive")
-        
-        if self.analysis.max_total_matches <= 0:
-            errors.append("max_total_matches must be positive")
-        
-        # Validate security settings
-        if self.security.max_directory_depth <= 0:
-            errors.append("max_directory_depth must be positive")
+        # Validate numeric settings
+        for get_value, allow_zero, message in _NUMERIC_CHECKS:
+            value = get_value(self)
+            if value < 0 or (value == 0 and not allow_zero):
+                errors.append(message)
         
         # Validate logging settings
-        valid_log_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
-        if self.logging.level not in valid_log_levels:
-            errors.append(f"logging level must be one of: {valid_log_levels}")
-        
-        if self.logging.max_file_size <= 0:
-            errors.append("logging max_file_size must be positive")
-        
-        if self.logging.backup_count < 0:
-            errors.append("logging backup_count must be non-negative")
+        if self.logging.level not in _VALID_LOG_LEVELS:
+            errors.append(f"logging level must be one of: {_VALID_LOG_LEVELS}")
         
         return errors
     
     def setup_logging(self):
-        """Set up logging based on configuration."""
+        """
+        Set up logging based on configuration.
+        
+        Repeated calls with unchanged logging settings return immediately, and
+        handlers whose settings did not change are kept rather than recreated.
+        """
+        signature = (
+            self.logging.level.upper(),
+            self.logging.format,
+            self.logging.file_path,
+            self.logging.max_file_size,
+            self.logging.backup_count,
+        )
+        previous = FileAnalyzerConfig._logging_signature
+        if signature == previous:
+            return
+        
         # Convert string level to logging constant
-        level = getattr(logging, self.logging.level.upper(), logging.INFO)
+        level = getattr(logging, signature[0], logging.INFO)
         
         # Create formatter
         formatter = logging.Formatter(self.logging.format)
@@ -313,29 +276,155 @@ class FileAnalyzerConfig:
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(level)
+        handlers = FileAnalyzerConfig._logging_handlers
         
-        # Remove existing handlers
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-        
-        # Add console handler
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        if previous is None:
+            # Remove existing handlers
+            for handler in root_logger.handlers[:]:
+                root_logger.removeHandler(handler)
+            
+            # Add console handler
+            console_handler = logging.StreamHandler(sys.stderr)
+            root_logger.addHandler(console_handler)
+            handlers['console'] = console_handler
+        
+        # Replace the file handler only when its own settings changed
+        if previous is None or previous[2:] != signature[2:]:
+            old_handler = handlers.pop('file', None)
+            if old_handler is not None:
+                root_logger.removeHandler(old_handler)
+                old_handler.close()
+            
+            # Add file handler if specified
+            if self.logging.file_path:
+                try:
+                    from logging.handlers import RotatingFileHandler
+                    file_handler = RotatingFileHandler(
+                        self.logging.file_path,
+                        maxBytes=self.logging.max_file_size,
+                        backupCount=self.logging.backup_count
+                    )
+                    root_logger.addHandler(file_handler)
+                    handlers['file'] = file_handler
+                except Exception as e:
+                    logger.error(f"Failed to set up file logging: {e}")
+        
+        for handler in handlers.values():
+            handler.setFormatter(formatter)
+        
+        FileAnalyzerConfig._logging_signature = signature
+
+
+# Numeric settings checked by validate(): (getter, zero allowed, error message)
+_NUMERIC_CHECKS = tuple(
+    (attrgetter(path), allow_zero, f"{label} must be {'non-negative' if allow_zero else 'positive'}")
+    for path, allow_zero, label in (
+        ('analysis.max_file_size', False, 'max_file_size'),
+        ('analysis.chunk_size', False, 'chunk_size'),
+        ('analysis.max_context_lines', True, 'max_context_lines'),
+        ('analysis.max_matches_per_file', False, 'max_matches_per_file'),
+        ('analysis.max_total_matches', False, 'max_total_matches'),
+        ('security.max_directory_depth', False, 'max_directory_depth'),
+        ('logging.max_file_size', False, 'logging max_file_size'),
+        ('logging.backup_count', True, 'logging backup_count'),
+    )
+)
+
+_VALID_LOG_LEVELS = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
+
+# Field names accepted for each section of a configuration dictionary
+_SECTION_FIELDS = {
+    section.name: frozenset(f.name for f in fields(section.default_factory))
+    for section in fields(FileAnalyzerConfig)
+}
+
+
+# Parsed and validated configuration files keyed by path, with the
+# (size, mtime_ns) they were loaded at
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], FileAnalyzerConfig]] = {}
+
+
+def _load_config_file(config_path: Path) -> Optional[FileAnalyzerConfig]:
+    """
+    Load and validate a configuration file, reusing the last parse if unchanged.
+    
+    Args:
+        config_path: Path to the configuration file
         
-        # Add file handler if specified
-        if self.logging.file_path:
-            try:
-                from logging.handlers import RotatingFileHandler
-                file_handler = RotatingFileHandler(
-                    self.logging.file_path,
-                    maxBytes=self.logging.max_file_size,
-                    backupCount=self.logging.backup_count
-                )
-                file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
-            except Exception as e:
-                logger.error(f"Failed to set up file logging: {e}")
+    Returns:
+        Copy of the configuration, or None if the file does not exist
+    """
+    try:
+        stat_info = config_path.stat()
+    except OSError:
+        return None
+    
+    key = str(config_path)
+    signature = (stat_info.st_size, stat_info.st_mtime_ns)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != signature:
+        config = FileAnalyzerConfig.load_from_file(key)
+        _validate_config(config)
+        cached = (signature, config)
+        # A rewrite within the racy window could keep the same signature
+        if is_racy_mtime(stat_info.st_mtime_ns):
+            _CONFIG_CACHE.pop(key, None)
+        else:
+            _CONFIG_CACHE[key] = cached
+    
+    # Callers override settings on the returned object
+    return copy.deepcopy(cached[1])
+
+
+def _validate_config(config: FileAnalyzerConfig):
+    """Log any validation errors in a configuration."""
+    errors = config.validate()
+    if errors:
+        logger.warning(f"Configuration validation errors: {errors}")
+
+
+# Locations searched when no configuration path is given, in order
+_DEFAULT_CONFIG_PATHS = tuple(Path(path).expanduser() for path in (
+    'file_analyzer_config.json',
+    '~/.file_analyzer_config.json',
+    '/etc/file_analyzer_config.json'
+))
+
+# ((pid, working directory), path found or None) from the last default search
+_default_config_search: Optional[Tuple[Tuple[int, str], Optional[Path]]] = None
+
+
+def _load_default_config_file() -> Optional[FileAnalyzerConfig]:
+    """
+    Load the first configuration file found in the default locations.
+    
+    Where the search ended, including finding nothing, is remembered per
+    process and working directory, so later calls go straight to that file or
+    make no filesystem calls at all. If the remembered file disappears the
+    locations are searched again.
+    
+    Returns:
+        Configuration instance, or None if no default file exists
+    """
+    global _default_config_search
+    
+    key = (os.getpid(), os.getcwd())
+    if _default_config_search is not None and _default_config_search[0] == key:
+        found = _default_config_search[1]
+        if found is None:
+            return None
+        config = _load_config_file(found)
+        if config is not None:
+            return config
+    
+    for path in _DEFAULT_CONFIG_PATHS:
+        config = _load_config_file(path)
+        if config is not None:
+            _default_config_search = (key, path)
+            return config
+    
+    _default_config_search = (key, None)
+    return None
 
 
 def load_config(config_path: Optional[str] = None) -> FileAnalyzerConfig:
@@ -348,30 +437,17 @@ def load_config(config_path: Optional[str] = None) -> FileAnalyzerConfig:
     Returns:
         Configuration instance
     """
-    if config_path and Path(config_path).exists():
-        config = FileAnalyzerConfig.load_from_file(config_path)
-    else:
+    config = None
+    if config_path:
+        config = _load_config_file(Path(config_path))
+    
+    if config is None:
         # Try to load from default locations
-        default_paths = [
-            'file_analyzer_config.json',
-            '~/.file_analyzer_config.json',
-            '/etc/file_analyzer_config.json'
-        ]
-        
-        config = None
-        for path in default_paths:
-            expanded_path = Path(path).expanduser()
-            if expanded_path.exists():
-                config = FileAnalyzerConfig.load_from_file(str(expanded_path))
-                break
+        config = _load_default_config_file()
         
         if config is None:
             # Load from environment variables
             config = FileAnalyzerConfig.load_from_env()
+            _validate_config(config)
     
-    # Validate configuration
-    errors = config.validate()
-    if errors:
-        logger.warning(f"Configuration validation errors: {errors}")
-    
-    return config
\ No newline at end of file
+    return config
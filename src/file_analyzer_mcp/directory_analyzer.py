@@ -6,19 +6,77 @@ file counting, size calculation, language distribution, and directory structure
 mapping with .gitignore support.
 """
 
+import copy
 import os
+import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import logging
 import fnmatch
+from collections import Counter, OrderedDict
 
 from .models import DirectoryAnalysis, DirectoryTree
-from .filesystem import FileSystemManager
-from .language_detector import LanguageDetector
+from .filesystem import is_racy_mtime, shared_fs_manager
+from .language_detector import shared_language_detector
 
 logger = logging.getLogger(__name__)
 
+# (size, mtime_ns) of a path, or None when it cannot be stat'ed
+PathSignature = Optional[Tuple[int, int]]
+
+
+def _path_signature(path) -> PathSignature:
+    """Get the size and modification time used to detect changes to a path."""
+    try:
+        stat_info = os.stat(path)
+    except OSError:
+        return None
+    return stat_info.st_size, stat_info.st_mtime_ns
+
+
+# Characters that make a shell pattern more than a literal name
+_GLOB_CHARS = frozenset('*?[')
+
+
+def _compile_fnmatch_alternation(patterns: List[str]) -> Optional[re.Pattern]:
+    """Compile shell patterns into one regex that matches like any of them, or None if empty."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in sorted(patterns)))
+
+
+class _ScanFrame:
+    """A scanned directory whose subdirectories may still be pending."""
+    
+    __slots__ = ('path', 'children', 'subdirs', 'size', 'index')
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.children: List[Optional[DirectoryTree]] = []  # None held in place for subdirectories
+        self.subdirs: List[Tuple[int, Path, bool]] = []  # (children index, path, collect files)
+        self.size = 0
+        self.index = 0  # Position in the parent's children
+    
+    def attach(self, index: int, subtree: Optional[DirectoryTree]):
+        """Fill a subdirectory's placeholder and add its size."""
+        if subtree is not None:
+            self.size += subtree.size
+            self.children[index] = subtree
+    
+    def to_tree(self) -> DirectoryTree:
+        """Build the tree node, leaving out skipped subdirectories."""
+        return DirectoryTree(
+            name=self.path.name,
+            path=str(self.path),
+            is_directory=True,
+            size=self.size,
+            children=[child for child in self.children if child is not None]
+        )
+
 
 class DirectoryAnalyzer:
     """
@@ -31,9 +89,24 @@ class DirectoryAnalyzer:
     
     def __init__(self):
         """Initialize the directory analyzer."""
-        self.fs_manager = FileSystemManager()
-        self.language_detector = LanguageDetector()
+        self.fs_manager = shared_fs_manager()
+        self.language_detector = shared_language_detector()
         self.gitignore_patterns = set()
+        self._ignore_literals: Optional[frozenset] = None  # Patterns without wildcards
+        self._ignore_re: Optional[re.Pattern] = None  # Compiled from the other patterns
+        self._ignore_dir_re: Optional[re.Pattern] = None  # Patterns ending in '/'
+        self.read_batch_size = 256  # Files per header prefetch batch
+        self.max_workers = min(32, (os.cpu_count() or 1) * 4)  # Threads per directory walk
+        self._file_sizes: Dict[Path, int] = {}  # Sizes seen by the last traversal
+        self._signatures: Dict[str, PathSignature] = {}  # Paths seen by the last traversal
+        
+        # Recent analyses with the signatures of every directory and file they
+        # covered; a directory's mtime changes whenever entries are added,
+        # removed or renamed, so unchanged signatures mean no rescan is needed
+        self.analysis_cache_size = 16
+        self._analysis_cache: "OrderedDict[tuple, Tuple[DirectoryAnalysis, Dict[str, PathSignature]]]" = OrderedDict()
+        # gitignore_patterns is per-analysis state, so analyses run one at a time
+        self._lock = threading.Lock()
     
     def analyze_directory(self, directory_path: str, recursive: bool = True, 
                          filters: Optional[List[str]] = None) -> DirectoryAnalysis:
@@ -48,6 +121,37 @@ class DirectoryAnalyzer:
         Returns:
             Complete directory analysis
         """
+        with self._lock:
+            return self._analyze_directory(directory_path, recursive, filters)
+    
+    def list_files(self, directory_path: str, recursive: bool = True,
+                   filters: Optional[List[str]] = None) -> List[Path]:
+        """
+        List the files a directory analysis would cover.
+        
+        Args:
+            directory_path: Path to the directory
+            recursive: Whether to include subdirectories
+            filters: Optional list of file extensions to include
+            
+        Returns:
+            List of readable, non-ignored file paths
+            
+        Raises:
+            ValueError: If the path is invalid or not a directory
+        """
+        with self._lock:
+            path_obj = self.fs_manager.validate_path(directory_path)
+            
+            if not path_obj.is_dir():
+                raise ValueError(f"Path is not a directory: {directory_path}")
+            
+            self._load_gitignore_patterns(path_obj)
+            return self.traverse_directory(path_obj, recursive, filters)
+    
+    def _analyze_directory(self, directory_path: str, recursive: bool,
+                           filters: Optional[List[str]]) -> DirectoryAnalysis:
+        """Analyze a directory; the caller must hold the analyzer lock."""
         start_time = time.time()
         errors = []
         
@@ -58,11 +162,20 @@ class DirectoryAnalyzer:
             if not path_obj.is_dir():
                 raise ValueError(f"Path is not a directory: {directory_path}")
             
+            # Reuse the previous analysis if nothing it covered has changed
+            cache_key = (str(path_obj), recursive, tuple(filters) if filters else None)
+            cached = self._get_cached_analysis(cache_key)
+            if cached is not None:
+                return cached
+            
             # Load .gitignore patterns
+            gitignore_signature = _path_signature(path_obj / '.gitignore')
             self._load_gitignore_patterns(path_obj)
             
-            # Traverse directory
-            files = self.traverse_directory(path_obj, recursive, filters)
+            # Collect the files and build the directory structure in one walk
+            files, structure = self._walk_directory(path_obj, recursive, filters, build_tree=True)
+            signatures = self._signatures
+            signatures[str(path_obj / '.gitignore')] = gitignore_signature
             
             # Count file types and languages
             file_types, languages = self.count_file_types(files)
@@ -70,12 +183,9 @@ class DirectoryAnalyzer:
             # Calculate total size
             total_size = self.calculate_total_size(files)
             
-            # Build directory structure
-            structure = self._build_directory_tree(path_obj, recursive, filters)
-            
             analysis_time = time.time() - start_time
             
-            return DirectoryAnalysis(
+            analysis = DirectoryAnalysis(
                 directory_path=str(path_obj),
                 total_files=len(files),
                 file_types=file_types,
@@ -85,6 +195,8 @@ class DirectoryAnalyzer:
                 analysis_time=analysis_time,
                 errors=errors
             )
+            self._store_cached_analysis(cache_key, analysis, signatures)
+            return analysis
             
         except Exception as e:
             errors.append(str(e))
@@ -101,6 +213,40 @@ class DirectoryAnalyzer:
                 errors=errors
             )
     
+    def clear_cache(self):
+        """Drop all cached directory analyses."""
+        with self._lock:
+            self._analysis_cache.clear()
+    
+    def _get_cached_analysis(self, key: tuple) -> Optional[DirectoryAnalysis]:
+        """Return a copy of a still-valid cached analysis, or None."""
+        cached = self._analysis_cache.get(key)
+        if cached is None:
+            return None
+        
+        analysis, signatures = cached
+        for path, signature in signatures.items():
+            if _path_signature(path) != signature:
+                del self._analysis_cache[key]
+                return None
+        
+        self._analysis_cache.move_to_end(key)
+        return copy.deepcopy(analysis)
+    
+    def _store_cached_analysis(self, key: tuple, analysis: DirectoryAnalysis,
+                               signatures: Dict[str, PathSignature]):
+        """Cache an analysis, evicting the least recently used entry if full."""
+        # A path changed twice within the racy window keeps its signature,
+        # so the analysis could not be invalidated reliably
+        if any(signature is not None and is_racy_mtime(signature[1])
+               for signature in signatures.values()):
+            return
+        
+        self._analysis_cache[key] = (copy.deepcopy(analysis), signatures)
+        self._analysis_cache.move_to_end(key)
+        while len(self._analysis_cache) > self.analysis_cache_size:
+            self._analysis_cache.popitem(last=False)
+    
     def traverse_directory(self, directory_path: Path, recursive: bool = True,
                           filters: Optional[List[str]] = None) -> List[Path]:
         """
@@ -114,45 +260,237 @@ class DirectoryAnalyzer:
         Returns:
             List of file paths
         """
+        files, _ = self._walk_directory(directory_path, recursive, filters, build_tree=False)
+        return files
+    
+    def _walk_directory(self, directory_path: Path, recursive: bool,
+                        filters: Optional[List[str]],
+                        build_tree: bool) -> Tuple[List[Path], Optional[DirectoryTree]]:
+        """
+        Collect file paths and, optionally, the directory tree in one walk.
+        
+        Args:
+            directory_path: Directory to traverse
+            recursive: Whether to traverse subdirectories
+            filters: Optional file extension filters
+            build_tree: Whether to build the DirectoryTree as well
+            
+        Returns:
+            Tuple of (file paths, directory tree or None)
+        """
         files = []
+        tree = None
+        suffixes = tuple(filters) if filters else None  # str.endswith takes a tuple
+        self._file_sizes = {}
+        self._signatures = {}
         
         try:
             if recursive:
-                for root, dirs, filenames in os.walk(directory_path):
-                    root_path = Path(root)
-                    
-                    # Filter out ignored directories
-                    dirs[:] = [d for d in dirs if not self._should_ignore(root_path / d)]
-                    
-                    for filename in filenames:
-                        file_path = root_path / filename
-                        
-                        # Skip ignored files
-                        if self._should_ignore(file_path):
-                            continue
-                        
-                        # Apply extension filters
-                        if filters and not any(filename.endswith(ext) for ext in filters):
-                            continue
-                        
-                        # Check permissions
-                        if self.fs_manager.check_permissions(file_path):
-                            files.append(file_path)
+                # Subtrees are scanned concurrently; the scans mostly wait on syscalls
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    tree = self._scan_tree(directory_path, recursive, suffixes, files,
+                                           build_tree, executor=executor)
             else:
-                # Non-recursive: only direct children
-                for item in directory_path.iterdir():
-                    if item.is_file() and not self._should_ignore(item):
-                        # Apply extension filters
-                        if filters and not any(item.name.endswith(ext) for ext in filters):
-                            continue
-                        
-                        if self.fs_manager.check_permissions(item):
-                            files.append(item)
-                            
+                tree = self._scan_tree(directory_path, recursive, suffixes, files, build_tree)
         except Exception as e:
             logger.error(f"Error traversing directory {directory_path}: {e}")
         
-        return files
+        if build_tree and tree is None:
+            tree = self._empty_tree(directory_path)
+        
+        return files, tree
+    
+    def _scan_tree(self, directory_path: Path, recursive: bool,
+                   suffixes: Optional[Tuple[str, ...]], files: List[Path],
+                   build_tree: bool, collect: bool = True,
+                   executor: Optional[ThreadPoolExecutor] = None) -> Optional[DirectoryTree]:
+        """
+        Collect files below a directory and optionally build its tree.
+        
+        The walk keeps an explicit stack of partly scanned directories instead
+        of recursing, so deep trees cost no Python frames. Each directory's
+        files are collected before its subdirectories are descended, giving the
+        same top-down order as os.walk. Symlinked directories are not followed
+        for files; the tree does include them, so they are scanned for the
+        tree only.
+        
+        Args:
+            directory_path: Directory to scan
+            recursive: Whether to descend into subdirectories
+            suffixes: Optional tuple of file extension filters
+            files: List the accepted file paths are appended to
+            build_tree: Whether to build the DirectoryTree for this directory
+            collect: Whether to collect files (False below symlinked directories)
+            executor: Optional pool the top-level subdirectories are scanned
+                on; their files are merged back in order
+            
+        Returns:
+            Tree for this directory if build_tree is set, otherwise None
+            
+        Raises:
+            OSError: If directory_path itself cannot be listed
+        """
+        root = self._scan_entries(directory_path, recursive, suffixes, files, build_tree, collect)
+        
+        if executor is not None and len(root.subdirs) > 1:
+            scans = []
+            for index, subdir, collect_subdir in root.subdirs:
+                subdir_files = []
+                future = executor.submit(self._scan_tree, subdir, recursive, suffixes,
+                                         subdir_files, build_tree, collect_subdir)
+                scans.append((index, subdir, future, subdir_files))
+            
+            for index, subdir, future, subdir_files in scans:
+                try:
+                    subtree = future.result()
+                except OSError as e:
+                    # Unreadable directories are left out of the tree entirely
+                    logger.debug(f"Skipping unreadable directory {subdir}: {e}")
+                    continue
+                except Exception as e:
+                    logger.error(f"Error building directory tree for {subdir}: {e}")
+                    subtree = self._empty_tree(subdir) if build_tree else None
+                else:
+                    files.extend(subdir_files)
+                root.attach(index, subtree)
+            
+            return root.to_tree() if build_tree else None
+        
+        # Depth-first: descend into the next pending subdirectory of the
+        # innermost directory, and attach a directory to its parent once all
+        # of its own subdirectories are done
+        stack = [(root, iter(root.subdirs))]
+        while stack:
+            frame, pending = stack[-1]
+            for index, subdir, collect_subdir in pending:
+                try:
+                    child = self._scan_entries(subdir, recursive, suffixes, files,
+                                               build_tree, collect_subdir)
+                except OSError as e:
+                    # Unreadable directories are left out of the tree entirely
+                    logger.debug(f"Skipping unreadable directory {subdir}: {e}")
+                    continue
+                except Exception as e:
+                    logger.error(f"Error building directory tree for {subdir}: {e}")
+                    frame.attach(index, self._empty_tree(subdir) if build_tree else None)
+                    continue
+                
+                child.index = index
+                stack.append((child, iter(child.subdirs)))
+                break
+            else:
+                stack.pop()
+                if stack and build_tree:
+                    stack[-1][0].attach(frame.index, frame.to_tree())
+        
+        return root.to_tree() if build_tree else None
+    
+    def _scan_entries(self, directory_path: Path, recursive: bool,
+                      suffixes: Optional[Tuple[str, ...]], files: List[Path],
+                      build_tree: bool, collect: bool) -> '_ScanFrame':
+        """
+        Collect the files of one directory with os.scandir.
+        
+        Entry types and sizes come from the DirEntry objects, which avoids a
+        separate stat call per type check. Subdirectories are only recorded
+        on the returned frame; _scan_tree descends into them.
+        
+        Args:
+            directory_path: Directory to scan
+            recursive: Whether subdirectories will be descended
+            suffixes: Optional tuple of file extension filters
+            files: List the accepted file paths are appended to
+            build_tree: Whether to create tree nodes for the files
+            collect: Whether to collect files
+            
+        Returns:
+            Frame with the file nodes, size and pending subdirectories
+        """
+        frame = _ScanFrame(directory_path)
+        children = frame.children
+        subdirs = frame.subdirs
+        dir_size = 0
+        directory_str = str(directory_path)
+        
+        # Taken before listing so changes made during the scan are noticed
+        if collect:
+            self._signatures[directory_str] = _path_signature(directory_str)
+        
+        with os.scandir(directory_str) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    if recursive and not self._is_ignored(entry.name, entry.path, entry.is_dir):
+                        is_symlink = entry.is_symlink()
+                        if build_tree or not is_symlink:
+                            subdirs.append((len(children), directory_path / entry.name,
+                                            collect and not is_symlink))
+                            children.append(None)
+                    continue
+                
+                # Non-recursive scans and the tree only list regular files
+                is_file = entry.is_file()
+                if not is_file and not (recursive and collect):
+                    continue
+                
+                # Apply extension filters first; one C-level endswith rejects
+                # most entries of a filtered walk before the ignore regexes
+                if suffixes and not entry.name.endswith(suffixes):
+                    continue
+                
+                # Skip ignored files
+                if self._is_ignored(entry.name, entry.path, entry.is_dir):
+                    continue
+                
+                # Check permissions
+                if not self.fs_manager.check_read_access(entry.path):
+                    continue
+                
+                entry_path = directory_path / entry.name
+                
+                try:
+                    stat_info = entry.stat()
+                except OSError as e:
+                    stat_info = None
+                    if build_tree and is_file:
+                        logger.error(f"Error getting file info for {entry_path}: {e}")
+                
+                if collect:
+                    files.append(entry_path)
+                    if stat_info is None:
+                        self._signatures[entry.path] = None
+                    else:
+                        self._file_sizes[entry_path] = stat_info.st_size
+                        self._signatures[entry.path] = (stat_info.st_size, stat_info.st_mtime_ns)
+                
+                if build_tree and is_file:
+                    file_size = stat_info.st_size if stat_info is not None else 0
+                    dir_size += file_size
+                    children.append(DirectoryTree(
+                        name=entry.name,
+                        path=entry.path,
+                        is_directory=False,
+                        size=file_size,
+                        children=[]
+                    ))
+        
+        frame.size = dir_size
+        return frame
+    
+    @staticmethod
+    def _empty_tree(directory_path: Path) -> DirectoryTree:
+        """Tree node reported for a directory whose contents could not be read."""
+        return DirectoryTree(
+            name=directory_path.name,
+            path=str(directory_path),
+            is_directory=True,
+            size=0,
+            children=[]
+        )
     
     def count_file_types(self, files: List[Path]) -> Tuple[Dict[str, int], Dict[str, int]]:
         """
@@ -164,23 +502,52 @@ class DirectoryAnalyzer:
         Returns:
             Tuple of (file_types_dict, languages_dict)
         """
-        file_types = {}
-        languages = {}
+        # Gather one column of extensions and one of languages, then count
+        # each column in a single C-level pass instead of per-file dict updates
+        extensions = []
+        file_languages = []
         
-        for file_path in files:
-            try:
-                # Count by extension
-                extension = file_path.suffix.lower() or 'no_extension'
-                file_types[extension] = file_types.get(extension, 0) + 1
+        for start in range(0, len(files), self.read_batch_size):
+            batch = files[start:start + self.read_batch_size]
+            batch_languages = []
+            unresolved = []
+            
+            # The name and extension decide most files with two dict lookups;
+            # only the rest go through the full detector
+            for file_path in batch:
+                # Interned so the few distinct extensions are shared objects
+                # in the column, the counts and cached analyses
+                extension = sys.intern(file_path.suffix.lower())
+                extensions.append(extension or 'no_extension')
                 
-                # Count by language
-                file_type_info = self.language_detector.get_file_type_info(file_path)
-                language = file_type_info['language']
-                if language != 'unknown':
-                    languages[language] = languages.get(language, 0) + 1
-                    
-            except Exception as e:
-                logger.warning(f"Error analyzing file type for {file_path}: {e}")
+                language = self.language_detector.detect_by_name(file_path.name, extension)
+                if language is None:
+                    unresolved.append((len(batch_languages), file_path))
+                batch_languages.append(language)
+            
+            # Prefetch, in one pass, the header bytes of the files whose
+            # name does not already determine their type
+            headers = self.fs_manager.batch_read(
+                [file_path for _, file_path in unresolved
+                 if self.language_detector.needs_content_sniff(file_path)]
+            )
+            
+            for index, file_path in unresolved:
+                try:
+                    file_type_info = self.language_detector.get_file_type_info(
+                        file_path, header=headers.get(file_path)
+                    )
+                    batch_languages[index] = file_type_info['language']
+                except Exception as e:
+                    logger.warning(f"Error analyzing file type for {file_path}: {e}")
+            
+            file_languages.extend(
+                language for language in batch_languages
+                if language is not None and language != 'unknown'
+            )
+        
+        file_types = dict(Counter(extensions))
+        languages = dict(Counter(file_languages))
         
         return file_types, languages
     
@@ -197,79 +564,19 @@ class DirectoryAnalyzer:
         total_size = 0
         
         for file_path in files:
+            # Reuse sizes already stat'ed during traversal
+            size = self._file_sizes.get(file_path)
+            if size is not None:
+                total_size += size
+                continue
+            
             try:
-                file_info = self.fs_manager.get_file_info(file_path)
-                total_size += file_info.get('size', 0)
-            except Exception as e:
+                total_size += os.stat(file_path).st_size
+            except OSError as e:
                 logger.warning(f"Error getting size for {file_path}: {e}")
         
         return total_size
     
-    def _build_directory_tree(self, directory_path: Path, recursive: bool = True,
-                             filters: Optional[List[str]] = None) -> DirectoryTree:
-        """
-        Build a hierarchical directory tree structure.
-        
-        Args:
-            directory_path: Root directory
-            recursive: Whether to include subdirectories
-            filters: Optional file extension filters
-            
-        Returns:
-            Directory tree structure
-        """
-        try:
-            children = []
-            
-            # Get directory size
-            dir_size = 0
-            
-            for item in directory_path.iterdir():
-                if self._should_ignore(item):
-                    continue
-                
-                if item.is_file():
-                    # Apply extension filters
-                    if filters and not any(item.name.endswith(ext) for ext in filters):
-                        continue
-                    
-                    if self.fs_manager.check_permissions(item):
-                        file_info = self.fs_manager.get_file_info(item)
-                        file_size = file_info.get('size', 0)
-                        dir_size += file_size
-                        
-                        children.append(DirectoryTree(
-                            name=item.name,
-                            path=str(item),
-                            is_directory=False,
-                            size=file_size,
-                            children=[]
-                        ))
-                
-                elif item.is_dir() and recursive:
-                    if self.fs_manager.check_permissions(item):
-                        subtree = self._build_directory_tree(item, recursive, filters)
-                        dir_size += subtree.size
-                        children.append(subtree)
-            
-            return DirectoryTree(
-                name=directory_path.name,
-                path=str(directory_path),
-                is_directory=True,
-                size=dir_size,
-                children=children
-            )
-            
-        except Exception as e:
-            logger.error(f"Error building directory tree for {directory_path}: {e}")
-            return DirectoryTree(
-                name=directory_path.name,
-                path=str(directory_path),
-                is_directory=True,
-                size=0,
-                children=[]
-            )
-    
     def _load_gitignore_patterns(self, directory_path: Path):
         """
         Load .gitignore patterns from the directory.
@@ -314,6 +621,27 @@ class DirectoryAnalyzer:
             'build',
             '*.egg-info'
         })
+        self._compile_ignore_patterns()
+    
+    def _compile_ignore_patterns(self):
+        """
+        Compile gitignore_patterns into single alternations for _should_ignore.
+        
+        Each pattern is translated exactly as fnmatch.fnmatch would, so one
+        regex match replaces a Python-level fnmatch call per pattern. Patterns
+        without wildcards, like most of the defaults, only match equal strings
+        and are kept in a set instead.
+        """
+        patterns = [os.path.normcase(pattern) for pattern in self.gitignore_patterns]
+        self._ignore_literals = frozenset(
+            pattern for pattern in patterns if not _GLOB_CHARS.intersection(pattern)
+        )
+        self._ignore_re = _compile_fnmatch_alternation(
+            [pattern for pattern in patterns if pattern not in self._ignore_literals]
+        )
+        self._ignore_dir_re = _compile_fnmatch_alternation(
+            [pattern[:-1] for pattern in patterns if pattern.endswith('/')]
+        )
     
     def _should_ignore(self, path: Path) -> bool:
         """
@@ -325,21 +653,40 @@ class DirectoryAnalyzer:
         Returns:
             True if path should be ignored
         """
-        path_str = str(path)
-        name = path.name
+        return self._is_ignored(path.name, str(path), path.is_dir)
+    
+    def _is_ignored(self, name: str, path_str: str, is_dir: Callable[[], bool]) -> bool:
+        """
+        Check a name and path string against the .gitignore patterns.
         
-        for pattern in self.gitignore_patterns:
-            # Direct name match
-            if fnmatch.fnmatch(name, pattern):
-                return True
-            
-            # Path match
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
+        The directory walk passes the DirEntry's name, path and cached is_dir
+        method, so no Path object is built for entries that end up ignored.
+        
+        Args:
+            name: Final path component
+            path_str: Full path as a string
+            is_dir: Called only when a directory-only pattern matches the name
             
-            # Directory pattern (ends with /)
-            if pattern.endswith('/') and path.is_dir():
-                if fnmatch.fnmatch(name, pattern[:-1]):
-                    return True
+        Returns:
+            True if the path should be ignored
+        """
+        if self._ignore_literals is None:
+            self._compile_ignore_patterns()
+        
+        name = os.path.normcase(name)
+        path_str = os.path.normcase(path_str)
+        
+        # Direct name match, then path match
+        literals = self._ignore_literals
+        if name in literals or path_str in literals:
+            return True
+        
+        ignore_re = self._ignore_re
+        if ignore_re is not None and (ignore_re.match(name) or ignore_re.match(path_str)):
+            return True
+        
+        # Directory pattern (ends with /)
+        if self._ignore_dir_re is not None and self._ignore_dir_re.match(name):
+            return is_dir()
         
         return False
\ No newline at end of file
@@ -5,14 +5,25 @@ This module defines custom exception classes and error handling utilities
 for different types of errors that can occur during file analysis.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class FileAnalyzerError(Exception):
-    """Base exception class for File Analyzer errors."""
+    """
+    Base exception class for File Analyzer errors.
+    
+    Attributes live in __slots__, so raising an error does not allocate an
+    instance __dict__; subclasses declare slots for their own attributes.
+    Unless explicit details are given, the details dict is built from the
+    attributes named in _DETAIL_KEYS the first time it is read.
+    """
+    
+    __slots__ = ('message', 'error_code', '_details')
+    
+    _DETAIL_KEYS: Tuple[str, ...] = ()
     
     def __init__(self, message: str, error_code: str = "GENERAL_ERROR", 
                  details: Optional[Dict[str, Any]] = None):
@@ -27,7 +38,32 @@ class FileAnalyzerError(Exception):
         super().__init__(message)
         self.message = message
         self.error_code = error_code
-        self.details = details or {}
+        self._details = details or None
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Additional error details, built on first access."""
+        if self._details is None:
+            self._details = {key: getattr(self, key) for key in self._DETAIL_KEYS}
+        return self._details
+    
+    @details.setter
+    def details(self, value: Dict[str, Any]):
+        self._details = value
+    
+    def __reduce__(self):
+        """Pickle the slot attributes, which BaseException's reduce leaves out."""
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get('__slots__', ())
+        }
+        return type(self), self.args, state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the slot attributes saved by __reduce__."""
+        for name, value in state.items():
+            setattr(self, name, value)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary representation."""
@@ -42,15 +78,22 @@ class FileAnalyzerError(Exception):
 class FileSystemError(FileAnalyzerError):
     """Errors related to file system operations."""
     
+    __slots__ = ('file_path',)
+    
+    _DETAIL_KEYS = ('file_path',)
+    
     def __init__(self, message: str, file_path: Optional[str] = None, 
-                 error_code: str = "FILESYSTEM_ERROR"):
-        super().__init__(message, error_code, {"file_path": file_path})
+                 error_code: str = "FILESYSTEM_ERROR",
+                 details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, error_code, details)
         self.file_path = file_path
 
 
 class PathValidationError(FileSystemError):
     """Errors related to path validation and security."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, file_path: Optional[str] = None):
         super().__init__(message, file_path, "PATH_VALIDATION_ERROR")
 
@@ -58,6 +101,8 @@ class PathValidationError(FileSystemError):
 class PermissionError(FileSystemError):
     """Errors related to file permissions."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, file_path: Optional[str] = None):
         super().__init__(message, file_path, "PERMISSION_ERROR")
 
@@ -65,19 +110,27 @@ class PermissionError(FileSystemError):
 class FileSizeError(FileSystemError):
     """Errors related to file size limits."""
     
+    __slots__ = ('file_size', 'max_size')
+    
+    _DETAIL_KEYS = ('file_path', 'file_size', 'max_size')
+    
     def __init__(self, message: str, file_path: Optional[str] = None, 
                  file_size: Optional[int] = None, max_size: Optional[int] = None):
-        details = {"file_path": file_path, "file_size": file_size, "max_size": max_size}
         super().__init__(message, file_path, "FILE_SIZE_ERROR")
-        self.details.update(details)
+        self.file_size = file_size
+        self.max_size = max_size
 
 
 class AnalysisError(FileAnalyzerError):
     """Errors related to code analysis operations."""
     
+    __slots__ = ('file_path', 'language')
+    
+    _DETAIL_KEYS = ('file_path', 'language')
+    
     def __init__(self, message: str, file_path: Optional[str] = None, 
-                 language: Optional[str] = None, error_code: str = "ANALYSIS_ERROR"):
-        details = {"file_path": file_path, "language": language}
+                 language: Optional[str] = None, error_code: str = "ANALYSIS_ERROR",
+                 details: Optional[Dict[str, Any]] = None):
         super().__init__(message, error_code, details)
         self.file_path = file_path
         self.language = language
@@ -86,20 +139,26 @@ class AnalysisError(FileAnalyzerError):
 class SyntaxAnalysisError(AnalysisError):
     """Errors related to syntax parsing."""
     
+    __slots__ = ('line_number',)
+    
+    _DETAIL_KEYS = ('file_path', 'language', 'line_number')
+    
     def __init__(self, message: str, file_path: Optional[str] = None, 
                  language: Optional[str] = None, line_number: Optional[int] = None):
         super().__init__(message, file_path, language, "SYNTAX_ERROR")
-        self.details["line_number"] = line_number
         self.line_number = line_number
 
 
 class EncodingError(FileAnalyzerError):
     """Errors related to file encoding detection and handling."""
     
+    __slots__ = ('file_path', 'encoding')
+    
+    _DETAIL_KEYS = ('file_path', 'encoding')
+    
     def __init__(self, message: str, file_path: Optional[str] = None, 
                  encoding: Optional[str] = None):
-        details = {"file_path": file_path, "encoding": encoding}
-        super().__init__(message, "ENCODING_ERROR", details)
+        super().__init__(message, "ENCODING_ERROR")
         self.file_path = file_path
         self.encoding = encoding
 
@@ -107,10 +166,13 @@ class EncodingError(FileAnalyzerError):
 class SearchError(FileAnalyzerError):
     """Errors related to file and content search operations."""
     
+    __slots__ = ('pattern', 'search_type')
+    
+    _DETAIL_KEYS = ('pattern', 'search_type')
+    
     def __init__(self, message: str, pattern: Optional[str] = None, 
                  search_type: Optional[str] = None):
-        details = {"pattern": pattern, "search_type": search_type}
-        super().__init__(message, "SEARCH_ERROR", details)
+        super().__init__(message, "SEARCH_ERROR")
         self.pattern = pattern
         self.search_type = search_type
 
@@ -118,8 +180,11 @@ class SearchError(FileAnalyzerError):
 class ConfigurationError(FileAnalyzerError):
     """Errors related to configuration loading and validation."""
     
+    __slots__ = ('config_path', 'validation_errors')
+    
     def __init__(self, message: str, config_path: Optional[str] = None, 
                  validation_errors: Optional[List[str]] = None):
+        # Details report validation_errors as given; the attribute defaults to []
         details = {"config_path": config_path, "validation_errors": validation_errors}
         super().__init__(message, "CONFIGURATION_ERROR", details)
         self.config_path = config_path
@@ -129,10 +194,13 @@ class ConfigurationError(FileAnalyzerError):
 class MCPError(FileAnalyzerError):
     """Errors related to MCP protocol operations."""
     
+    __slots__ = ('tool_name', 'request_id')
+    
+    _DETAIL_KEYS = ('tool_name', 'request_id')
+    
     def __init__(self, message: str, tool_name: Optional[str] = None, 
                  request_id: Optional[str] = None):
-        details = {"tool_name": tool_name, "request_id": request_id}
-        super().__init__(message, "MCP_ERROR", details)
+        super().__init__(message, "MCP_ERROR")
         self.tool_name = tool_name
         self.request_id = request_id
 
@@ -164,9 +232,9 @@ class ErrorHandler:
             
             # Log with appropriate level
             if isinstance(error, (PathValidationError, PermissionError)):
-                self.logger.warning(f"{error.error_code}: {error.message}")
+                self.logger.warning("%s: %s", error.error_code, error.message)
             else:
-                self.logger.error(f"{error.error_code}: {error.message}")
+                self.logger.error("%s: %s", error.error_code, error.message)
             
             return error_dict
         else:
@@ -179,12 +247,13 @@ class ErrorHandler:
                 "context": context
             }
             
-            self.logger.error(f"Unhandled error: {error}", exc_info=True)
+            self.logger.error("Unhandled error: %s", error, exc_info=True)
             return error_dict
     
     def handle_partial_failure(self, operation: str, total_items: int, 
                              failed_items: List[Dict[str, Any]], 
-                             errors: List[Exception]) -> Dict[str, Any]:
+                             errors: List[Exception],
+                             serialize_errors: bool = True) -> Dict[str, Any]:
         """
         Handle partial failures in batch operations.
         
@@ -193,6 +262,9 @@ class ErrorHandler:
             total_items: Total number of items processed
             failed_items: List of items that failed
             errors: List of errors that occurred
+            serialize_errors: Whether to log each error and convert it to a
+                dictionary; callers that only need the counts can pass False
+                to keep the raw exceptions and skip that work
             
         Returns:
             Partial failure summary
@@ -207,12 +279,13 @@ class ErrorHandler:
             "failure_count": failure_count,
             "success_rate": success_count / total_items if total_items > 0 else 0,
             "failed_items": failed_items,
-            "errors": [self.handle_error(error) for error in errors]
+            "errors": [self.handle_error(error) for error in errors] if serialize_errors else list(errors)
         }
         
         if failure_count > 0:
+            # Lazy %-formatting; the message is only built if the record is emitted
             self.logger.warning(
-                f"Partial failure in {operation}: {success_count}/{total_items} succeeded"
+                "Partial failure in %s: %d/%d succeeded", operation, success_count, total_items
             )
         
         return summary
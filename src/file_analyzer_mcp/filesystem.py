@@ -5,14 +5,93 @@ This module provides secure file system access with path validation,
 permission checking, and streaming capabilities for large files.
 """
 
+import codecs
+import mmap
 import os
 import stat
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional, List
+from typing import Callable, Dict, Iterator, Optional, List, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Byte-order marks, longest first so UTF-32 LE is not mistaken for UTF-16 LE
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Files and directories modified this recently are not cached: a change
+# within the same timestamp tick would leave their mtime unchanged
+RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+
+def is_racy_mtime(mtime_ns: int) -> bool:
+    """
+    Check whether an mtime is too recent to key a cache entry on.
+    
+    Args:
+        mtime_ns: Modification time in nanoseconds
+        
+    Returns:
+        True if the mtime falls within the racy window
+    """
+    return mtime_ns >= time.time_ns() - RACY_MTIME_WINDOW_NS
+
+
+@lru_cache(maxsize=None)
+def _encoding_guesser() -> Optional[Callable[[bytes], Optional[str]]]:
+    """
+    Import the optional statistical encoding detector once.
+    
+    Returns:
+        Function guessing the encoding of a byte string using
+        charset-normalizer or chardet, or None if neither is installed
+    """
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        pass
+    else:
+        def guess(raw_data: bytes) -> Optional[str]:
+            best = from_bytes(raw_data).best()
+            return best.encoding if best is not None else None
+        return guess
+    
+    try:
+        import chardet
+    except ImportError:
+        return None
+    
+    return lambda raw_data: chardet.detect(raw_data).get('encoding')
+
+
+def _advise_sequential(fd: int):
+    """Tell the kernel a file will be read front to back, where supported."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _advise_mapping_sequential(mapped: mmap.mmap):
+    """Tell the kernel a mapping will be scanned front to back, where supported."""
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        try:
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        except OSError:
+            pass
+
 
 class FileSystemManager:
     """
@@ -30,7 +109,14 @@ class FileSystemManager:
             max_file_size: Maximum file size to process in bytes
         """
         self.max_file_size = max_file_size
-        self.chunk_size = 8192  # 8KB chunks for streaming
+        self.chunk_size = 256 * 1024  # 256KB chunks, in line with disk readahead
+        self.encoding_sample_size = 64 * 1024  # Leading bytes used to detect encoding
+        
+        # LRU cache of resolved parent directories for validate_path; paths
+        # usually share a project root, so only the last component is new
+        self.resolve_cache_size = 512
+        self._resolve_cache: "OrderedDict[str, Path]" = OrderedDict()
+        self._resolve_lock = threading.Lock()
     
     def validate_path(self, path: str) -> Path:
         """
@@ -50,7 +136,7 @@ class FileSystemManager:
         
         # Convert to Path object and resolve
         try:
-            path_obj = Path(path).resolve()
+            path_obj, stat_info = self._resolve(path)
         except (OSError, ValueError) as e:
             raise ValueError(f"Invalid path: {e}")
         
@@ -58,20 +144,71 @@ class FileSystemManager:
         path_str = str(path_obj)
         if '..' in path_str or path_str.startswith('/'):
             # Allow absolute paths but log them
-            logger.warning(f"Absolute path access: {path_str}")
+            logger.warning("Absolute path access: %s", path_str)
         
-        # Check if path exists
-        if not path_obj.exists():
-            raise ValueError(f"Path does not exist: {path_obj}")
+        # Check if path exists; one stat answers the type and size checks too
+        if stat_info is None:
+            try:
+                stat_info = path_obj.stat()
+            except OSError:
+                raise ValueError(f"Path does not exist: {path_obj}")
         
         # Check file size if it's a file
-        if path_obj.is_file():
-            file_size = path_obj.stat().st_size
+        if stat.S_ISREG(stat_info.st_mode):
+            file_size = stat_info.st_size
             if file_size > self.max_file_size:
                 raise ValueError(f"File too large: {file_size} bytes (max: {self.max_file_size})")
         
         return path_obj
     
+    def _resolve(self, path: Union[str, Path]) -> Tuple[Path, Optional[os.stat_result]]:
+        """
+        Resolve a path, reusing the resolved form of its parent directory.
+        
+        The parent is resolved once and cached; the last component is then
+        checked with a single lstat, which also serves as the stat of the
+        result unless it is a symlink.
+        
+        Args:
+            path: The path to resolve
+            
+        Returns:
+            Tuple of the resolved path and its stat result, or None for the
+            stat if the caller still has to stat the resolved path
+        """
+        head, tail = os.path.split(os.fspath(path))
+        if tail in ('', '.', '..'):
+            return Path(path).resolve(), None
+        if not os.path.isabs(head):
+            head = os.path.join(os.getcwd(), head)
+        
+        with self._resolve_lock:
+            parent = self._resolve_cache.get(head)
+            if parent is not None:
+                self._resolve_cache.move_to_end(head)
+        
+        if parent is None:
+            parent = Path(head).resolve()
+            with self._resolve_lock:
+                self._resolve_cache[head] = parent
+                while len(self._resolve_cache) > self.resolve_cache_size:
+                    self._resolve_cache.popitem(last=False)
+        
+        candidate = parent / tail
+        try:
+            stat_info = os.lstat(candidate)
+        except OSError:
+            # Missing paths resolve to themselves, as Path.resolve() does
+            return candidate, None
+        if stat.S_ISLNK(stat_info.st_mode):
+            return candidate.resolve(), None
+        return candidate, stat_info
+    
+    def clear_cache(self):
+        """Drop cached parent directory resolutions, e.g. after symlinks change."""
+        with self._resolve_lock:
+            self._resolve_cache.clear()
+    
     def check_permissions(self, path: Path) -> bool:
         """
         Check if the file/directory is readable.
@@ -83,42 +220,67 @@ class FileSystemManager:
             True if readable, False otherwise
         """
         try:
-            # Check if path exists
-            if not path.exists():
-                logger.error(f"Path does not exist: {path}")
+            # Check if path exists; the same stat tells files from directories
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
+                logger.error("Path does not exist: %s", path)
                 return False
             
             # Check read permissions
             if not os.access(path, os.R_OK):
-                logger.error(f"No read permission for: {path}")
+                logger.error("No read permission for: %s", path)
                 return False
             
-            # For directories, check if we can list contents
-            if path.is_dir():
+            # For directories, check if we can list contents; opening the
+            # listing and reading one entry is enough to prove that
+            if stat.S_ISDIR(mode):
                 try:
-                    list(path.iterdir())
+                    with os.scandir(path) as entries:
+                        next(entries, None)
                 except PermissionError:
-                    logger.error(f"Cannot list directory contents: {path}")
+                    logger.error("Cannot list directory contents: %s", path)
                     return False
             
             # For files, try to open for reading
-            elif path.is_file():
+            elif stat.S_ISREG(mode):
                 try:
                     with open(path, 'rb') as f:
                         f.read(1)  # Try to read one byte
                 except PermissionError:
-                    logger.error(f"Cannot read file: {path}")
+                    logger.error("Cannot read file: %s", path)
                     return False
                 except IOError as e:
-                    logger.error(f"IO error reading file {path}: {e}")
+                    logger.error("IO error reading file %s: %s", path, e)
                     return False
             
             return True
             
         except Exception as e:
-            logger.error(f"Error checking permissions for {path}: {e}")
+            logger.error("Error checking permissions for %s: %s", path, e)
             return False
     
+    def check_read_access(self, path: Union[str, Path]) -> bool:
+        """
+        Check the read permission of a path a directory listing just returned.
+        
+        A cheaper check_permissions for directory walks: the listing already
+        shows the entry exists and what type it is, so one access() call
+        replaces the existence and type stats and the trial open. Read errors
+        other than permissions surface when the file is actually read.
+        
+        Args:
+            path: Path to check
+            
+        Returns:
+            True if readable, False otherwise
+        """
+        if os.access(path, os.R_OK):
+            return True
+        
+        logger.error("No read permission for: %s", path)
+        return False
+    
     def read_file_chunked(self, path: Path, encoding: str = 'utf-8') -> Iterator[str]:
         """
         Read a file in chunks for memory efficiency.
@@ -132,33 +294,18 @@ class FileSystemManager:
             
         Raises:
             IOError: If file cannot be read
-            UnicodeDecodeError: If file cannot be decoded with specified encoding
         """
-        if not self.check_permissions(path):
-            raise IOError(f"Cannot read file: {path}")
-        
+        # No separate permission check: open() reports unreadable files and
+        # the error is re-raised as IOError below. Undecodable bytes become
+        # U+FFFD, so decoding itself never fails.
         try:
             with open(path, 'r', encoding=encoding, errors='replace') as file:
+                _advise_sequential(file.fileno())
                 while True:
                     chunk = file.read(self.chunk_size)
                     if not chunk:
                         break
                     yield chunk
-        except UnicodeDecodeError as e:
-            logger.error(f"Unicode decode error for {path}: {e}")
-            # Try with binary mode and decode with error handling
-            try:
-                with open(path, 'rb') as file:
-                    while True:
-                        chunk = file.read(self.chunk_size)
-                        if not chunk:
-                            break
-                        try:
-                            yield chunk.decode(encoding, errors='replace')
-                        except UnicodeDecodeError:
-                            yield chunk.decode('latin1', errors='replace')
-            except Exception as e:
-                raise IOError(f"Failed to read file {path}: {e}")
         except Exception as e:
             raise IOError(f"Error reading file {path}: {e}")
     
@@ -172,13 +319,97 @@ class FileSystemManager:
             
         Returns:
             Complete file content as string
+            
+        Raises:
+            IOError: If file cannot be read
         """
-        return ''.join(self.read_file_chunked(path, encoding))
+        # The whole file is wanted, so one read replaces the chunk loop
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+            return self.decode_content(data, encoding)
+        except Exception as e:
+            raise IOError(f"Error reading file {path}: {e}")
+    
+    @contextmanager
+    def map_file(self, path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+        """
+        Memory-map a file for read-only access.
+        
+        The mapping lets callers scan or decode the file straight from the
+        page cache instead of copying it through buffered reads first; it is
+        advised as sequential, so the kernel reads ahead aggressively.
+        Empty files cannot be mapped, so they yield an empty bytes object.
+        
+        Args:
+            path: Path to the file to map
+            
+        Yields:
+            Read-only buffer with the file content
+            
+        Raises:
+            IOError: If file cannot be opened or mapped
+        """
+        try:
+            file = open(path, 'rb')
+        except OSError as e:
+            raise IOError(f"Cannot read file {path}: {e}")
+        
+        with file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b''
+                return
+            
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                raise IOError(f"Cannot map file {path}: {e}")
+            
+            with mapped:
+                _advise_mapping_sequential(mapped)
+                yield mapped
+    
+    def decode_content(self, data: Union[mmap.mmap, bytes], encoding: str = 'utf-8') -> str:
+        """
+        Decode raw file content the same way text-mode reads do.
+        
+        Args:
+            data: Raw file content (bytes or a mapped buffer)
+            encoding: File encoding to use
+            
+        Returns:
+            Decoded content with universal newlines
+        """
+        content = str(data, encoding, 'replace')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    def has_ascii_newlines(self, encoding: str) -> bool:
+        """
+        Check if an encoding stores line breaks as single ASCII bytes.
+        
+        Args:
+            encoding: Encoding name
+            
+        Returns:
+            True if newlines can be counted on the raw bytes
+        """
+        try:
+            name = codecs.lookup(encoding).name
+        except LookupError:
+            return False
+        return not name.startswith(('utf-16', 'utf-32'))
     
     def detect_encoding(self, path: Path) -> str:
         """
         Detect file encoding.
         
+        A byte-order mark decides the encoding outright; otherwise the leading
+        bytes are validated as UTF-8, which covers most source files without
+        running a statistical detector. Only samples that are not valid UTF-8
+        are handed to charset-normalizer or chardet, when installed.
+        
         Args:
             path: Path to the file
             
@@ -186,17 +417,83 @@ class FileSystemManager:
             Detected encoding or 'utf-8' as fallback
         """
         try:
-            import chardet
             with open(path, 'rb') as file:
-                raw_data = file.read(min(10000, path.stat().st_size))  # Read first 10KB
-                result = chardet.detect(raw_data)
-                return result.get('encoding', 'utf-8') or 'utf-8'
-        except ImportError:
-            # chardet not available, use utf-8 as default
+                raw_data = file.read(self.encoding_sample_size)
+        except Exception:
             return 'utf-8'
+        
+        for bom, encoding in _BOM_ENCODINGS:
+            if raw_data.startswith(bom):
+                return encoding
+        
+        # Pure ASCII is valid UTF-8; one C-level scan settles most source files
+        if raw_data.isascii():
+            return 'utf-8'
+        
+        try:
+            # final=False tolerates a multi-byte sequence cut at the sample end
+            codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        try:
+            return self._guess_encoding(raw_data)
         except Exception:
             return 'utf-8'
     
+    def _guess_encoding(self, raw_data: bytes) -> str:
+        """
+        Guess the encoding of non-UTF-8 data with an optional detector.
+        
+        Args:
+            raw_data: Leading bytes of the file
+            
+        Returns:
+            Detected encoding or 'utf-8' if no detector is available
+        """
+        guesser = _encoding_guesser()
+        if guesser is None:
+            # No detector available, use utf-8 as default
+            return 'utf-8'
+        # Detectors build a fresh name string per call; intern it so every
+        # result reporting the same encoding shares one object
+        encoding = guesser(raw_data)
+        return sys.intern(encoding) if encoding else 'utf-8'
+    
+    def batch_read(self, paths: List[Path], max_bytes: int = 8192) -> Dict[Path, bytes]:
+        """
+        Read the leading bytes of many files in one pass.
+        
+        Uses raw file descriptors (open/read/close) instead of buffered file
+        objects, which skips the extra fstat/ioctl/lseek calls the io layer
+        issues for every open.
+        
+        Args:
+            paths: Files to read
+            max_bytes: Maximum number of bytes to read from each file
+            
+        Returns:
+            Mapping of path to the bytes read; unreadable files are omitted
+        """
+        headers = {}
+        flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+        
+        for path in paths:
+            try:
+                fd = os.open(path, flags)
+            except OSError as e:
+                logger.debug("Cannot open %s for batch read: %s", path, e)
+                continue
+            try:
+                headers[path] = os.read(fd, max_bytes)
+            except OSError as e:
+                logger.debug("Cannot read %s in batch read: %s", path, e)
+            finally:
+                os.close(fd)
+        
+        return headers
+    
     def get_file_info(self, path: Path) -> dict:
         """
         Get basic file information.
@@ -208,20 +505,36 @@ class FileSystemManager:
             Dictionary with file metadata
         """
         try:
+            # Every field comes from this one stat call
             stat_info = path.stat()
             return {
                 'size': stat_info.st_size,
                 'modified': stat_info.st_mtime,
-                'is_file': path.is_file(),
-                'is_dir': path.is_dir(),
-                'exists': path.exists()
+                'is_file': stat.S_ISREG(stat_info.st_mode),
+                'is_dir': stat.S_ISDIR(stat_info.st_mode),
+                'exists': True
             }
         except (OSError, IOError) as e:
-            logger.error(f"Error getting file info for {path}: {e}")
+            logger.error("Error getting file info for %s: %s", path, e)
             return {
                 'size': 0,
                 'modified': 0,
                 'is_file': False,
                 'is_dir': False,
                 'exists': False
-            }
\ No newline at end of file
+            }
+
+
+@lru_cache(maxsize=None)
+def shared_fs_manager() -> FileSystemManager:
+    """
+    Get the process-wide FileSystemManager with default settings.
+    
+    Analyzers, the search engine and the service share one instance instead
+    of building their own. Besides its configuration, the shared manager
+    carries a lock-guarded path resolution cache, which clear_cache() empties.
+    
+    Returns:
+        Shared FileSystemManager instance
+    """
+    return FileSystemManager()
@@ -5,13 +5,199 @@ This module provides functionality to detect programming languages
 based on file extensions, shebang lines, and content analysis.
 """
 
+import os
 import re
-from pathlib import Path
+import string
+from functools import lru_cache
+from pathlib import Path, PurePath
 from typing import Optional, Dict, List
 import logging
 
+from .filesystem import is_racy_mtime
+
 logger = logging.getLogger(__name__)
 
+# Extensions that always denote binary files
+_BINARY_EXTENSIONS = frozenset({
+    '.exe', '.dll', '.so', '.dylib', '.a', '.lib',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.tiff',
+    '.mp3', '.wav', '.ogg', '.flac', '.aac',
+    '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar',
+    '.bin', '.dat', '.db', '.sqlite', '.sqlite3',
+    '.class', '.jar', '.war', '.ear',
+    '.pyc', '.pyo', '.pyd',
+    '.o', '.obj', '.out',
+})
+
+# Bytes outside printable ASCII, tab, newline and carriage return
+_NON_PRINTABLE_BYTES = bytes(
+    byte for byte in range(256) if not (32 <= byte <= 126 or byte in (9, 10, 13))
+)
+
+# Language by exact file name or lowercased extension
+_EXTENSION_MAP = {
+    # Python
+    '.py': 'python',
+    '.pyw': 'python',
+    '.pyi': 'python',
+
+    # JavaScript/TypeScript
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.mjs': 'javascript',
+
+    # Java
+    '.java': 'java',
+    '.class': 'java',
+
+    # C/C++
+    '.c': 'c',
+    '.h': 'c',
+    '.cpp': 'c++',
+    '.cxx': 'c++',
+    '.cc': 'c++',
+    '.hpp': 'c++',
+    '.hxx': 'c++',
+
+    # Go
+    '.go': 'go',
+
+    # Rust
+    '.rs': 'rust',
+
+    # Web
+    '.html': 'html',
+    '.htm': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.sass': 'sass',
+    '.less': 'less',
+
+    # Data formats
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.xml': 'xml',
+    '.toml': 'toml',
+
+    # Shell
+    '.sh': 'shell',
+    '.bash': 'shell',
+    '.zsh': 'shell',
+    '.fish': 'shell',
+
+    # Other languages
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.clj': 'clojure',
+    '.hs': 'haskell',
+    '.ml': 'ocaml',
+    '.fs': 'fsharp',
+    '.cs': 'csharp',
+    '.vb': 'vbnet',
+    '.pl': 'perl',
+    '.r': 'r',
+    '.R': 'r',
+    '.m': 'matlab',
+    '.sql': 'sql',
+
+    # Documentation
+    '.md': 'markdown',
+    '.rst': 'restructuredtext',
+    '.tex': 'latex',
+
+    # Configuration
+    '.ini': 'ini',
+    '.cfg': 'ini',
+    '.conf': 'config',
+    '.properties': 'properties',
+
+    # Docker
+    'Dockerfile': 'dockerfile',
+    '.dockerfile': 'dockerfile',
+}
+
+# Shebang line prefixes and the language they denote
+_SHEBANG_PATTERNS = {
+    r'#!/usr/bin/env python': 'python',
+    r'#!/usr/bin/python': 'python',
+    r'#!/usr/bin/env python3': 'python',
+    r'#!/usr/bin/python3': 'python',
+    r'#!/usr/bin/env node': 'javascript',
+    r'#!/usr/bin/node': 'javascript',
+    r'#!/bin/bash': 'shell',
+    r'#!/usr/bin/bash': 'shell',
+    r'#!/bin/sh': 'shell',
+    r'#!/usr/bin/sh': 'shell',
+    r'#!/usr/bin/env bash': 'shell',
+    r'#!/usr/bin/env sh': 'shell',
+    r'#!/usr/bin/env zsh': 'shell',
+    r'#!/usr/bin/zsh': 'shell',
+    r'#!/usr/bin/env ruby': 'ruby',
+    r'#!/usr/bin/ruby': 'ruby',
+    r'#!/usr/bin/env perl': 'perl',
+    r'#!/usr/bin/perl': 'perl',
+    r'#!/usr/bin/env php': 'php',
+    r'#!/usr/bin/php': 'php',
+}
+
+# Characters of an interpreter name in a shebang line
+_INTERPRETER_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+_INTERPRETER_LANGUAGES = {
+    'python': 'python',
+    'python3': 'python',
+    'node': 'javascript',
+    'bash': 'shell',
+    'sh': 'shell',
+    'zsh': 'shell',
+    'ruby': 'ruby',
+    'perl': 'perl',
+    'php': 'php',
+}
+
+# Content heuristics for files without a recognizable name, in priority order
+_CONTENT_PATTERNS = (
+    (re.compile(r'def\s+\w+\s*\(.*\):'), 'python'),
+    (re.compile(r'function\s+\w+\s*\(.*\)\s*{'), 'javascript'),
+    (re.compile(r'public\s+class\s+\w+'), 'java'),
+    (re.compile(r'#include\s*<.*>'), 'c++'),
+)
+
+# Leading characters of the content the heuristics look at
+_CONTENT_SNIFF_CHARS = 4096
+
+
+def _shebang_interpreter(first_line: str) -> Optional[str]:
+    """
+    Extract the interpreter name from a shebang line.
+    
+    Takes the trailing run of name characters of the first word that ends in
+    one, so '#!/usr/local/bin/python3 -u' gives 'python3'. Plain string
+    operations do this faster than a backtracking regex.
+    
+    Args:
+        first_line: Shebang line, starting with '#!'
+        
+    Returns:
+        Interpreter name, or None if the line names none
+    """
+    for word in first_line.split():
+        end = len(word)
+        start = end
+        while start and word[start - 1] in _INTERPRETER_CHARS:
+            start -= 1
+        if start < end:
+            return word[start:]
+    return None
+
 
 class LanguageDetector:
     """
@@ -24,115 +210,21 @@ class LanguageDetector:
     
     def __init__(self):
         """Initialize the LanguageDetector."""
-        self.extension_map = {
-            # Python
-            '.py': 'python',
-            '.pyw': 'python',
-            '.pyi': 'python',
-            
-            # JavaScript/TypeScript
-            '.js': 'javascript',
-            '.jsx': 'javascript',
-            '.ts': 'typescript',
-            '.tsx': 'typescript',
-            '.mjs': 'javascript',
-            
-            # Java
-            '.java': 'java',
-            '.class': 'java',
-            
-            # C/C++
-            '.c': 'c',
-            '.h': 'c',
-            '.cpp': 'c++',
-            '.cxx': 'c++',
-            '.cc': 'c++',
-            '.hpp': 'c++',
-            '.hxx': 'c++',
-            
-            # Go
-            '.go': 'go',
-            
-            # Rust
-            '.rs': 'rust',
-            
-            # Web
-            '.html': 'html',
-            '.htm': 'html',
-            '.css': 'css',
-            '.scss': 'scss',
-            '.sass': 'sass',
-            '.less': 'less',
-            
-            # Data formats
-            '.json': 'json',
-            '.yaml': 'yaml',
-            '.yml': 'yaml',
-            '.xml': 'xml',
-            '.toml': 'toml',
-            
-            # Shell
-            '.sh': 'shell',
-            '.bash': 'shell',
-            '.zsh': 'shell',
-            '.fish': 'shell',
-            
-            # Other languages
-            '.rb': 'ruby',
-            '.php': 'php',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.scala': 'scala',
-            '.clj': 'clojure',
-            '.hs': 'haskell',
-            '.ml': 'ocaml',
-            '.fs': 'fsharp',
-            '.cs': 'csharp',
-            '.vb': 'vbnet',
-            '.pl': 'perl',
-            '.r': 'r',
-            '.R': 'r',
-            '.m': 'matlab',
-            '.sql': 'sql',
-            
-            # Documentation
-            '.md': 'markdown',
-            '.rst': 'restructuredtext',
-            '.tex': 'latex',
-            
-            # Configuration
-            '.ini': 'ini',
-            '.cfg': 'ini',
-            '.conf': 'config',
-            '.properties': 'properties',
-            
-            # Docker
-            'Dockerfile': 'dockerfile',
-            '.dockerfile': 'dockerfile',
-        }
+        # Shared module-level tables, built once at import
+        self.extension_map = _EXTENSION_MAP
+        self.shebang_patterns = _SHEBANG_PATTERNS
         
-        self.shebang_patterns = {
-            r'#!/usr/bin/env python': 'python',
-            r'#!/usr/bin/python': 'python',
-            r'#!/usr/bin/env python3': 'python',
-            r'#!/usr/bin/python3': 'python',
-            r'#!/usr/bin/env node': 'javascript',
-            r'#!/usr/bin/node': 'javascript',
-            r'#!/bin/bash': 'shell',
-            r'#!/usr/bin/bash': 'shell',
-            r'#!/bin/sh': 'shell',
-            r'#!/usr/bin/sh': 'shell',
-            r'#!/usr/bin/env bash': 'shell',
-            r'#!/usr/bin/env sh': 'shell',
-            r'#!/usr/bin/env zsh': 'shell',
-            r'#!/usr/bin/zsh': 'shell',
-            r'#!/usr/bin/env ruby': 'ruby',
-            r'#!/usr/bin/ruby': 'ruby',
-            r'#!/usr/bin/env perl': 'perl',
-            r'#!/usr/bin/perl': 'perl',
-            r'#!/usr/bin/env php': 'php',
-            r'#!/usr/bin/php': 'php',
-        }
+        # The shebang patterns are plain prefixes, so they are matched with
+        # str.startswith instead of a regex per pattern
+        self._shebang_prefixes = tuple(self.shebang_patterns.items())
+        
+        # Per-instance memoization: extension results depend only on the file
+        # name, and content sniffs on the file's (path, mtime, size); failed
+        # reads raise through the cache and are not stored, and files with a
+        # racy mtime bypass it
+        self.cache_size = 4096
+        self._language_for_name = lru_cache(maxsize=self.cache_size)(self._detect_by_file_name)
+        self._sniff_binary = lru_cache(maxsize=self.cache_size)(self._read_is_binary)
     
     def detect_language(self, file_path: Path, content: Optional[str] = None) -> str:
         """
@@ -145,24 +237,19 @@ class LanguageDetector:
         Returns:
             Detected language name or 'unknown'
         """
-        # Try extension-based detection first
-        language = self.detect_by_extension(file_path)
-        if language != 'unknown':
+        # Try extension-based detection first; most files stop here
+        language = self._language_for_name(file_path.name)
+        if language != 'unknown' or not content:
             return language
         
-        # Try shebang detection if content is available
-        if content:
+        # Try shebang detection, only worth a call when there is one
+        if content.startswith('#!'):
             language = self.detect_by_shebang(content)
             if language != 'unknown':
                 return language
         
         # Try content-based heuristics
-        if content:
-            language = self.detect_by_content(content)
-            if language != 'unknown':
-                return language
-        
-        return 'unknown'
+        return self.detect_by_content(content)
     
     def detect_by_extension(self, file_path: Path) -> str:
         """
@@ -174,19 +261,24 @@ class LanguageDetector:
         Returns:
             Language name or 'unknown'
         """
+        return self._language_for_name(file_path.name)
+    
+    def _detect_by_file_name(self, file_name: str) -> str:
+        """Uncached detect_by_extension, keyed by the file name alone."""
         # Check file name first (for files like Dockerfile)
-        file_name = file_path.name
         if file_name in self.extension_map:
             return self.extension_map[file_name]
         
         # Check extension
-        extension = file_path.suffix.lower()
+        name_path = PurePath(file_name)
+        extension = name_path.suffix.lower()
         if extension in self.extension_map:
             return self.extension_map[extension]
         
         # Check for multiple extensions (e.g., .spec.ts)
-        if len(file_path.suffixes) > 1:
-            combined_ext = ''.join(file_path.suffixes[-2:]).lower()
+        suffixes = name_path.suffixes
+        if len(suffixes) > 1:
+            combined_ext = ''.join(suffixes[-2:]).lower()
             if combined_ext in self.extension_map:
                 return self.extension_map[combined_ext]
         
@@ -206,30 +298,19 @@ class LanguageDetector:
             return 'unknown'
         
         # Get the first line
-        first_line = content.split('\n')[0].strip()
+        first_line = content.partition('\n')[0].strip()
         
         # Check against known shebang patterns
-        for pattern, language in self.shebang_patterns.items():
-            if re.match(pattern, first_line):
+        for prefix, language in self._shebang_prefixes:
+            if first_line.startswith(prefix):
                 return language
         
         # Try to extract interpreter from shebang
-        shebang_match = re.match(r'#!.*?([a-zA-Z0-9_]+)(?:\s|$)', first_line)
-        if shebang_match:
-            interpreter = shebang_match.group(1).lower()
-            interpreter_map = {
-                'python': 'python',
-                'python3': 'python',
-                'node': 'javascript',
-                'bash': 'shell',
-                'sh': 'shell',
-                'zsh': 'shell',
-                'ruby': 'ruby',
-                'perl': 'perl',
-                'php': 'php',
-            }
-            if interpreter in interpreter_map:
-                return interpreter_map[interpreter]
+        interpreter = _shebang_interpreter(first_line)
+        if interpreter is not None:
+            interpreter = interpreter.lower()
+            if interpreter in _INTERPRETER_LANGUAGES:
+                return _INTERPRETER_LANGUAGES[interpreter]
         
         return 'unknown'
     
@@ -237,6 +318,9 @@ class LanguageDetector:
         """
         Detect language by content analysis.
         
+        Only the first 4096 characters are examined; the heuristics look for
+        declarations that appear near the top of a source file.
+        
         Args:
             content: File content
             
@@ -244,86 +328,152 @@ class LanguageDetector:
             Language name or 'unknown'
         """
         # Basic content-based detection
-        if not content.strip():
+        if not content or content.isspace():
             return 'unknown'
         
-        # Look for common language patterns
-        if re.search(r'def\s+\w+\s*\(.*\):', content):
-            return 'python'
-        elif re.search(r'function\s+\w+\s*\(.*\)\s*{', content):
-            return 'javascript'
-        elif re.search(r'public\s+class\s+\w+', content):
-            return 'java'
-        elif re.search(r'#include\s*<.*>', content):
-            return 'c++'
+        # Look for common language patterns in the head of the file
+        for pattern, language in _CONTENT_PATTERNS:
+            if pattern.search(content, 0, _CONTENT_SNIFF_CHARS):
+                return language
         
         return 'unknown'
     
-    def is_binary_file(self, file_path: Path) -> bool:
+    def is_binary_file(self, file_path: Path, header: Optional[bytes] = None) -> bool:
         """
         Check if a file is binary.
         
         Args:
             file_path: Path to the file
+            header: Optional leading bytes of the file (if already read)
             
         Returns:
             True if file is binary, False otherwise
         """
-        # Known binary extensions
-        binary_extensions = {
-            '.exe', '.dll', '.so', '.dylib', '.a', '.lib',
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.tiff',
-            '.mp3', '.wav', '.ogg', '.flac', '.aac',
-            '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv',
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar',
-            '.bin', '.dat', '.db', '.sqlite', '.sqlite3',
-            '.class', '.jar', '.war', '.ear',
-            '.pyc', '.pyo', '.pyd',
-            '.o', '.obj', '.out',
-        }
-        
         extension = file_path.suffix.lower()
-        if extension in binary_extensions:
+        if extension in _BINARY_EXTENSIONS:
             return True
         
         # Check file content for null bytes (binary indicator)
-        try:
-            with open(file_path, 'rb') as f:
-                chunk = f.read(8192)  # Read first 8KB
-                if b'\x00' in chunk:
-                    return True
-                
-                # Check for high ratio of non-printable characters
-                if chunk:
-                    printable_chars = sum(1 for byte in chunk if 32 <= byte <= 126 or byte in (9, 10, 13))
-                    ratio = printable_chars / len(chunk)
-                    if ratio < 0.7:  # Less than 70% printable characters
-                        return True
-                        
-        except (IOError, OSError):
-            # If we can't read the file, assume it might be binary
+        if header is None:
+            try:
+                stat_info = os.stat(file_path)
+                sniff = self._read_is_binary if is_racy_mtime(stat_info.st_mtime_ns) else self._sniff_binary
+                return sniff(str(file_path), stat_info.st_mtime_ns, stat_info.st_size)
+            except (IOError, OSError):
+                # If we can't read the file, assume it might be binary
+                return True
+        
+        return self._is_binary_header(header)
+    
+    def _read_is_binary(self, path: str, mtime_ns: int, size: int) -> bool:
+        """
+        Read a file's first 8KB and check it; memoized per (path, mtime, size).
+        
+        Raises:
+            OSError: If the file cannot be read (not cached)
+        """
+        with open(path, 'rb') as f:
+            return self._is_binary_header(f.read(8192))  # Read first 8KB
+    
+    @staticmethod
+    def _is_binary_header(header: bytes) -> bool:
+        """Check leading file bytes for null bytes or mostly non-printable data."""
+        chunk = header[:8192]
+        if b'\x00' in chunk:
             return True
         
+        # Check for high ratio of non-printable characters
+        if chunk:
+            # Deleting the non-printable bytes counts the rest in one C loop
+            printable_chars = len(chunk.translate(None, _NON_PRINTABLE_BYTES))
+            ratio = printable_chars / len(chunk)
+            if ratio < 0.7:  # Less than 70% printable characters
+                return True
+        
         return False
     
-    def get_file_type_info(self, file_path: Path, content: Optional[str] = None) -> Dict[str, str]:
+    def detect_by_name(self, file_name: str, extension: str) -> Optional[str]:
+        """
+        Classify a file from its name and lowercased extension alone.
+        
+        Gives the same language as get_file_type_info whenever the name or
+        the final extension is in the tables, without touching the file.
+        
+        Args:
+            file_name: Base name of the file
+            extension: Lowercased final suffix of the file name
+            
+        Returns:
+            Language name ('binary' for binary extensions), or None if the
+            file needs the full get_file_type_info check
+        """
+        if extension in _BINARY_EXTENSIONS:
+            return 'binary'
+        return self.extension_map.get(file_name) or self.extension_map.get(extension)
+    
+    def needs_content_sniff(self, file_path: Path) -> bool:
+        """
+        Check whether classifying a file requires reading its content.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            True if neither the binary nor the language extension tables
+            recognize the file
+        """
+        if file_path.suffix.lower() in _BINARY_EXTENSIONS:
+            return False
+        return self.detect_by_extension(file_path) == 'unknown'
+    
+    def clear_cache(self):
+        """Drop memoized extension lookups and content sniffs."""
+        self._language_for_name.cache_clear()
+        self._sniff_binary.cache_clear()
+    
+    def get_file_type_info(self, file_path: Path, content: Optional[str] = None,
+                           header: Optional[bytes] = None) -> Dict[str, str]:
         """
         Get comprehensive file type information.
         
         Args:
             file_path: Path to the file
             content: Optional file content
+            header: Optional leading bytes of the file (if already read)
             
         Returns:
             Dictionary with file type information
         """
-        is_binary = self.is_binary_file(file_path)
-        language = 'binary' if is_binary else self.detect_language(file_path, content)
+        if file_path.suffix.lower() in _BINARY_EXTENSIONS:
+            is_binary = True
+            language = 'binary'
+        else:
+            # A known extension is authoritative, so the content is only
+            # sniffed for files the extension table cannot classify
+            language = self.detect_by_extension(file_path)
+            if language != 'unknown':
+                is_binary = False
+            else:
+                is_binary = self.is_binary_file(file_path, header)
+                language = 'binary' if is_binary else self.detect_language(file_path, content)
         
         return {
             'language': language,
             'is_binary': is_binary,
             'extension': file_path.suffix.lower(),
             'filename': file_path.name
-        }
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=None)
+def shared_language_detector() -> LanguageDetector:
+    """
+    Get the process-wide LanguageDetector.
+    
+    The extension and shebang tables are read-only after construction, so
+    one instance is shared instead of rebuilding them per component.
+    
+    Returns:
+        Shared LanguageDetector instance
+    """
+    return LanguageDetector()
@@ -15,6 +15,8 @@ class TodoItem:
     """
     Represents a TODO, FIXME, or HACK comment found in code.
     """
+    __slots__ = ('line_number', 'comment_type', 'text', 'file_path')
+    
     line_number: int
     comment_type: str  # 'TODO', 'FIXME', 'HACK'
     text: str
@@ -30,6 +32,11 @@ class CodeMetrics:
     complexity, and quality indicators that can be calculated from
     source code analysis.
     """
+    __slots__ = (
+        'function_count', 'class_count', 'import_count', 'comment_lines',
+        'blank_lines', 'cyclomatic_complexity', 'maintainability_index', 'todos',
+    )
+    
     function_count: int
     class_count: int
     import_count: int
@@ -44,7 +51,13 @@ class CodeMetrics:
 class DirectoryTree:
     """
     Represents the hierarchical structure of a directory.
+    
+    Large trees hold one node per file, so nodes use __slots__ instead of a
+    per-instance __dict__ (declared by hand since dataclass(slots=True)
+    needs Python 3.10).
     """
+    __slots__ = ('name', 'path', 'is_directory', 'size', 'children')
+    
     name: str
     path: str
     is_directory: bool
@@ -61,6 +74,11 @@ class DirectoryAnalysis:
     in a directory, including file counts, size distribution,
     and language statistics.
     """
+    __slots__ = (
+        'directory_path', 'total_files', 'file_types', 'total_size',
+        'languages', 'structure', 'analysis_time', 'errors',
+    )
+    
     directory_path: str
     total_files: int
     file_types: Dict[str, int]  # extension -> count
@@ -75,7 +93,12 @@ class DirectoryAnalysis:
 class FileMatch:
     """
     Represents a single file match in search results.
+    
+    A content search can return up to a thousand matches, so matches use
+    __slots__ rather than a per-instance __dict__.
     """
+    __slots__ = ('file_path', 'line_number', 'content', 'context_before', 'context_after')
+    
     file_path: str
     line_number: int
     content: str
@@ -91,6 +114,11 @@ class SearchResult:
     This dataclass contains all matches found during a search,
     along with metadata about the search operation.
     """
+    __slots__ = (
+        'matches', 'total_matches', 'search_time', 'search_pattern',
+        'search_type', 'errors',
+    )
+    
     matches: List[FileMatch]
     total_matches: int
     search_time: float
@@ -107,13 +135,28 @@ class AnalysisResult:
     This dataclass contains all the metadata and analysis information
     that can be extracted from a file, including basic file properties,
     language detection, and optional code metrics.
+    
+    One instance is built per analyzed file, so like DirectoryTree it uses
+    __slots__ rather than a per-instance __dict__.
     """
+    __slots__ = (
+        'file_path', 'file_size', 'line_count', 'language', 'last_modified',
+        'is_binary', 'encoding', 'metrics', 'errors',
+    )
+    
     file_path: str
     file_size: int
     line_count: int
     language: str
-    last_modified: datetime
+    last_modified: Optional[float]  # epoch seconds
     is_binary: bool
     encoding: str
     metrics: Optional['CodeMetrics']
-    errors: List[str]
\ No newline at end of file
+    errors: List[str]
+    
+    @property
+    def last_modified_datetime(self) -> Optional[datetime]:
+        """Modification time as a local datetime, built only when accessed."""
+        if self.last_modified is None:
+            return None
+        return datetime.fromtimestamp(self.last_modified)
@@ -5,19 +5,58 @@ This module provides comprehensive search capabilities including glob patterns,
 regex matching, and content-based search with context extraction.
 """
 
+import os
 import re
+import threading
 import time
 import glob
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Pattern
+from typing import AbstractSet, Iterator, List, Optional, Dict, Any, Pattern, Tuple, Union
 import logging
 import fnmatch
+from functools import lru_cache
 
 from .models import SearchResult, FileMatch
-from .filesystem import FileSystemManager
+from .filesystem import is_racy_mtime, shared_fs_manager
 
 logger = logging.getLogger(__name__)
 
+# Extensions treated as binary without reading the file
+_BINARY_EXTENSIONS = frozenset({
+    '.exe', '.dll', '.so', '.dylib', '.a', '.lib',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico',
+    '.mp3', '.wav', '.mp4', '.avi', '.zip', '.tar',
+    '.gz', '.pdf', '.doc', '.docx', '.pyc', '.pyo'
+})
+
+# VCS, dependency, virtualenv, cache and build output directories; searching
+# them is slow and their matches are noise
+_DEFAULT_SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv',
+    '.tox', '.mypy_cache', '.pytest_cache', 'dist', 'build', 'target'
+})
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int, escape: bool) -> Pattern:
+    """
+    Compile a search pattern, reusing the result for repeated queries.
+    
+    Args:
+        pattern: Regex, or literal text when escape is True
+        flags: re flags to compile with
+        escape: Whether to match the pattern as literal text
+        
+    Returns:
+        Compiled pattern
+        
+    Raises:
+        re.error: If the pattern is not a valid regex
+    """
+    return re.compile(re.escape(pattern) if escape else pattern, flags)
+
 
 class SearchEngine:
     """
@@ -29,10 +68,26 @@ class SearchEngine:
     
     def __init__(self):
         """Initialize the search engine."""
-        self.fs_manager = FileSystemManager()
+        self.fs_manager = shared_fs_manager()
         self.max_context_lines = 3
         self.max_matches_per_file = 100
         self.max_total_matches = 1000
+        self.max_workers = min(32, os.cpu_count() or 1)  # Threads per content search; 1 = serial
+        self.skip_dirs = _DEFAULT_SKIP_DIRS  # Directory names regex and content searches do not enter
+        
+        # LRU cache of directory listings, revalidated by the directory's
+        # mtime, so repeated searches stat each directory instead of
+        # listing it again
+        self.listing_cache_size = 4096
+        self._listing_cache: "OrderedDict[str, Tuple[int, List[str], List[Tuple[str, str]]]]" = OrderedDict()
+        self._listing_lock = threading.Lock()
+        
+        # LRU cache of per-file content matches keyed on the file's
+        # (path, mtime_ns, size) plus everything that shapes the matches, so
+        # repeated content searches only stat unchanged files
+        self.match_cache_size = 16384
+        self._match_cache: "OrderedDict[tuple, Tuple[FileMatch, ...]]" = OrderedDict()
+        self._match_lock = threading.Lock()
     
     def search_files(self, pattern: str, search_type: str = 'glob',
                     base_path: str = '.', filters: Optional[List[str]] = None) -> SearchResult:
@@ -104,23 +159,34 @@ class SearchEngine:
         try:
             # Convert to Path object
             base_path_obj = Path(base_path).resolve()
+            suffixes = tuple(filters) if filters else None  # str.endswith takes a tuple
+            
+            # Scope the walk to the literal directory prefix of the pattern so
+            # directories that cannot match are never listed
+            prefix, remainder = self._split_literal_prefix(pattern)
+            search_root = base_path_obj / prefix if prefix else base_path_obj
             
             # Use glob to find matching files
-            if '**' in pattern:
-                # Recursive glob
-                matching_files = base_path_obj.glob(pattern)
+            if not remainder:
+                # Fully literal pattern
+                matching_files = [search_root] if search_root.exists() else []
+            elif not search_root.is_dir():
+                matching_files = []
+            elif self._is_recursive_name_pattern(remainder):
+                return self._search_by_recursive_name(
+                    remainder[3:], str(search_root), suffixes
+                )
             else:
-                # Non-recursive glob
-                matching_files = base_path_obj.glob(pattern)
+                matching_files = search_root.glob(remainder)
             
             for file_path in matching_files:
+                # Apply extension filters before touching the file
+                if suffixes is not None and not file_path.name.endswith(suffixes):
+                    continue
+                
                 if file_path.is_file():
-                    # Apply extension filters
-                    if filters and not any(file_path.name.endswith(ext) for ext in filters):
-                        continue
-                    
-                    # Check permissions
-                    if self.fs_manager.check_permissions(file_path):
+                    # Check permissions; is_file already proved the path exists
+                    if self.fs_manager.check_read_access(file_path):
                         matches.append(FileMatch(
                             file_path=str(file_path),
                             line_number=0,  # No specific line for file matches
@@ -137,6 +203,81 @@ class SearchEngine:
         
         return matches
     
+    def _is_recursive_name_pattern(self, remainder: str) -> bool:
+        """
+        Check if a glob remainder is '**/' followed by a single name pattern.
+        
+        Args:
+            remainder: Glob pattern after its literal prefix
+            
+        Returns:
+            True for patterns like '**/*.py', False otherwise
+        """
+        return (remainder.startswith('**/') and '/' not in remainder[3:]
+                and remainder[3:] not in ('', '**'))
+    
+    def _search_by_recursive_name(self, name_pattern: str, root: str,
+                                  suffixes: Optional[Tuple[str, ...]]) -> List[FileMatch]:
+        """
+        Glob '**/<name_pattern>' below root using the cached directory walk.
+        
+        Matches what Path.glob yields for the same pattern: files at any
+        depth, dot-files included, symlinked directories not followed, in
+        the same order. The walk streams str paths from cached listings, so
+        it stops as soon as enough matches are in and repeated searches do
+        not list unchanged directories again.
+        
+        Args:
+            name_pattern: Wildcard pattern for file names (e.g., '*.py')
+            root: Directory to search below
+            suffixes: Extensions a file name must end with, or None for all
+            
+        Returns:
+            List of file matches
+        """
+        matches = []
+        name_regex = _compile_pattern(
+            fnmatch.translate(os.path.normcase(name_pattern)), 0, False
+        )
+        
+        for file_path, file_name in self._iter_candidate_files(root, suffixes):
+            if not name_regex.match(os.path.normcase(file_name)):
+                continue
+            
+            # The listing proved the file exists, so only read access is left
+            if self.fs_manager.check_read_access(file_path):
+                matches.append(FileMatch(
+                    file_path=file_path,
+                    line_number=0,
+                    content=f"File: {file_name}",
+                    context_before=[],
+                    context_after=[]
+                ))
+                
+                if len(matches) >= self.max_total_matches:
+                    break
+        
+        return matches
+    
+    def _split_literal_prefix(self, pattern: str) -> Tuple[str, str]:
+        """
+        Split a glob pattern into its literal directory prefix and the rest.
+        
+        Args:
+            pattern: Glob pattern (e.g., 'src/pkg/**/*.py')
+            
+        Returns:
+            Tuple of (literal_prefix, glob_remainder), e.g. ('src/pkg', '**/*.py')
+        """
+        parts = pattern.split('/')
+        for index, part in enumerate(parts):
+            if glob.has_magic(part):
+                break
+        else:
+            index = len(parts)
+        
+        return '/'.join(parts[:index]), '/'.join(parts[index:])
+    
     def search_by_regex(self, pattern: str, base_path: str = '.',
                        filters: Optional[List[str]] = None) -> List[FileMatch]:
         """
@@ -154,35 +295,31 @@ class SearchEngine:
         
         try:
             # Compile regex pattern
-            regex_pattern = re.compile(pattern, re.IGNORECASE)
-            base_path_obj = Path(base_path).resolve()
+            regex_pattern = _compile_pattern(pattern, re.IGNORECASE, False)
+            suffixes = tuple(filters) if filters else None
             
-            # Walk through directory tree
-            for root, dirs, files in base_path_obj.walk():
-                for filename in files:
-                    file_path = root / filename
-                    
-                    # Check if filename matches regex
-                    if regex_pattern.search(filename):
-                        # Apply extension filters
-                        if filters and not any(filename.endswith(ext) for ext in filters):
-                            continue
-                        
-                        # Check permissions
-                        if self.fs_manager.check_permissions(file_path):
-                            matches.append(FileMatch(
-                                file_path=str(file_path),
-                                line_number=0,
-                                content=f"File: {filename}",
-                                context_before=[],
-                                context_after=[]
-                            ))
-                            
-                            if len(matches) >= self.max_total_matches:
-                                break
+            # Walk through directory tree; names are filtered before any
+            # further syscall is made for the file
+            candidates = self._iter_candidate_files(
+                os.path.realpath(base_path), suffixes, self.skip_dirs
+            )
+            for file_path, filename in candidates:
+                # Check if filename matches regex
+                if not regex_pattern.search(filename):
+                    continue
                 
-                if len(matches) >= self.max_total_matches:
-                    break
+                # Check permissions
+                if self.fs_manager.check_read_access(file_path):
+                    matches.append(FileMatch(
+                        file_path=file_path,
+                        line_number=0,
+                        content=f"File: {filename}",
+                        context_before=[],
+                        context_after=[]
+                    ))
+                    
+                    if len(matches) >= self.max_total_matches:
+                        break
                     
         except re.error as e:
             logger.error(f"Invalid regex pattern: {e}")
@@ -208,41 +345,206 @@ class SearchEngine:
         
         try:
             # Compile regex pattern for content search
-            regex_pattern = re.compile(re.escape(pattern), re.IGNORECASE)
-            base_path_obj = Path(base_path).resolve()
+            regex_pattern = _compile_pattern(pattern, re.IGNORECASE, True)
+            suffixes = tuple(filters) if filters else None
             
-            # Walk through directory tree
-            for root, dirs, files in base_path_obj.walk():
-                for filename in files:
-                    file_path = root / filename
-                    
-                    # Apply extension filters
-                    if filters and not any(filename.endswith(ext) for ext in filters):
-                        continue
-                    
-                    # Skip binary files
-                    if self._is_likely_binary(file_path):
-                        continue
-                    
-                    # Check permissions
-                    if not self.fs_manager.check_permissions(file_path):
+            candidates = self._iter_candidate_files(
+                os.path.realpath(base_path), suffixes, self.skip_dirs
+            )
+            
+            if self.max_workers <= 1:
+                for file_path, _ in candidates:
+                    matches.extend(self._search_candidate(file_path, regex_pattern, pattern))
+                    if len(matches) >= self.max_total_matches:
+                        break
+                return matches
+            
+            # Files are read and searched on a thread pool so their reads
+            # overlap; a bounded window of futures is consumed in submission
+            # order, so results come back in walk order and no more files are
+            # opened once enough matches are in
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pending = deque()
+                for file_path, _ in candidates:
+                    pending.append(executor.submit(
+                        self._search_candidate, file_path, regex_pattern, pattern
+                    ))
+                    if len(pending) < self.max_workers * 2:
                         continue
-                    
-                    # Search content
-                    file_matches = self._search_file_content(file_path, regex_pattern)
-                    matches.extend(file_matches)
-                    
+                    matches.extend(pending.popleft().result())
                     if len(matches) >= self.max_total_matches:
                         break
                 
-                if len(matches) >= self.max_total_matches:
-                    break
+                while pending and len(matches) < self.max_total_matches:
+                    matches.extend(pending.popleft().result())
+                for future in pending:
+                    future.cancel()
                     
         except Exception as e:
             logger.error(f"Error in content search: {e}")
         
         return matches
     
+    def _search_candidate(self, file_path: str, pattern: Pattern,
+                          literal: Optional[str]) -> List[FileMatch]:
+        """
+        Search one file found by the walk, skipping binary files.
+        
+        The binary sniff opens the file, so it also weeds out unreadable ones
+        without a separate permission check. Results, including the empty
+        result for sniffed binary files, are cached until the file's mtime or
+        size changes, unless the file was modified too recently for its mtime
+        to be trusted; files with a binary extension are skipped before the
+        stat.
+        
+        Args:
+            file_path: Path to the file
+            pattern: Compiled regex pattern
+            literal: Literal text the pattern matches, for the find fast path
+            
+        Returns:
+            List of matches in the file
+        """
+        # Binary by extension: known without a stat, so nothing to cache
+        if os.path.splitext(file_path)[1].lower() in _BINARY_EXTENSIONS:
+            return []
+        
+        try:
+            stat_info = os.stat(file_path)
+        except OSError:
+            return []
+        
+        key = (file_path, stat_info.st_mtime_ns, stat_info.st_size, pattern.pattern,
+               pattern.flags, self.max_matches_per_file, self.max_context_lines)
+        with self._match_lock:
+            cached = self._match_cache.get(key)
+            if cached is not None:
+                self._match_cache.move_to_end(key)
+        if cached is not None:
+            return self._copy_matches(cached)
+        
+        if self._is_likely_binary(file_path):
+            matches = []
+        else:
+            matches = self._search_file_content(file_path, pattern, literal)
+        
+        # Callers get the fresh objects; the cache keeps its own copies.
+        # Files modified within the racy window are not cached, since a
+        # same-size rewrite in the same tick would leave the key unchanged
+        if not is_racy_mtime(stat_info.st_mtime_ns):
+            with self._match_lock:
+                self._match_cache[key] = tuple(self._copy_matches(matches))
+                while len(self._match_cache) > self.match_cache_size:
+                    self._match_cache.popitem(last=False)
+        
+        return matches
+    
+    @staticmethod
+    def _copy_matches(matches) -> List[FileMatch]:
+        """Copy matches, including their context lists, so the cache cannot be modified."""
+        return [
+            FileMatch(match.file_path, match.line_number, match.content,
+                      list(match.context_before), list(match.context_after))
+            for match in matches
+        ]
+    
+    def _iter_candidate_files(self, root: str, suffixes: Optional[Tuple[str, ...]],
+                              skip_dirs: AbstractSet[str] = frozenset()) -> Iterator[Tuple[str, str]]:
+        """
+        Walk a directory tree and yield the files a search should look at.
+        
+        Walks with an explicit stack over listings from _list_directory, so
+        file types come from the directory listing and names are filtered
+        before any per-file syscall. Directories are visited top-down in
+        listing order, each directory's files before its subdirectories.
+        Symlinked directories are not followed and unreadable directories
+        are skipped, as are subdirectories named in skip_dirs.
+        
+        Args:
+            root: Directory to walk; paths are yielded below it as given
+            suffixes: Extensions a file name must end with, or None for all
+            skip_dirs: Directory names not to descend into
+            
+        Yields:
+            Tuples of (file_path, file_name)
+        """
+        stack = [root]
+        
+        while stack:
+            directory = stack.pop()
+            try:
+                subdirs, files = self._list_directory(directory)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory {directory}: {e}")
+                continue
+            
+            if suffixes is None:
+                yield from files
+            else:
+                for file_path, file_name in files:
+                    if file_name.endswith(suffixes):
+                        yield file_path, file_name
+            
+            if skip_dirs:
+                subdirs = [subdir for subdir in subdirs
+                           if os.path.basename(subdir) not in skip_dirs]
+            stack.extend(reversed(subdirs))
+    
+    def _list_directory(self, directory: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        List a directory's subdirectories and files, reusing a cached listing.
+        
+        A cached listing is valid while the directory's mtime is unchanged,
+        which holds until an entry is added, removed or renamed.
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            Tuple of (subdirectory paths, (file_path, file_name) pairs), both
+            in listing order
+            
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+        
+        with self._listing_lock:
+            cached = self._listing_cache.get(directory)
+            if cached is not None and cached[0] == mtime_ns:
+                self._listing_cache.move_to_end(directory)
+                return cached[1], cached[2]
+        
+        subdirs = []
+        files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append((entry.path, entry.name))
+                except OSError:
+                    continue
+        
+        with self._listing_lock:
+            if not is_racy_mtime(mtime_ns):
+                self._listing_cache[directory] = (mtime_ns, subdirs, files)
+                self._listing_cache.move_to_end(directory)
+                while len(self._listing_cache) > self.listing_cache_size:
+                    self._listing_cache.popitem(last=False)
+            else:
+                self._listing_cache.pop(directory, None)
+        
+        return subdirs, files
+    
+    def clear_cache(self):
+        """Drop cached directory listings and content matches."""
+        with self._listing_lock:
+            self._listing_cache.clear()
+        with self._match_lock:
+            self._match_cache.clear()
+    
     def filter_by_extensions(self, files: List[Path], extensions: List[str]) -> List[Path]:
         """
         Filter files by multiple extensions.
@@ -257,79 +559,165 @@ class SearchEngine:
         if not extensions:
             return files
         
-        filtered_files = []
-        for file_path in files:
-            if any(file_path.name.endswith(ext) for ext in extensions):
-                filtered_files.append(file_path)
-        
-        return filtered_files
+        # Same test the searches apply: one str.endswith call with a tuple
+        suffixes = tuple(extensions)
+        return [file_path for file_path in files if file_path.name.endswith(suffixes)]
     
-    def _search_file_content(self, file_path: Path, pattern: Pattern) -> List[FileMatch]:
+    def _search_file_content(self, file_path: Union[str, Path], pattern: Pattern,
+                             literal: Optional[str] = None) -> List[FileMatch]:
         """
         Search content within a single file.
         
         Args:
             file_path: Path to the file
             pattern: Compiled regex pattern
+            literal: Text the pattern matches case-insensitively, if it is a
+                plain escaped string; enables a str.find fast path
             
         Returns:
             List of matches in the file
         """
         matches = []
+        path_str = os.fspath(file_path)
         
         try:
             # Read file content
-            encoding = self.fs_manager.detect_encoding(file_path)
-            content = self.fs_manager.read_file_content(file_path, encoding)
-            lines = content.split('\n')
-            
-            # Search each line
-            for line_num, line in enumerate(lines, 1):
-                if pattern.search(line):
-                    # Extract context
-                    context_before = self._get_context_lines(
-                        lines, line_num - 1, -self.max_context_lines, 0
-                    )
-                    context_after = self._get_context_lines(
-                        lines, line_num - 1, 1, self.max_context_lines + 1
-                    )
-                    
-                    matches.append(FileMatch(
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        content=line.strip(),
-                        context_before=context_before,
-                        context_after=context_after
-                    ))
-                    
-                    if len(matches) >= self.max_matches_per_file:
+            encoding = self.fs_manager.detect_encoding(path_str)
+            with self.fs_manager.map_file(path_str) as data:
+                content = self.fs_manager.decode_content(data, encoding)
+            
+            # Scan the whole buffer with the compiled pattern rather than
+            # calling it once per line; line numbers come from counting the
+            # newlines skipped since the previous match, and the matched line
+            # and its context are sliced out around the match, so the file
+            # is never split into lines
+            line_num = 1
+            counted_to = 0
+            position = 0
+            
+            # IGNORECASE stops the regex engine from skipping ahead to the
+            # literal, so case-insensitive literal text is found with str.find
+            # on lowercased copies instead; for ASCII text lowering keeps
+            # offsets and matches exactly what the pattern would
+            needle = hits = None
+            if literal and literal.isascii() and content.isascii():
+                needle = literal.lower()
+                hits = self._find_lowered(content, needle)
+            
+            while len(matches) < self.max_matches_per_file:
+                if needle is None:
+                    match = pattern.search(content, position)
+                    if not match:
+                        break
+                    start, end = match.span()
+                else:
+                    start = next(hits, -1)
+                    while -1 < start < position:
+                        start = next(hits, -1)
+                    if start == -1:
                         break
+                    end = start + len(needle)
+                
+                if content.find('\n', start, end) != -1:
+                    # Matches never span lines
+                    position = start + 1
+                    continue
+                
+                line_num += content.count('\n', counted_to, start)
+                counted_to = start
+                
+                line_start = content.rfind('\n', 0, start) + 1
+                line_end = content.find('\n', start)
+                if line_end == -1:
+                    line_end = len(content)
+                
+                # Extract context
+                context_before, context_after = self._get_context_lines(
+                    content, line_start, line_end
+                )
+                
+                matches.append(FileMatch(
+                    file_path=path_str,
+                    line_number=line_num,
+                    content=content[line_start:line_end].strip(),
+                    context_before=context_before,
+                    context_after=context_after
+                ))
+                
+                # Report each line once: resume at the start of the next line
+                if line_end == len(content):
+                    break
+                position = line_end + 1
                         
         except Exception as e:
             logger.warning(f"Error searching content in {file_path}: {e}")
         
         return matches
     
-    def _get_context_lines(self, lines: List[str], current_line: int,
-                          start_offset: int, end_offset: int) -> List[str]:
+    @staticmethod
+    def _find_lowered(content: str, needle: str, block_size: int = 64 * 1024) -> Iterator[int]:
         """
-        Get context lines around a match.
+        Find a lowercase needle in ASCII content, ignoring case.
+        
+        The content is lowercased one block at a time as the search advances,
+        so a search that stops after a few early matches never copies the
+        whole file. Blocks overlap by len(needle) - 1 characters so no
+        occurrence is missed at a boundary.
         
         Args:
-            lines: All lines in the file
-            current_line: Current line index (0-based)
-            start_offset: Start offset (negative for before)
-            end_offset: End offset (positive for after)
+            content: ASCII text to search
+            needle: Non-empty lowercase ASCII text to find
+            block_size: Characters lowercased at a time
+            
+        Yields:
+            Start offsets of every occurrence, in increasing order
+        """
+        span = block_size + len(needle) - 1
+        for block_start in range(0, len(content), block_size):
+            segment = content[block_start:block_start + span].lower()
+            index = segment.find(needle)
+            while index != -1 and index < block_size:
+                yield block_start + index
+                index = segment.find(needle, index + 1)
+    
+    def _get_context_lines(self, content: str, line_start: int,
+                          line_end: int) -> Tuple[List[str], List[str]]:
+        """
+        Get context lines around a matched line.
+        
+        Lines are sliced straight out of the content by walking the
+        surrounding newlines, up to max_context_lines on each side.
+        
+        Args:
+            content: Full file content
+            line_start: Offset of the first character of the matched line
+            line_end: Offset of the newline ending the matched line, or the
+                content length for the last line
             
         Returns:
-            List of context lines
+            Tuple of (context_before, context_after) lines
         """
-        start_idx = max(0, current_line + start_offset)
-        end_idx = min(len(lines), current_line + end_offset)
+        context_before = []
+        start = line_start
+        while start and len(context_before) < self.max_context_lines:
+            end = start - 1
+            start = content.rfind('\n', 0, end) + 1
+            context_before.append(content[start:end].strip())
+        context_before.reverse()
+        
+        context_after = []
+        end = line_end
+        while end < len(content) and len(context_after) < self.max_context_lines:
+            start = end + 1
+            end = content.find('\n', start)
+            if end == -1:
+                end = len(content)
+            context_after.append(content[start:end].strip())
         
-        return [lines[i].strip() for i in range(start_idx, end_idx)]
+        return context_before, context_after
     
-    def _is_likely_binary(self, file_path: Path) -> bool:
+    @staticmethod
+    def _is_likely_binary(file_path: Union[str, Path]) -> bool:
         """
         Quick check if file is likely binary.
         
@@ -340,23 +728,18 @@ class SearchEngine:
             True if likely binary
         """
         # Check extension first
-        binary_extensions = {
-            '.exe', '.dll', '.so', '.dylib', '.a', '.lib',
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico',
-            '.mp3', '.wav', '.mp4', '.avi', '.zip', '.tar',
-            '.gz', '.pdf', '.doc', '.docx', '.pyc', '.pyo'
-        }
-        
-        if file_path.suffix.lower() in binary_extensions:
+        if os.path.splitext(file_path)[1].lower() in _BINARY_EXTENSIONS:
             return True
         
-        # Quick content check
+        # Quick content check on the first page; a raw descriptor skips the
+        # fstat/ioctl/lseek calls a buffered file object makes on open
         try:
-            with open(file_path, 'rb') as f:
-                chunk = f.read(512)  # Read first 512 bytes
-                if b'\x00' in chunk:  # Null bytes indicate binary
-                    return True
-        except Exception:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                chunk = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+        except OSError:
             return True  # If we can't read it, assume binary
         
-        return False
\ No newline at end of file
+        return b'\x00' in chunk  # Null bytes indicate binary
\ No newline at end of file
@@ -6,6 +6,7 @@ file analysis capabilities to AI assistants through standardized tools.
 """
 
 import asyncio
+import json
 from typing import Any, Dict, List, Optional
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -25,6 +26,103 @@ from .models import AnalysisResult, DirectoryAnalysis, SearchResult
 from .analyzer_service import FileAnalyzerService
 from .config import FileAnalyzerConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Tool definitions advertised by list_tools. They never change at runtime,
+# so they are built once at import time.
+_TOOLS = (
+    Tool(
+        name="analyze_file",
+        description="Analyze a single file for code metrics, structure, and quality indicators",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to analyze"
+                },
+                "analysis_type": {
+                    "type": "string",
+                    "enum": ["basic", "full", "metrics"],
+                    "default": "full",
+                    "description": "Type of analysis to perform"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="analyze_directory",
+        description="Analyze a directory and its contents recursively",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Path to the directory to analyze"
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Whether to analyze subdirectories recursively"
+                },
+                "filters": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "File extension filters (e.g., ['.py', '.js'])"
+                }
+            },
+            "required": ["directory_path"]
+        }
+    ),
+    Tool(
+        name="search_files",
+        description="Search for files or content using patterns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Search pattern (glob, regex, or text)"
+                },
+                "search_type": {
+                    "type": "string",
+                    "enum": ["glob", "regex", "content"],
+                    "default": "glob",
+                    "description": "Type of search to perform"
+                },
+                "filters": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "File extension filters"
+                }
+            },
+            "required": ["pattern"]
+        }
+    )
+)
+
+
+def _dumps_json(data: Dict[str, Any]) -> str:
+    """
+    Serialize a response payload as indented JSON.
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    
+    Args:
+        data: JSON-compatible response dictionary
+        
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
 
 class FileAnalyzerMCPServer:
     """
@@ -39,6 +137,11 @@ class FileAnalyzerMCPServer:
         self.config = config or FileAnalyzerConfig()
         self.server = Server(self.config.server.name)
         self.analyzer_service = FileAnalyzerService()
+        self._tool_handlers = {
+            "analyze_file": self.handle_analyze_file,
+            "analyze_directory": self.handle_analyze_directory,
+            "search_files": self.handle_search_files,
+        }
         self._setup_handlers()
     
     def _setup_handlers(self):
@@ -79,77 +182,7 @@ class FileAnalyzerMCPServer:
         Returns:
             List of available analysis tools
         """
-        return [
-            Tool(
-                name="analyze_file",
-                description="Analyze a single file for code metrics, structure, and quality indicators",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to analyze"
-                        },
-                        "analysis_type": {
-                            "type": "string",
-                            "enum": ["basic", "full", "metrics"],
-                            "default": "full",
-                            "description": "Type of analysis to perform"
-                        }
-                    },
-                    "required": ["file_path"]
-                }
-            ),
-            Tool(
-                name="analyze_directory",
-                description="Analyze a directory and its contents recursively",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "directory_path": {
-                            "type": "string",
-                            "description": "Path to the directory to analyze"
-                        },
-                        "recursive": {
-                            "type": "boolean",
-                            "default": True,
-                            "description": "Whether to analyze subdirectories recursively"
-                        },
-                        "filters": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "File extension filters (e.g., ['.py', '.js'])"
-                        }
-                    },
-                    "required": ["directory_path"]
-                }
-            ),
-            Tool(
-                name="search_files",
-                description="Search for files or content using patterns",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pattern": {
-                            "type": "string",
-                            "description": "Search pattern (glob, regex, or text)"
-                        },
-                        "search_type": {
-                            "type": "string",
-                            "enum": ["glob", "regex", "content"],
-                            "default": "glob",
-                            "description": "Type of search to perform"
-                        },
-                        "filters": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "File extension filters"
-                        }
-                    },
-                    "required": ["pattern"]
-                }
-            )
-        ]
+        return list(_TOOLS)
     
     async def handle_call_tool(self, request: CallToolRequest) -> List[TextContent | ImageContent | EmbeddedResource]:
         """
@@ -161,18 +194,15 @@ class FileAnalyzerMCPServer:
         Returns:
             Tool execution results
         """
+        handler = self._tool_handlers.get(request.name)
+        if handler is None:
+            return [TextContent(
+                type="text", 
+                text=f"Unknown tool: {request.name}"
+            )]
+        
         try:
-            if request.name == "analyze_file":
-                return await self.handle_analyze_file(request)
-            elif request.name == "analyze_directory":
-                return await self.handle_analyze_directory(request)
-            elif request.name == "search_files":
-                return await self.handle_search_files(request)
-            else:
-                return [TextContent(
-                    type="text", 
-                    text=f"Unknown tool: {request.name}"
-                )]
+            return await handler(request)
         except Exception as e:
             return [TextContent(
                 type="text",
@@ -201,19 +231,15 @@ class FileAnalyzerMCPServer:
                 )]
             
             # Perform analysis
-            result = self.analyzer_service.analyze_file(file_path, analysis_type)
-            
-            # Format result as JSON
-            import json
-            from datetime import datetime
+            result = await self.analyzer_service.analyze_file_async(file_path, analysis_type)
             
-            # Convert datetime to string for JSON serialization
+            # Format result as JSON, with the timestamp as an ISO string
             result_dict = {
                 "file_path": result.file_path,
                 "file_size": result.file_size,
                 "line_count": result.line_count,
                 "language": result.language,
-                "last_modified": result.last_modified.isoformat() if result.last_modified else None,
+                "last_modified": result.last_modified_datetime.isoformat() if result.last_modified is not None else None,
                 "is_binary": result.is_binary,
                 "encoding": result.encoding,
                 "metrics": None,
@@ -242,7 +268,7 @@ class FileAnalyzerMCPServer:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(result_dict, indent=2)
+                text=_dumps_json(result_dict)
             )]
             
         except Exception as e:
@@ -271,9 +297,8 @@ class FileAnalyzerMCPServer:
                     text="Error: directory_path parameter is required"
                 )]
             
-            result = self.analyzer_service.analyze_directory(directory_path, recursive)
+            result = await self.analyzer_service.analyze_directory_async(directory_path, recursive)
             
-            import json
             result_dict = {
                 "directory_path": result.directory_path,
                 "total_files": result.total_files,
@@ -286,7 +311,7 @@ class FileAnalyzerMCPServer:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(result_dict, indent=2)
+                text=_dumps_json(result_dict)
             )]
             
         except Exception as e:
@@ -315,9 +340,8 @@ class FileAnalyzerMCPServer:
                     text="Error: pattern parameter is required"
                 )]
             
-            result = self.analyzer_service.search_files(pattern, search_type)
+            result = await self.analyzer_service.search_files_async(pattern, search_type)
             
-            import json
             result_dict = {
                 "total_matches": result.total_matches,
                 "search_time": result.search_time,
@@ -338,7 +362,7 @@ class FileAnalyzerMCPServer:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(result_dict, indent=2)
+                text=_dumps_json(result_dict)
             )]
             
         except Exception as e:
@@ -349,4 +373,7 @@ class FileAnalyzerMCPServer:
     
     def run(self):
         """Run the MCP server."""
-        asyncio.run(self.server.run())
\ No newline at end of file
+        try:
+            asyncio.run(self.server.run())
+        finally:
+            self.analyzer_service.shutdown()
\ No newline at end of file
@@ -7,6 +7,8 @@ import asyncio
 import json
 import sys
 import os
+import time
+from collections import namedtuple
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -14,9 +16,77 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from file_analyzer_mcp.server import FileAnalyzerMCPServer
 from mcp.types import CallToolRequest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Responses can be large for directory and content results; parse them with
+# orjson when it is installed
+loads = orjson.loads if orjson is not None else json.loads
+
+# Stand-in for CallToolRequest: the handlers only read name and arguments
+MockRequest = namedtuple("MockRequest", ("name", "arguments"))
+
+
+async def invoke(server, request):
+    """Call a tool and parse its JSON response, or return None if it returned nothing."""
+    result = await server.handle_call_tool(request)
+    if result and len(result) > 0:
+        return loads(result[0].text)
+    return None
+
+
+def print_file_result(result_data):
+    """Print the highlights of an analyze_file response."""
+    print(f"Analysis successful!")
+    print(f"  Language: {result_data['language']}")
+    print(f"  Lines: {result_data['line_count']}")
+    print(f"  Size: {result_data['file_size']} bytes")
+    if result_data['metrics']:
+        print(f"  Functions: {result_data['metrics']['function_count']}")
+        print(f"  Classes: {result_data['metrics']['class_count']}")
+        print(f"  Complexity: {result_data['metrics']['cyclomatic_complexity']}")
+
+
+def print_directory_result(result_data):
+    """Print an analyze_directory response."""
+    print(f"Directory analysis result: {result_data}")
+
+
+def print_search_result(result_data):
+    """Print the highlights of a search_files response."""
+    print(f"Search completed!")
+    print(f"  Total matches: {result_data['total_matches']}")
+    print(f"  Search time: {result_data['search_time']:.3f}s")
+    print(f"  First match: {result_data['matches'][0]['file_path'] if result_data['matches'] else 'None'}")
+
+
+def prewarm(paths):
+    """Read the given files and directory contents once so timings start warm."""
+    for path in paths:
+        if os.path.isfile(path):
+            files = [path]
+        elif os.path.isdir(path):
+            files = [entry.path for entry in os.scandir(path) if entry.is_file()]
+        else:
+            continue
+        for file_path in files:
+            try:
+                with open(file_path, 'rb') as file:
+                    while file.read(1024 * 1024):
+                        pass
+            except OSError:
+                pass
+
 
 async def test_server():
-    """Test the MCP server functionality."""
+    """
+    Test the MCP server functionality.
+    
+    Returns:
+        True if every tool call returned a usable response
+    """
     print("Testing File Analyzer MCP Server...")
     
     # Create server instance
@@ -27,82 +97,70 @@ async def test_server():
     tools = await server.handle_list_tools()
     print(f"Available tools: {[tool.name for tool in tools]}")
     
-    # Test analyze_file
-    print("\n2. Testing analyze_file...")
+    requests = [
+        MockRequest(
+            name="analyze_file",
+            arguments={
+                "file_path": "file-analyzer-mcp/src/file_analyzer_mcp/models.py",
+                "analysis_type": "full"
+            }
+        ),
+        MockRequest(
+            name="analyze_directory",
+            arguments={
+                "directory_path": "file-analyzer-mcp/src/file_analyzer_mcp",
+                "recursive": False
+            }
+        ),
+        MockRequest(
+            name="search_files",
+            arguments={
+                "pattern": "class",
+                "search_type": "content"
+            }
+        ),
+    ]
     
-    # Create a mock request object
-    class MockRequest:
-        def __init__(self, name, arguments):
-            self.name = name
-            self.arguments = arguments
+    # Load the analyzed files into the page cache first, so the timing below
+    # measures the analysis rather than cold disk reads
+    prewarm([
+        requests[0].arguments["file_path"],
+        requests[1].arguments["directory_path"],
+    ])
     
-    request = MockRequest(
-        name="analyze_file",
-        arguments={
-            "file_path": "file-analyzer-mcp/src/file_analyzer_mcp/models.py",
-            "analysis_type": "full"
-        }
+    # The tool calls are independent, so run them concurrently
+    start_time = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(invoke(server, request) for request in requests),
+        return_exceptions=True
     )
+    elapsed = time.perf_counter() - start_time
     
-    try:
-        result = await server.handle_call_tool(request)
-        if result and len(result) > 0:
-            # Parse the JSON result
-            result_data = json.loads(result[0].text)
-            print(f"Analysis successful!")
-            print(f"  Language: {result_data['language']}")
-            print(f"  Lines: {result_data['line_count']}")
-            print(f"  Size: {result_data['file_size']} bytes")
-            if result_data['metrics']:
-                print(f"  Functions: {result_data['metrics']['function_count']}")
-                print(f"  Classes: {result_data['metrics']['class_count']}")
-                print(f"  Complexity: {result_data['metrics']['cyclomatic_complexity']}")
-        else:
-            print("No result returned")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    # Test analyze_directory
-    print("\n3. Testing analyze_directory...")
-    request = MockRequest(
-        name="analyze_directory",
-        arguments={
-            "directory_path": "file-analyzer-mcp/src/file_analyzer_mcp",
-            "recursive": False
-        }
-    )
+    failures = []
+    steps = zip(range(2, 5), requests, outcomes,
+                (print_file_result, print_directory_result, print_search_result))
+    for number, request, outcome, print_result in steps:
+        print(f"\n{number}. Testing {request.name}...")
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
+            if outcome is None:
+                print("No result returned")
+            else:
+                print_result(outcome)
+        except Exception as e:
+            print(f"Error: {e}")
+            failures.append(request.name)
     
-    try:
-        result = await server.handle_call_tool(request)
-        if result and len(result) > 0:
-            result_data = json.loads(result[0].text)
-            print(f"Directory analysis result: {result_data}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    # Test search_files
-    print("\n4. Testing search_files...")
-    request = MockRequest(
-        name="search_files",
-        arguments={
-            "pattern": "class",
-            "search_type": "content"
-        }
-    )
+    print(f"\nTool calls completed in {elapsed:.3f}s")
     
-    try:
-        result = await server.handle_call_tool(request)
-        if result and len(result) > 0:
-            result_data = json.loads(result[0].text)
-            print(f"Search completed!")
-            print(f"  Total matches: {result_data['total_matches']}")
-            print(f"  Search time: {result_data['search_time']:.3f}s")
-            print(f"  First match: {result_data['matches'][0]['file_path'] if result_data['matches'] else 'None'}")
-    except Exception as e:
-        print(f"Error: {e}")
+    if failures:
+        print(f"\nMCP Server test failed: {', '.join(failures)}")
+        return False
     
     print("\nMCP Server test completed!")
+    return True
 
 
 if __name__ == "__main__":
-    asyncio.run(test_server())
\ No newline at end of file
+    sys.exit(0 if asyncio.run(test_server()) else 1)
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Unit tests for the analyzer service.
+"""
+
+import os
+
+import pytest
+from file_analyzer_mcp.analyzer_service import FileAnalyzerService
+
+
+class TestFileAnalyzerService:
+    """Test cases for FileAnalyzerService."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = FileAnalyzerService()
+    
+    def teardown_method(self):
+        """Shut down the service's worker pools."""
+        self.service.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_analyze_files_async_preserves_order(self, tmp_path):
+        """Test concurrent analysis returns results in input order."""
+        paths = []
+        for index in range(5):
+            path = tmp_path / f"module_{index}.py"
+            path.write_text("x = 1\n" * (index + 1))
+            paths.append(str(path))
+        
+        results = await self.service.analyze_files_async(paths)
+        assert [result.file_path for result in results] == paths
+        assert [result.line_count for result in results] == [1, 2, 3, 4, 5]
+    
+    @pytest.mark.asyncio
+    async def test_analyze_directory_async(self, tmp_path):
+        """Test directory analysis through the async wrapper."""
+        (tmp_path / "a.py").write_text("print('a')\n")
+        (tmp_path / "b.js").write_text("console.log('b');\n")
+        
+        result = await self.service.analyze_directory_async(str(tmp_path))
+        assert result.total_files == 2
+        assert result.languages == {"python": 1, "javascript": 1}
+    
+    @pytest.mark.asyncio
+    async def test_analyze_file_and_search_async(self, tmp_path):
+        """Test single-file analysis and search through the async wrappers."""
+        path = tmp_path / "a.py"
+        path.write_text("def f():\n    return 1\n")
+        
+        result = await self.service.analyze_file_async(str(path))
+        assert result.language == "python"
+        assert result.metrics.function_count == 1
+        
+        search = await self.service.search_files_async("return", "content", str(tmp_path))
+        assert [(m.file_path, m.line_number) for m in search.matches] == [(str(path), 2)]
+    
+    def test_analyze_file_uses_cache_until_file_changes(self, tmp_path):
+        """Test cached results are reused and invalidated on modification."""
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n")
+        os.utime(path, (1704110400, 1704110400))
+        
+        first = self.service.analyze_file(str(path))
+        second = self.service.analyze_file(str(path))
+        assert second == first
+        assert second is not first
+        assert len(self.service._result_cache) == 1
+        
+        path.write_text("x = 1\ny = 2\n")
+        third = self.service.analyze_file(str(path))
+        assert third.line_count == 2
+    
+    def test_analyze_file_skips_cache_for_racy_mtime(self, tmp_path):
+        """Test files modified within the racy window are not cached."""
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n")
+        
+        self.service.analyze_file(str(path))
+        assert len(self.service._result_cache) == 0
+    
+    @pytest.mark.parametrize("single_process", [True, False])
+    def test_analyze_directory_files(self, tmp_path, single_process):
+        """Test per-file directory analysis on threads and on a process pool."""
+        for index in range(4):
+            (tmp_path / f"module_{index}.py").write_text("def f():\n    pass\n")
+        self.service.process_pool_min_files = 1
+        
+        results = self.service.analyze_directory_files(
+            str(tmp_path), single_process=single_process
+        )
+        assert len(results) == 4
+        assert all(result.metrics.function_count == 1 for result in results)
+    
+    def test_analyze_files_on_process_pool_preserves_order(self, tmp_path):
+        """Test an explicit batch analyzed on a process pool keeps input order."""
+        paths = []
+        for index in range(3):
+            path = tmp_path / f"module_{index}.py"
+            path.write_text("x = 1\n" * (index + 1))
+            os.utime(path, (1704110400, 1704110400))
+            paths.append(path)
+        self.service.process_pool_min_files = 1
+        
+        results = self.service.analyze_files(paths)
+        assert [result.file_path for result in results] == [str(path) for path in paths]
+        assert [result.line_count for result in results] == [1, 2, 3]
+        # Worker results land in the parent's cache and are served from it
+        assert len(self.service._result_cache) == 3
+        assert self.service.analyze_files(paths[::-1]) == results[::-1]
@@ -0,0 +1,306 @@
+"""
+Unit tests for code analyzers.
+"""
+
+import ast
+
+import pytest
+from file_analyzer_mcp.analyzers import base, generic_analyzer
+from file_analyzer_mcp.analyzers.base import BaseAnalyzer, LineLocator
+from file_analyzer_mcp.analyzers.generic_analyzer import GenericAnalyzer
+from file_analyzer_mcp.analyzers.python_analyzer import PythonAnalyzer
+
+
+class TestBaseAnalyzer:
+    """Test cases for shared BaseAnalyzer helpers."""
+    
+    @pytest.mark.parametrize("content,expected", [
+        ("", 0),
+        ("one", 1),
+        ("one\ntwo\n", 2),
+        ("one\ntwo", 2),
+    ])
+    def test_count_lines_text(self, content, expected):
+        """Test line counting on decoded content."""
+        assert BaseAnalyzer.count_lines(content) == expected
+    
+    @pytest.mark.parametrize("content,expected", [
+        (b"", 0),
+        (b"one\r\ntwo\rthree", 3),
+        (b"one\r\n", 1),
+        (b"one\ntwo\n", 2),
+    ])
+    def test_count_lines_bytes(self, content, expected):
+        """Test raw byte counting matches text-mode newline handling."""
+        assert BaseAnalyzer.count_lines(content) == expected
+    
+    def test_count_lines_in_slices(self, monkeypatch):
+        """Test a CRLF split across slices is counted once."""
+        monkeypatch.setattr(base, "_LINE_COUNT_CHUNK_SIZE", 4)
+        assert BaseAnalyzer.count_lines(b"one\r\ntwo\r\nthree\rfour") == 4
+        assert BaseAnalyzer.count_lines(b"abc\r") == 1
+    
+    def test_code_metrics_reused_for_identical_content(self, monkeypatch):
+        """Test identical content is analyzed once and TODOs follow the path."""
+        analyzer = PythonAnalyzer()
+        content = "x = 1  # TODO: tidy\n"
+        first = analyzer.get_code_metrics(content, "a.py")
+        
+        def fail(*args):
+            raise AssertionError("content was analyzed again")
+        
+        monkeypatch.setattr(analyzer, "analyze_code", fail)
+        second = analyzer.get_code_metrics(content, "b.py")
+        assert second.function_count == first.function_count
+        assert [todo.file_path for todo in second.todos] == ["b.py"]
+        assert [todo.file_path for todo in first.todos] == ["a.py"]
+        
+        analyzer.clear_cache()
+        with pytest.raises(AssertionError):
+            analyzer.get_code_metrics(content, "c.py")
+    
+    def test_raw_content_digest(self):
+        """Test raw keys depend on the encoding and differ from text keys."""
+        data = "x = 1\n".encode("utf-8")
+        assert BaseAnalyzer.raw_content_digest(data, "utf-8") == \
+            BaseAnalyzer.raw_content_digest(bytearray(data), "utf-8")
+        assert BaseAnalyzer.raw_content_digest(data, "utf-8") != \
+            BaseAnalyzer.raw_content_digest(data, "latin-1")
+    
+    def test_analyze_file_reuses_metrics_for_duplicate_files(self, tmp_path, monkeypatch):
+        """Test a second file with the same bytes is not analyzed again."""
+        analyzer = PythonAnalyzer()
+        first, second = tmp_path / "a.py", tmp_path / "b.py"
+        first.write_text("def f():\n    pass  # TODO: x\n")
+        second.write_text(first.read_text())
+        assert analyzer.analyze_file(str(first)).metrics.function_count == 1
+        
+        def fail(*args):
+            raise AssertionError("content was analyzed again")
+        
+        monkeypatch.setattr(analyzer, "analyze_code", fail)
+        result = analyzer.analyze_file(str(second))
+        assert result.metrics.function_count == 1
+        assert result.metrics.todos[0].file_path == str(second)
+    
+    @pytest.mark.parametrize("lines,complexity,comment_lines,expected", [
+        (0, 1.0, 0, 100.0),
+        (10, 2.0, 3, 100),
+        (200, 20.0, 30, 53.31),
+        (100000, 500.0, 0, 0),
+    ])
+    def test_maintainability_index(self, lines, complexity, comment_lines, expected):
+        """Test the index formula and its clamping to 0-100."""
+        analyzer = PythonAnalyzer()
+        assert analyzer.calculate_maintainability_index(lines, complexity, comment_lines) == expected
+    
+    def test_count_line_types(self):
+        """Test blank and comment line classification."""
+        content = "code\n\n   \n# hash\n  // slash\n/* block\n * star\n-- dash\nx = 1 # tail\n"
+        assert GenericAnalyzer().count_line_types(content) == (10, 3, 5)
+    
+    @pytest.mark.parametrize("line,expected", [
+        ("# hash", True),
+        ("// slash", True),
+        ("/* block", True),
+        ("* star", True),
+        ("-- dash", True),
+        ("% percent", True),
+        ("; semi", True),
+        ("/ divide", False),
+        ("- minus", False),
+        ("code", False),
+        ("", False),
+        ("\u00e9t\u00e9", False),
+    ])
+    def test_is_comment_line(self, line, expected):
+        """Test comment prefix detection."""
+        assert GenericAnalyzer().is_comment_line(line) is expected
+    
+    def test_get_file_metadata_follows_symlinks(self, tmp_path):
+        """Test symlinks report the target's size and are flagged."""
+        target = tmp_path / "target.txt"
+        target.write_text("hello\n")
+        link = tmp_path / "link.txt"
+        link.symlink_to(target)
+        analyzer = GenericAnalyzer()
+        
+        metadata = analyzer.get_file_metadata(link)
+        assert metadata.is_symlink and metadata.is_file
+        assert metadata.size == 6
+        assert not analyzer.get_file_metadata(tmp_path / "missing").exists
+
+
+class TestLineLocator:
+    """Test cases for LineLocator."""
+    
+    def test_line_numbers_and_text(self):
+        """Test offsets map to lines in and out of ascending order."""
+        locator = LineLocator("one\ntwo\n\nfour")
+        assert locator.line_number(0) == 1
+        assert locator.line_number(5) == 2
+        assert locator.line_number(12) == 4
+        assert locator.line_number(4) == 2
+        assert locator.line(5) == "two"
+        assert locator.line(8) == ""
+        assert locator.line(12) == "four"
+
+
+class TestPythonAnalyzer:
+    """Test cases for PythonAnalyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = PythonAnalyzer()
+    
+    def test_collect_metrics_matches_extractors(self):
+        """Test single-pass metrics agree with the detailed extractors."""
+        tree = self.analyzer.parse_ast(
+            "import os, sys\n"
+            "from pathlib import Path\n"
+            "class A:\n"
+            "    def m(self, x):\n"
+            "        if x and self or x:\n"
+            "            return [i for i in x if i]\n"
+            "async def f():\n"
+            "    for _ in range(3):\n"
+            "        pass\n"
+        )
+        assert self.analyzer.collect_metrics(tree) == (
+            len(self.analyzer.extract_functions(tree)),
+            len(self.analyzer.extract_classes(tree)),
+            len(self.analyzer.extract_imports(tree)),
+            self.analyzer.calculate_complexity(tree),
+        )
+        assert self.analyzer.collect_metrics(tree) == (2, 1, 3, 9.0)
+    
+    def test_parse_ast_returns_none_on_syntax_error(self):
+        """Test valid source parses and invalid source yields None."""
+        assert isinstance(self.analyzer.parse_ast("def f():\n    return 1\n"), ast.Module)
+        assert self.analyzer.parse_ast("def f(:\n") is None
+    
+    def test_statement_scans_find_nested_definitions(self):
+        """Test classes under try/except and other blocks are found in walk order."""
+        tree = self.analyzer.parse_ast(
+            "class A:\n"
+            "    class B:\n"
+            "        pass\n"
+            "try:\n"
+            "    import json\n"
+            "except ImportError:\n"
+            "    class C:\n"
+            "        pass\n"
+            "if True:\n"
+            "    class D:\n"
+            "        pass\n"
+        )
+        classes = self.analyzer.extract_classes(tree)
+        assert [c['name'] for c in classes] == ['A', 'B', 'D', 'C']
+        assert [c['name'] for c in classes] == [
+            node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+        ]
+        assert [i['module'] for i in self.analyzer.extract_imports(tree)] == ['json']
+    
+    @pytest.mark.parametrize("module_name,expected", [
+        ("os", True),
+        ("os.path", True),
+        ("concurrent.futures", True),
+        ("typing", True),
+        ("dataclasses", True),
+        ("requests", False),
+        ("", False),
+    ])
+    def test_is_standard_library(self, module_name, expected):
+        """Test stdlib detection uses the top-level module name."""
+        assert self.analyzer._is_standard_library(module_name) is expected
+    
+    def test_find_todos(self):
+        """Test TODO markers are found with line numbers and priority order."""
+        content = (
+            "x = 1  # todo: tidy up\n"
+            "# plain comment\n"
+            "# NOTE see TODO below\n"
+            "y = '#'  # hack:\n"
+        )
+        todos = self.analyzer.find_todos(content, "sample.py")
+        assert [(t.line_number, t.comment_type, t.text) for t in todos] == [
+            (1, "TODO", "tidy up"),
+            (3, "TODO", "below"),
+            (4, "HACK", "y = '#'  # hack:"),
+        ]
+
+
+class TestGenericAnalyzer:
+    """Test cases for GenericAnalyzer."""
+    
+    SOURCE = (
+        "import fs from 'fs';\n"
+        "const util = require('util');\n"
+        "// TODO: handle errors\n"
+        "class Store extends Base {\n"
+        "  /* FIXME racy */\n"
+        "  save(x) {\n"
+        "    if (x && y || z) { return a ? b : c; }\n"
+        "    for (const k of x) {}\n"
+        "  }\n"
+        "}\n"
+        "function load(path) {\n"
+        "  while (true) { break; }\n"
+        "}\n"
+        "const run = async () => {};\n"
+    )
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = GenericAnalyzer()
+    
+    def test_extract_functions_regex(self):
+        """Test function matches from every language pattern are reported."""
+        functions = self.analyzer.extract_functions_regex(self.SOURCE)
+        assert [(f['name'], f['line_number']) for f in functions] == [
+            ('save', 6), ('if', 7), ('for', 8),
+            ('load', 11), ('load', 11), ('load', 11), ('load', 11),
+            ('while', 12), ('run', 14),
+        ]
+    
+    def test_extract_classes_regex(self):
+        """Test class matches from every language pattern are reported."""
+        classes = self.analyzer.extract_classes_regex(self.SOURCE)
+        assert [(c['name'], c['line_number']) for c in classes] == [('Store', 4)] * 6
+    
+    def test_candidate_lines_match_full_scan(self):
+        """Test extraction restricted to candidate lines matches a full scan."""
+        all_lines = list(enumerate(self.SOURCE.split("\n"), 1))
+        assert self.analyzer.extract_functions_regex(self.SOURCE) == \
+            self.analyzer.extract_functions_regex(self.SOURCE, all_lines)
+        assert self.analyzer.extract_classes_regex(self.SOURCE) == \
+            self.analyzer.extract_classes_regex(self.SOURCE, all_lines)
+        assert self.analyzer.find_todos(self.SOURCE, "x.js") == \
+            self.analyzer.find_todos(self.SOURCE, "x.js", all_lines)
+    
+    def test_candidate_lines_match_without_hyperscan(self, monkeypatch):
+        """Test the Hyperscan and regex trigger scans find the same lines."""
+        if generic_analyzer._TRIGGER_DATABASE is None:
+            pytest.skip("hyperscan is not installed")
+        
+        with_hyperscan = self.analyzer.find_candidate_lines(self.SOURCE)
+        monkeypatch.setattr(generic_analyzer, "_TRIGGER_DATABASE", None)
+        assert self.analyzer.find_candidate_lines(self.SOURCE) == with_hyperscan
+    
+    def test_counts_and_todos(self):
+        """Test import, complexity and TODO extraction."""
+        assert self.analyzer.count_imports(self.SOURCE) == 2
+        assert self.analyzer.calculate_basic_complexity(self.SOURCE) == 5.0
+        todos = self.analyzer.find_todos(self.SOURCE, "store.js")
+        assert [(t.line_number, t.comment_type, t.text) for t in todos] == [
+            (3, 'TODO', 'handle errors'),
+            (5, 'FIXME', 'racy'),
+        ]
+    
+    def test_todo_with_unicode_case_variant(self):
+        """Test a marker matched only through Unicode case folding is still reported."""
+        source = "// HAC\u212a: fix\n"  # KELVIN SIGN folds to 'k'
+        todos = self.analyzer.find_todos(source, "a.js", [(1, source.rstrip("\n"))])
+        assert [(t.line_number, t.comment_type, t.text) for t in todos] == [
+            (1, 'HAC\u212a', 'fix'),
+        ]
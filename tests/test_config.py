@@ -0,0 +1,113 @@
+"""
+Unit tests for configuration loading.
+"""
+
+import os
+
+import file_analyzer_mcp.config as config_module
+from file_analyzer_mcp.config import FileAnalyzerConfig, load_config
+
+
+class TestFileAnalyzerConfig:
+    """Test cases for FileAnalyzerConfig."""
+    
+    def test_from_dict_round_trip(self):
+        """Test a dictionary produced by to_dict loads back unchanged."""
+        config = FileAnalyzerConfig()
+        config.analysis.chunk_size = 4096
+        config.security.restricted_paths = ["/etc"]
+        config.logging.level = "DEBUG"
+        config.server.debug = True
+        
+        assert FileAnalyzerConfig.from_dict(config.to_dict()) == config
+    
+    def test_from_dict_ignores_unknown_keys(self):
+        """Test unknown sections and fields are skipped."""
+        config = FileAnalyzerConfig.from_dict({
+            "analysis": {"max_context_lines": 5, "unknown": 1},
+            "extra": {"debug": True},
+        })
+        
+        assert config.analysis.max_context_lines == 5
+        assert not hasattr(config.analysis, "unknown")
+        assert config.server == FileAnalyzerConfig().server
+    
+    def test_load_from_file(self, tmp_path):
+        """Test loading a JSON file and falling back on invalid JSON."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"analysis": {"chunk_size": 1024}}', encoding="utf-8")
+        assert FileAnalyzerConfig.load_from_file(str(config_file)).analysis.chunk_size == 1024
+        
+        config_file.write_text('{"analysis": ', encoding="utf-8")
+        assert FileAnalyzerConfig.load_from_file(str(config_file)) == FileAnalyzerConfig()
+        assert FileAnalyzerConfig.load_from_file(str(tmp_path / "missing.json")) == FileAnalyzerConfig()
+    
+    def test_load_config_reuses_unchanged_file(self, tmp_path, monkeypatch):
+        """Test an unchanged file is parsed once and edits are picked up."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"analysis": {"chunk_size": 1024}}', encoding="utf-8")
+        os.utime(config_file, (1704110400, 1704110400))
+        
+        first = load_config(str(config_file))
+        first.analysis.chunk_size = 1
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("configuration was parsed again")
+        
+        with monkeypatch.context() as patch:
+            patch.setattr(FileAnalyzerConfig, "load_from_file", fail)
+            assert load_config(str(config_file)).analysis.chunk_size == 1024
+        
+        config_file.write_text('{"analysis": {"chunk_size": 2048}}', encoding="utf-8")
+        assert load_config(str(config_file)).analysis.chunk_size == 2048
+        # Just-written files are too recent to be cached
+        assert str(config_file) not in config_module._CONFIG_CACHE
+    
+    def test_load_from_env(self, monkeypatch):
+        """Test environment variables override defaults and bad values are skipped."""
+        monkeypatch.setenv("FA_CHUNK_SIZE", "2048")
+        monkeypatch.setenv("FA_MAX_FILE_SIZE", "big")
+        monkeypatch.setenv("FA_RESTRICTED_PATHS", "/etc,/root")
+        monkeypatch.setenv("FA_LOG_LEVEL", "debug")
+        monkeypatch.setenv("FA_DEBUG", "")
+        monkeypatch.setenv("FA_ALLOW_SYMLINKS", "yes")
+        monkeypatch.setenv("FA_ALLOW_ABSOLUTE_PATHS", "False")
+        
+        config = FileAnalyzerConfig.load_from_env()
+        assert config.analysis.chunk_size == 2048
+        assert config.analysis.max_file_size == FileAnalyzerConfig().analysis.max_file_size
+        assert config.security.restricted_paths == ["/etc", "/root"]
+        assert config.logging.level == "DEBUG"
+        assert config.server.debug is False
+        assert config.security.allow_symlinks is True
+        assert config.security.allow_absolute_paths is False
+    
+    def test_validate(self):
+        """Test validation reports each out-of-range setting."""
+        config = FileAnalyzerConfig()
+        assert config.validate() == []
+        
+        config.analysis.chunk_size = 0
+        config.analysis.max_context_lines = 0
+        config.logging.backup_count = -1
+        config.logging.level = "VERBOSE"
+        errors = config.validate()
+        assert errors[:2] == ["chunk_size must be positive", "logging backup_count must be non-negative"]
+        assert errors[2].startswith("logging level must be one of")
+    
+    def test_default_config_search_is_remembered(self, tmp_path, monkeypatch):
+        """Test the default locations are searched once per working directory."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(config_module, "_DEFAULT_CONFIG_PATHS", (tmp_path / "default.json",))
+        monkeypatch.setattr(config_module, "_default_config_search", None)
+        assert load_config().analysis == FileAnalyzerConfig().analysis
+        
+        # A file created after a search that found nothing is not picked up
+        (tmp_path / "default.json").write_text('{"analysis": {"chunk_size": 512}}', encoding="utf-8")
+        assert load_config().analysis.chunk_size == FileAnalyzerConfig().analysis.chunk_size
+        
+        monkeypatch.setattr(config_module, "_default_config_search", None)
+        assert load_config().analysis.chunk_size == 512
+        
+        (tmp_path / "default.json").unlink()
+        assert load_config().analysis.chunk_size == FileAnalyzerConfig().analysis.chunk_size
@@ -0,0 +1,84 @@
+"""
+Unit tests for directory analysis.
+"""
+
+import os
+
+from file_analyzer_mcp.directory_analyzer import DirectoryAnalyzer
+
+
+class TestDirectoryAnalyzer:
+    """Test cases for DirectoryAnalyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.analyzer = DirectoryAnalyzer()
+    
+    def test_repeat_analysis_skips_rescan(self, tmp_path, monkeypatch):
+        """Test an unchanged directory is served from the cache."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        for path in (tmp_path / "a.py", tmp_path):
+            os.utime(path, (1704110400, 1704110400))
+        first = self.analyzer.analyze_directory(str(tmp_path))
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("directory was rescanned")
+        
+        monkeypatch.setattr(self.analyzer, "_walk_directory", fail)
+        second = self.analyzer.analyze_directory(str(tmp_path))
+        assert second == first
+        assert second is not first
+    
+    def test_racy_mtime_skips_cache(self, tmp_path):
+        """Test an analysis covering just-modified paths is not cached."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        self.analyzer.analyze_directory(str(tmp_path))
+        assert not self.analyzer._analysis_cache
+    
+    def test_changes_invalidate_cached_analysis(self, tmp_path):
+        """Test added, modified and ignored files trigger a rescan."""
+        (tmp_path / "sub").mkdir()
+        module = tmp_path / "sub" / "a.py"
+        module.write_text("x = 1\n")
+        assert self.analyzer.analyze_directory(str(tmp_path)).total_files == 1
+        
+        (tmp_path / "sub" / "b.js").write_text("let y;\n")
+        result = self.analyzer.analyze_directory(str(tmp_path))
+        assert result.total_files == 2
+        
+        module.write_text("x = 1\ny = 2\n")
+        assert self.analyzer.analyze_directory(str(tmp_path)).total_size == result.total_size + 6
+        
+        (tmp_path / ".gitignore").write_text("*.js\n")
+        assert self.analyzer.analyze_directory(str(tmp_path)).languages == {"python": 1}
+    
+    def test_should_ignore_matches_fnmatch_rules(self, tmp_path):
+        """Test compiled ignore patterns behave like per-pattern fnmatch."""
+        (tmp_path / ".gitignore").write_text("*.tmp\nsecret?.txt\ncache/\n# comment\n")
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache.txt").write_text("")
+        self.analyzer._load_gitignore_patterns(tmp_path)
+        
+        ignored = {
+            name for name in (
+                "a.tmp", "secret1.txt", "secret10.txt", "cache", "cache.txt",
+                "node_modules", "x.pyc", "main.py", "pkg.egg-info",
+            )
+            if self.analyzer._should_ignore(tmp_path / name)
+        }
+        assert ignored == {"a.tmp", "secret1.txt", "cache", "node_modules", "x.pyc", "pkg.egg-info"}
+    
+    def test_parallel_walk_matches_serial_order(self, tmp_path):
+        """Test subtrees scanned on the pool are merged back in scan order."""
+        for name in ("a", "b", "c"):
+            (tmp_path / name / "deep").mkdir(parents=True)
+            (tmp_path / name / "x.py").write_text("x = 1\n")
+            (tmp_path / name / "deep" / "y.py").write_text("y = 2\n")
+        self.analyzer._load_gitignore_patterns(tmp_path)
+        
+        parallel = self.analyzer.traverse_directory(tmp_path)
+        self.analyzer.max_workers = 1
+        serial, tree = self.analyzer._walk_directory(tmp_path, True, None, build_tree=True)
+        assert parallel == serial
+        assert len(parallel) == 6
+        assert tree.size == 36
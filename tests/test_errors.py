@@ -0,0 +1,45 @@
+"""
+Unit tests for error types and handling.
+"""
+
+import pickle
+
+from file_analyzer_mcp.errors import ErrorHandler, FileSizeError, SyntaxAnalysisError
+
+
+class TestFileAnalyzerError:
+    """Test cases for FileAnalyzerError and its subclasses."""
+    
+    def test_details_built_on_first_access(self):
+        """Test subclass details are built from their attributes on first access."""
+        error = SyntaxAnalysisError("bad syntax", "/a.py", "python", 3)
+        assert error._details is None
+        assert error.to_dict()["details"] == {"file_path": "/a.py", "language": "python", "line_number": 3}
+        assert error.line_number == 3
+    
+    def test_slotted_errors_pickle_round_trip(self):
+        """Test slot attributes survive pickling without an instance __dict__."""
+        error = FileSizeError("too big", "/b.bin", 10, 5)
+        assert error.__dict__ == {}
+        
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.to_dict() == error.to_dict()
+        assert restored.file_path == "/b.bin"
+
+
+class TestErrorHandler:
+    """Test cases for ErrorHandler."""
+    
+    def test_partial_failure_can_skip_error_serialization(self):
+        """Test counts are reported with raw errors when serialization is off."""
+        handler = ErrorHandler()
+        errors = [FileSizeError("too big", "/b.bin", 10, 5), ValueError("bad")]
+        failed = [{"path": "/b.bin"}, {"path": "/c"}]
+        
+        summary = handler.handle_partial_failure("scan", 4, failed, errors, serialize_errors=False)
+        assert (summary["success_count"], summary["success_rate"]) == (2, 0.5)
+        assert summary["errors"] == errors
+        
+        serialized = handler.handle_partial_failure("scan", 4, failed, errors)
+        assert serialized["errors"][0]["error_code"] == "FILE_SIZE_ERROR"
+        assert serialized["errors"][1]["error_code"] == "UNHANDLED_ERROR"
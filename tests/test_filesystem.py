@@ -0,0 +1,150 @@
+"""
+Unit tests for file system operations.
+"""
+
+import pytest
+from pathlib import Path
+from file_analyzer_mcp.filesystem import FileSystemManager
+
+
+class TestFileSystemManager:
+    """Test cases for FileSystemManager."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fs_manager = FileSystemManager()
+    
+    def test_batch_read_returns_leading_bytes(self, tmp_path):
+        """Test batch_read reads up to max_bytes from each file."""
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.bin"
+        first.write_bytes(b"hello world")
+        second.write_bytes(b"\x00\x01\x02")
+        
+        headers = self.fs_manager.batch_read([first, second], max_bytes=5)
+        assert headers[first] == b"hello"
+        assert headers[second] == b"\x00\x01\x02"
+    
+    def test_batch_read_skips_missing_files(self, tmp_path):
+        """Test batch_read omits files that cannot be opened."""
+        missing = tmp_path / "missing.txt"
+        headers = self.fs_manager.batch_read([missing])
+        assert missing not in headers
+    
+    def test_map_file_decodes_with_universal_newlines(self, tmp_path):
+        """Test mapped content decodes like a text-mode read."""
+        path = tmp_path / "mixed.txt"
+        path.write_bytes(b"one\r\ntwo\rthree\n")
+        
+        with self.fs_manager.map_file(path) as data:
+            content = self.fs_manager.decode_content(data)
+        assert content == "one\ntwo\nthree\n"
+    
+    def test_map_file_handles_empty_file(self, tmp_path):
+        """Test empty files map to an empty buffer."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        
+        with self.fs_manager.map_file(path) as data:
+            assert data == b""
+    
+    @pytest.mark.parametrize("data,expected", [
+        (b"plain ascii\n", "utf-8"),
+        ("café\n".encode("utf-8"), "utf-8"),
+        (b"\xef\xbb\xbfwith bom\n", "utf-8-sig"),
+        ("wide\n".encode("utf-16"), "utf-16"),
+        ("wider\n".encode("utf-32"), "utf-32"),
+    ])
+    def test_detect_encoding_fast_paths(self, tmp_path, data, expected):
+        """Test BOM and UTF-8 detection without a statistical detector."""
+        file_path = tmp_path / "sample.txt"
+        file_path.write_bytes(data)
+        assert self.fs_manager.detect_encoding(file_path) == expected
+    
+    def test_detect_encoding_tolerates_truncated_sample(self, tmp_path):
+        """Test a multi-byte character split by the sample limit stays UTF-8."""
+        file_path = tmp_path / "sample.txt"
+        file_path.write_bytes("é".encode("utf-8") * 10)
+        self.fs_manager.encoding_sample_size = 5
+        assert self.fs_manager.detect_encoding(file_path) == "utf-8"
+    
+    def test_check_read_access(self, tmp_path):
+        """Test the walk's read check accepts readable files and rejects missing ones."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("x")
+        assert self.fs_manager.check_read_access(str(file_path)) is True
+        assert self.fs_manager.check_read_access(tmp_path / "missing") is False
+    
+    def test_check_permissions(self, tmp_path):
+        """Test files, listable directories (empty or not) and missing paths."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("x")
+        (tmp_path / "empty").mkdir()
+        assert self.fs_manager.check_permissions(file_path) is True
+        assert self.fs_manager.check_permissions(tmp_path) is True
+        assert self.fs_manager.check_permissions(tmp_path / "empty") is True
+        assert self.fs_manager.check_permissions(tmp_path / "missing") is False
+    
+    def test_shared_fs_manager_is_reused(self):
+        """Test components share one default FileSystemManager."""
+        from file_analyzer_mcp.analyzers.generic_analyzer import GenericAnalyzer
+        from file_analyzer_mcp.filesystem import shared_fs_manager
+        
+        assert shared_fs_manager() is shared_fs_manager()
+        assert GenericAnalyzer().fs_manager is shared_fs_manager()
+    
+    def test_get_file_info_from_single_stat(self, tmp_path):
+        """Test file info flags for files, directories and missing paths."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_bytes(b"abc")
+        
+        info = self.fs_manager.get_file_info(file_path)
+        assert (info["size"], info["is_file"], info["is_dir"], info["exists"]) == (3, True, False, True)
+        
+        info = self.fs_manager.get_file_info(tmp_path)
+        assert (info["is_file"], info["is_dir"], info["exists"]) == (False, True, True)
+        
+        assert self.fs_manager.get_file_info(tmp_path / "missing")["exists"] is False
+    
+    def test_read_file_chunked_reports_unreadable_files(self, tmp_path):
+        """Test a failed open surfaces as IOError without a separate permission check."""
+        with pytest.raises(IOError):
+            list(self.fs_manager.read_file_chunked(tmp_path / "missing.txt"))
+    
+    def test_read_file_content_matches_chunked_read(self, tmp_path):
+        """Test the single-read path decodes like the streaming text reader."""
+        file_path = tmp_path / "mixed.txt"
+        file_path.write_bytes(b"a\r\nb\rc\n\xff" * 1000)
+        self.fs_manager.chunk_size = 7
+        
+        content = self.fs_manager.read_file_content(file_path)
+        assert content == "".join(self.fs_manager.read_file_chunked(file_path))
+        assert content.startswith("a\nb\nc\n\ufffd")
+    
+    def test_validate_path_checks_size_from_one_stat(self, tmp_path):
+        """Test missing paths and oversized files are rejected."""
+        file_path = tmp_path / "big.txt"
+        file_path.write_bytes(b"x" * 10)
+        self.fs_manager.max_file_size = 5
+        
+        with pytest.raises(ValueError, match="too large"):
+            self.fs_manager.validate_path(str(file_path))
+        with pytest.raises(ValueError, match="does not exist"):
+            self.fs_manager.validate_path(str(tmp_path / "missing"))
+        assert self.fs_manager.validate_path(str(tmp_path)) == tmp_path.resolve()
+    
+    def test_validate_path_reuses_resolved_parent(self, tmp_path):
+        """Test cached parents still resolve symlinks the way Path.resolve() does."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "a.py").write_text("x")
+        (tmp_path / "link").symlink_to(real)
+        (real / "alias.py").symlink_to(real / "a.py")
+        
+        for name in ("link/a.py", "link/alias.py", "link/a.py", "real/.", "link/.."):
+            path = str(tmp_path / name)
+            assert self.fs_manager.validate_path(path) == Path(path).resolve()
+        assert str(tmp_path / "link") in self.fs_manager._resolve_cache
+        
+        self.fs_manager.clear_cache()
+        assert not self.fs_manager._resolve_cache
@@ -0,0 +1,108 @@
+"""
+Unit tests for language detection.
+"""
+
+import os
+
+import pytest
+from file_analyzer_mcp.language_detector import LanguageDetector
+
+
+class TestLanguageDetector:
+    """Test cases for LanguageDetector."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = LanguageDetector()
+    
+    def test_known_extension_skips_content_sniff(self, tmp_path):
+        """Test a known extension decides the language without reading content."""
+        missing = tmp_path / "missing.py"
+        assert not self.detector.needs_content_sniff(missing)
+        
+        info = self.detector.get_file_type_info(missing)
+        assert info['language'] == 'python'
+        assert info['is_binary'] is False
+    
+    def test_binary_extension_wins_over_language(self, tmp_path):
+        """Test extensions listed as binary are reported as binary."""
+        info = self.detector.get_file_type_info(tmp_path / "Main.class")
+        assert info['language'] == 'binary'
+        assert info['is_binary'] is True
+    
+    def test_unknown_extension_sniffs_content(self, tmp_path):
+        """Test files without a known extension are classified from content."""
+        script = tmp_path / "script"
+        script.write_text("#!/usr/bin/env python3\nprint('hi')\n")
+        blob = tmp_path / "blob"
+        blob.write_bytes(b"\x00\x01\x02")
+        
+        assert self.detector.needs_content_sniff(script)
+        assert self.detector.get_file_type_info(blob)['is_binary'] is True
+        assert self.detector.get_file_type_info(
+            script, content=script.read_text()
+        )['language'] == 'python'
+
+    
+    def test_racy_mtime_bypasses_sniff_cache(self, tmp_path):
+        """Test a same-size rewrite within the racy window is sniffed again."""
+        blob = tmp_path / "blob"
+        blob.write_bytes(b"abc")
+        assert self.detector.is_binary_file(blob) is False
+        
+        mtime_ns = blob.stat().st_mtime_ns
+        blob.write_bytes(b"a\x00c")
+        os.utime(blob, ns=(mtime_ns, mtime_ns))
+        assert self.detector.is_binary_file(blob) is True
+    
+    @pytest.mark.parametrize("name", ["app.py", "Main.class", "Dockerfile", "notes.PY", "script", "a.spec"])
+    def test_detect_by_name_agrees_with_file_type_info(self, tmp_path, name):
+        """Test name-only classification matches the full check when it decides."""
+        path = tmp_path / name
+        path.write_text("plain text\n")
+        
+        language = self.detector.detect_by_name(path.name, path.suffix.lower())
+        if language is not None:
+            assert language == self.detector.get_file_type_info(path)['language']
+        else:
+            assert self.detector.needs_content_sniff(path)
+    
+    @pytest.mark.parametrize("content, expected", [
+        ("#!/usr/bin/env python3\nprint(1)\n", "python"),
+        ("#!/bin/bash -e\n", "shell"),
+        ("#!/opt/local/bin/ruby -w\n", "ruby"),
+        ("#!/usr/bin/env -S awk\n", "unknown"),
+        ("#!/usr/local/bin/PHP -q\n", "php"),
+        ("#!/opt/x-node\n", "javascript"),
+        ("#! -- /\n", "unknown"),
+        ("print(1)\n", "unknown"),
+    ])
+    def test_detect_by_shebang(self, content, expected):
+        """Test shebang prefixes and the interpreter fallback."""
+        assert self.detector.detect_by_shebang(content) == expected
+    
+    @pytest.mark.parametrize("content, expected", [
+        ("public class Main {}\ndef run(self):\n", "python"),
+        ("#include <stdio.h>\nfunction go(a) {\n", "javascript"),
+        ("   \n\t", "unknown"),
+        ("x = 1\n" * 1000 + "def late():\n", "unknown"),
+    ])
+    def test_detect_by_content(self, content, expected):
+        """Test heuristic priority and that only the head of the file is examined."""
+        assert self.detector.detect_by_content(content) == expected
+    
+    def test_binary_sniff_is_memoized_until_file_changes(self, tmp_path):
+        """Test content sniffs are cached per file version and read errors are not."""
+        path = tmp_path / "blob"
+        path.write_bytes(b"plain text\n")
+        os.utime(path, (1704110400, 1704110400))
+        assert self.detector.is_binary_file(path) is False
+        assert self.detector.is_binary_file(path) is False
+        assert self.detector._sniff_binary.cache_info().hits == 1
+        
+        path.write_bytes(b"\x00\x01\x02 and more bytes")
+        os.utime(path, (1704110401, 1704110401))
+        assert self.detector.is_binary_file(path) is True
+        
+        assert self.detector.is_binary_file(tmp_path / "missing") is True
+        assert self.detector._sniff_binary.cache_info().currsize == 2
@@ -2,6 +2,8 @@
 Unit tests for data models.
 """
 
+import copy
+import pickle
 import pytest
 from datetime import datetime
 from file_analyzer_mcp.models import (
@@ -14,6 +16,9 @@ from file_analyzer_mcp.models import (
     FileMatch
 )
 
+# Fixed epoch timestamp so results built in tests are deterministic
+_FROZEN_NOW = 1704110400.0
+
 
 class TestTodoItem:
     """Test cases for TodoItem dataclass."""
@@ -63,7 +68,7 @@ class TestAnalysisResult:
             file_size=1024,
             line_count=50,
             language="python",
-            last_modified=datetime.now(),
+            last_modified=_FROZEN_NOW,
             is_binary=False,
             encoding="utf-8",
             metrics=None,
@@ -72,4 +77,63 @@ class TestAnalysisResult:
         assert result.file_path == "/path/to/file.py"
         assert result.file_size == 1024
         assert result.language == "python"
-        assert not result.is_binary
\ No newline at end of file
+        assert not result.is_binary
+    
+    def test_last_modified_datetime(self):
+        """Test the epoch timestamp is converted to a datetime on access."""
+        result = AnalysisResult(
+            file_path="/path/to/file.py",
+            file_size=0,
+            line_count=0,
+            language="python",
+            last_modified=1700000000.0,
+            is_binary=False,
+            encoding="utf-8",
+            metrics=None,
+            errors=[]
+        )
+        assert result.last_modified_datetime == datetime.fromtimestamp(1700000000.0)
+        
+        result.last_modified = None
+        assert result.last_modified_datetime is None
+    
+    def test_analysis_result_uses_slots(self):
+        """Test results have no instance __dict__ but stay mutable and picklable."""
+        todo = TodoItem(3, "TODO", "tidy", "file.py")
+        metrics = CodeMetrics(1, 0, 0, 1, 0, 1.0, 100.0, [todo])
+        result = AnalysisResult("file.py", 10, 3, "python", None, False, "utf-8", metrics, [])
+        
+        for obj in (todo, metrics, result):
+            assert not hasattr(obj, "__dict__")
+        
+        result.errors = ["late error"]
+        assert pickle.loads(pickle.dumps(result)) == result
+
+
+class TestDirectoryTree:
+    """Test cases for DirectoryTree dataclass."""
+    
+    def test_directory_tree_uses_slots(self):
+        """Test nodes store fields in slots and still compare and copy as dataclasses."""
+        leaf = DirectoryTree(name="a.py", path="/d/a.py", is_directory=False, size=3, children=[])
+        tree = DirectoryTree(name="d", path="/d", is_directory=True, size=3, children=[leaf])
+        
+        assert not hasattr(tree, "__dict__")
+        with pytest.raises(AttributeError):
+            tree.extra = 1
+        
+        assert copy.deepcopy(tree) == tree
+
+
+class TestSearchResult:
+    """Test cases for SearchResult and FileMatch dataclasses."""
+    
+    def test_search_models_use_slots(self):
+        """Test search and directory results have no instance __dict__ and still pickle."""
+        match = FileMatch("a.py", 3, "x = 1", ["# before"], [])
+        result = SearchResult([match], 1, 0.01, "x", "content", [])
+        analysis = DirectoryAnalysis("d", 1, {".py": 1}, 5, {"python": 1}, None, 0.01, [])
+        
+        for obj in (match, result, analysis):
+            assert not hasattr(obj, "__dict__")
+            assert pickle.loads(pickle.dumps(obj)) == obj
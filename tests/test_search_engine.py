@@ -0,0 +1,192 @@
+"""
+Unit tests for search engine operations.
+"""
+
+import os
+import re
+from pathlib import Path
+
+from file_analyzer_mcp.search_engine import SearchEngine
+
+
+class TestSearchEngine:
+    """Test cases for SearchEngine."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = SearchEngine()
+    
+    def test_split_literal_prefix(self):
+        """Test splitting glob patterns at the first wildcard component."""
+        assert self.engine._split_literal_prefix("src/pkg/**/*.py") == ("src/pkg", "**/*.py")
+        assert self.engine._split_literal_prefix("*.py") == ("", "*.py")
+        assert self.engine._split_literal_prefix("src/main.py") == ("src/main.py", "")
+    
+    def test_search_by_glob_with_literal_prefix(self, tmp_path):
+        """Test glob search scoped to a literal directory prefix."""
+        (tmp_path / "src" / "deep").mkdir(parents=True)
+        (tmp_path / "other").mkdir()
+        (tmp_path / "src" / "deep" / "a.py").write_text("x = 1\n")
+        (tmp_path / "other" / "b.py").write_text("y = 2\n")
+        
+        matches = self.engine.search_by_glob("src/**/*.py", str(tmp_path))
+        assert [m.file_path for m in matches] == [str(tmp_path / "src" / "deep" / "a.py")]
+        
+        assert self.engine.search_by_glob("missing/*.py", str(tmp_path)) == []
+        literal = self.engine.search_by_glob("other/b.py", str(tmp_path))
+        assert [m.file_path for m in literal] == [str(tmp_path / "other" / "b.py")]
+    
+    def test_recursive_glob_matches_path_glob(self, tmp_path):
+        """Test '**/<name>' globs return the files Path.glob would."""
+        (tmp_path / "pkg" / ".hidden").mkdir(parents=True)
+        (tmp_path / "top.py").write_text("")
+        (tmp_path / ".dot.py").write_text("")
+        (tmp_path / "pkg" / "mid.py").write_text("")
+        (tmp_path / "pkg" / "mid.txt").write_text("")
+        (tmp_path / "pkg" / ".hidden" / "deep.py").write_text("")
+        (tmp_path / "link").symlink_to(tmp_path / "pkg", target_is_directory=True)
+        
+        matches = self.engine.search_by_glob("**/*.py", str(tmp_path))
+        # Dot-files included, symlinked directory not followed
+        assert sorted(m.file_path for m in matches) == sorted([
+            str(tmp_path / "top.py"),
+            str(tmp_path / ".dot.py"),
+            str(tmp_path / "pkg" / "mid.py"),
+            str(tmp_path / "pkg" / ".hidden" / "deep.py"),
+        ])
+        
+        self.engine.max_total_matches = 2
+        assert len(self.engine.search_by_glob("**/*.py", str(tmp_path))) == 2
+    
+    def test_search_by_regex_walks_tree_top_down(self, tmp_path):
+        """Test regex search visits a directory's files before its subdirectories."""
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "test_top.py").write_text("")
+        (tmp_path / "pkg" / "sub" / "test_deep.py").write_text("")
+        (tmp_path / "pkg" / "test_mid.txt").write_text("")
+        
+        matches = self.engine.search_by_regex(r"^test_", str(tmp_path))
+        assert [m.file_path for m in matches] == [
+            str(tmp_path / "test_top.py"),
+            str(tmp_path / "pkg" / "test_mid.txt"),
+            str(tmp_path / "pkg" / "sub" / "test_deep.py"),
+        ]
+        
+        filtered = self.engine.search_by_regex(r"^test_", str(tmp_path), [".txt"])
+        assert [m.content for m in filtered] == ["File: test_mid.txt"]
+    
+    def test_searches_skip_noise_directories(self, tmp_path):
+        """Test regex and content searches do not descend into skipped directories."""
+        (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.js").write_text("needle\n")
+        (tmp_path / "node_modules" / "dep" / "index.js").write_text("needle\n")
+        
+        matches = self.engine.search_content("needle", str(tmp_path))
+        assert [m.file_path for m in matches] == [str(tmp_path / "src" / "app.js")]
+        assert len(self.engine.search_by_regex(r"\.js$", str(tmp_path))) == 1
+        
+        # Searching inside a skipped directory by name still works
+        inside = self.engine.search_content("needle", str(tmp_path / "node_modules"))
+        assert len(inside) == 1
+        
+        self.engine.skip_dirs = frozenset()
+        assert len(self.engine.search_content("needle", str(tmp_path))) == 2
+    
+    def test_search_content_skips_binary_files(self, tmp_path):
+        """Test content search reads text files and skips binary ones."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.py").write_text("x = 1\nneedle = 2\n")
+        (tmp_path / "blob.dat").write_bytes(b"needle\x00\x01")
+        (tmp_path / "image.png").write_text("needle")
+        
+        matches = self.engine.search_content("NEEDLE", str(tmp_path))
+        assert [(m.file_path, m.line_number) for m in matches] == [(str(tmp_path / "sub" / "a.py"), 2)]
+        assert self.engine.search_content("needle", str(tmp_path), [".txt"]) == []
+    
+    def test_search_file_content_context_at_file_edges(self, tmp_path):
+        """Test context lines are clipped at the start and end of the file."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("hit one\n  b\nc\nd\ne\n\nhit two\n")
+        pattern = re.compile("hit")
+        
+        first, second = self.engine._search_file_content(file_path, pattern)
+        assert (first.line_number, first.content) == (1, "hit one")
+        assert (first.context_before, first.context_after) == ([], ["b", "c", "d"])
+        assert (second.line_number, second.context_before) == (7, ["d", "e", ""])
+        assert second.context_after == [""]
+    
+    def test_find_lowered_across_block_boundaries(self):
+        """Test case-insensitive literal hits are found in order across blocks."""
+        content = "xxABaBxAb"
+        hits = list(SearchEngine._find_lowered(content, "ab", block_size=3))
+        assert hits == [m.start() for m in re.finditer("(?=ab)", content, re.IGNORECASE)]
+    
+    def test_parallel_content_search_matches_serial_order(self, tmp_path):
+        """Test pooled content search returns the serial results in walk order."""
+        for index in range(40):
+            (tmp_path / f"d{index % 4}").mkdir(exist_ok=True)
+            (tmp_path / f"d{index % 4}" / f"f{index}.txt").write_text("hit\n" * (index % 3))
+        
+        self.engine.max_workers = 1
+        serial = self.engine.search_content("hit", str(tmp_path))
+        self.engine.max_workers = 4
+        self.engine.max_total_matches = 25
+        parallel = self.engine.search_content("hit", str(tmp_path))
+        
+        key = [(m.file_path, m.line_number) for m in serial]
+        assert [(m.file_path, m.line_number) for m in parallel] == key[:len(parallel)]
+        assert len(parallel) >= 25
+    
+    def test_filter_by_extensions(self):
+        """Test files are kept when their name ends with any listed suffix."""
+        files = [Path("a.py"), Path("b.spec.ts"), Path("c.txt"), Path("py")]
+        assert self.engine.filter_by_extensions(files, [".py", ".spec.ts"]) == files[:2]
+        assert self.engine.filter_by_extensions(files, []) == files
+    
+    def test_directory_listing_cache_follows_mtime(self, tmp_path):
+        """Test cached listings are reused until the directory changes."""
+        (tmp_path / "a.py").write_text("")
+        os.utime(tmp_path, ns=(10**18, 10**18))
+        
+        assert [m.content for m in self.engine.search_by_regex(r"\.py$", str(tmp_path))] == ["File: a.py"]
+        assert str(tmp_path) in self.engine._listing_cache
+        
+        (tmp_path / "b.py").write_text("")
+        matches = self.engine.search_by_regex(r"\.py$", str(tmp_path))
+        assert sorted(m.content for m in matches) == ["File: a.py", "File: b.py"]
+        # Freshly modified directories are not cached
+        assert str(tmp_path) not in self.engine._listing_cache
+        
+        self.engine.clear_cache()
+        assert not self.engine._listing_cache
+    
+    def test_content_matches_cached_until_file_changes(self, tmp_path):
+        """Test repeat content searches reuse per-file matches until the file changes."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("hit\n")
+        
+        # A just-written file is inside the racy-mtime window: not cached
+        self.engine.search_content("hit", str(tmp_path))
+        assert len(self.engine._match_cache) == 0
+        
+        os.utime(file_path, (1_000_000_000, 1_000_000_000))
+        first = self.engine.search_content("hit", str(tmp_path))
+        first[0].context_after.append("mutated")
+        assert len(self.engine._match_cache) == 1
+        
+        second = self.engine.search_content("hit", str(tmp_path))
+        assert second[0].context_after == [""]
+        
+        file_path.write_text("miss\nhit here\n")
+        third = self.engine.search_content("hit", str(tmp_path))
+        assert [(m.line_number, m.content) for m in third] == [(2, "hit here")]
+        
+        # A same-size rewrite that keeps the mtime is only safe because the
+        # racy entry above was never stored
+        file_path.write_text("miss\nhot here\n")
+        assert self.engine.search_content("hot", str(tmp_path))[0].line_number == 2
+        stat_info = os.stat(file_path)
+        file_path.write_text("miss\nhut here\n")
+        os.utime(file_path, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns))
+        assert self.engine.search_content("hot", str(tmp_path)) == []
@@ -4,6 +4,8 @@ Unit tests for MCP server functionality.
 
 import pytest
 import asyncio
+import json
+from types import SimpleNamespace
 from file_analyzer_mcp.server import FileAnalyzerMCPServer
 from mcp.types import InitializeRequest, CallToolRequest
 
@@ -35,7 +37,78 @@ class TestFileAnalyzerMCPServer:
         assert isinstance(tools, list)
         # Should have 3 tools: analyze_file, analyze_directory, search_files
         assert len(tools) == 3
-        tool_names = [tool.name for tool in tools]
-        assert "analyze_file" in tool_names
-        assert "analyze_directory" in tool_names
-        assert "search_files" in tool_names
\ No newline at end of file
+        tool_names = {tool.name for tool in tools}
+        expected = {"analyze_file", "analyze_directory", "search_files"}
+        assert expected <= tool_names, f"missing: {expected - tool_names}"
+    
+    @pytest.mark.asyncio
+    async def test_handle_list_tools_reuses_definitions(self):
+        """Test list_tools hands out the prebuilt tools in a fresh list."""
+        first = await self.server.handle_list_tools()
+        first.clear()
+        second = await self.server.handle_list_tools()
+        third = await self.server.handle_list_tools()
+        
+        assert len(second) == 3
+        assert second is not third
+        assert all(a is b for a, b in zip(second, third))
+    
+    @pytest.mark.asyncio
+    async def test_handle_call_tool_dispatches_by_name(self, tmp_path):
+        """Test call_tool routes known tools and reports unknown ones."""
+        file_path = tmp_path / "sample.py"
+        file_path.write_text("x = 1\n")
+        
+        request = SimpleNamespace(name="analyze_file", arguments={"file_path": str(file_path)})
+        result = await self.server.handle_call_tool(request)
+        assert json.loads(result[0].text)["language"] == "python"
+        
+        request = SimpleNamespace(name="delete_file", arguments={})
+        result = await self.server.handle_call_tool(request)
+        assert result[0].text == "Unknown tool: delete_file"
+    
+    @pytest.mark.asyncio
+    async def test_handle_analyze_file_returns_json(self, tmp_path):
+        """Test analyze_file responses are valid JSON."""
+        file_path = tmp_path / "sample.py"
+        file_path.write_text("def f():\n    return 'café'\n")
+        
+        request = SimpleNamespace(arguments={"file_path": str(file_path)})
+        result = await self.server.handle_analyze_file(request)
+        data = json.loads(result[0].text)
+        
+        assert data["language"] == "python"
+        assert data["line_count"] == 2
+        assert data["metrics"]["function_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_handle_analyze_directory_returns_json(self, tmp_path):
+        """Test analyze_directory responses are valid JSON with the directory totals."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.js").write_text("let y = 2;\n")
+        
+        request = SimpleNamespace(arguments={"directory_path": str(tmp_path), "recursive": False})
+        result = await self.server.handle_analyze_directory(request)
+        data = json.loads(result[0].text)
+        
+        assert data["total_files"] == 2
+        assert data["languages"] == {"python": 1, "javascript": 1}
+        assert data["errors"] == []
+        
+        request = SimpleNamespace(arguments={})
+        result = await self.server.handle_analyze_directory(request)
+        assert result[0].text == "Error: directory_path parameter is required"
+    
+    @pytest.mark.asyncio
+    async def test_handle_search_files_returns_json(self, tmp_path, monkeypatch):
+        """Test search_files responses are valid JSON with every match field."""
+        (tmp_path / "a.py").write_text("x = 'café'\n")
+        monkeypatch.chdir(tmp_path)
+        
+        request = SimpleNamespace(arguments={"pattern": "café", "search_type": "content"})
+        result = await self.server.handle_search_files(request)
+        data = json.loads(result[0].text)
+        
+        assert data["total_matches"] == 1
+        assert data["matches"][0]["content"] == "x = 'café'"
+        assert data["matches"][0]["context_before"] == []